@@ -54,6 +54,11 @@ global_configs_to_display = ["autofill_import",
                              "global_token",
                              "global_token_symbol",
                              "rate_limits_share_pct",
+                             "sliding_window_throttler_enabled",
+                             "order_book_sharing_enabled",
+                             "order_book_feed_process_enabled",
+                             "order_book_feed_process_depth",
+                             "order_book_recording_enabled",
                              "create_command_timeout",
                              "other_commands_timeout",
                              "tables_format"]
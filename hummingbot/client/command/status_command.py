@@ -11,7 +11,9 @@ from hummingbot.client.config.config_helpers import get_strategy_config_map, mis
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
+from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.application_warning import ApplicationWarning
@@ -63,6 +65,41 @@ class StatusCommand:
 
         return "\n".join(lines)
 
+    def _format_rate_limits_status(self,  # type: HummingbotApplication
+                                   ) -> str:
+        """
+        Lists the most used rate limits of the connectors, with the wait times and exchange rejections of their requests
+        """
+        rows = []
+        for connector_name, connector in self.markets.items():
+            throttler = getattr(connector, "_throttler", None)
+            if not isinstance(throttler, AsyncThrottlerBase):
+                continue
+            for usage in throttler.limit_usage():
+                if usage.executed_tasks == 0 and usage.waiting_tasks == 0 and usage.rejections == 0:
+                    continue
+                rows.append([
+                    connector_name,
+                    usage.limit_id,
+                    f"{usage.capacity_used}/{usage.limit} per {usage.time_interval:g}s",
+                    usage.utilization,
+                    usage.waiting_tasks,
+                    f"{usage.average_wait_time * 1e3:.0f}",
+                    f"{usage.wait_time_percentile(0.99) * 1e3:g}",
+                    f"{usage.max_wait_time * 1e3:.0f}",
+                    usage.rejections,
+                ])
+        if len(rows) == 0:
+            return ""
+        rows.sort(key=lambda row: (-row[8], -row[3]))
+        df = pd.DataFrame(data=rows[:self.RATE_LIMITS_STATUS_LIMIT],
+                          columns=["Exchange", "Limit", "Used", "Utilization", "Waiting", "Avg wait (ms)",
+                                   "p99 wait (ms)", "Max wait (ms)", "Rejections"])
+        df["Utilization"] = df["Utilization"].map(lambda utilization: f"{utilization:.0%}")
+        lines = ["", "  Rate limits:"]
+        lines.extend(["    " + line for line in format_df_for_printout(df).split("\n")])
+        return "\n".join(lines)
+
     async def strategy_status(self, live: bool = False):
         active_paper_exchanges = [exchange for exchange in self.markets.keys() if exchange.endswith("paper_trade")]
 
@@ -74,7 +111,9 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status + "\n" + app_warning
+        rate_limits_status = self._format_rate_limits_status()
+        rate_limits_status = rate_limits_status + "\n" if rate_limits_status else ""
+        status = paper_trade + "\n" + st_status + "\n" + rate_limits_status + app_warning
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
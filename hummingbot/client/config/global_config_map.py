@@ -7,7 +7,7 @@ from typing import Callable, Dict, Optional
 from tabulate import tabulate_formats
 
 from hummingbot.client.config.config_methods import using_exchange as using_exchange_pointer
-from hummingbot.client.config.config_validators import validate_bool, validate_decimal
+from hummingbot.client.config.config_validators import validate_bool, validate_decimal, validate_int
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.settings import DEFAULT_KEY_FILE_PATH, DEFAULT_LOG_FILE_PATH, AllConnectorSettings
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
@@ -294,6 +294,47 @@ main_config_map = {
                   validator=lambda v: validate_decimal(v, 1, 100, inclusive=True),
                   required_if=lambda: False,
                   default=Decimal("100")),
+    "sliding_window_throttler_enabled":
+        ConfigVar(key="sliding_window_throttler_enabled",
+                  prompt="Would you like the exchange connectors to throttle their requests with the sliding window "
+                         "throttler, which serves the waiting requests by priority? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool,
+                  required_if=lambda: False),
+    "order_book_sharing_enabled":
+        ConfigVar(key="order_book_sharing_enabled",
+                  prompt="Would you like the connectors of the same exchange to share their order books and "
+                         "exchange feed? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool,
+                  required_if=lambda: False),
+    "order_book_feed_process_enabled":
+        ConfigVar(key="order_book_feed_process_enabled",
+                  prompt="Would you like to track the exchange order books in separate processes? The order books "
+                         "of this process keep only the top order_book_feed_process_depth levels, and the feed "
+                         "processes request their snapshots outside of this process's API rate limits. (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool,
+                  required_if=lambda: False),
+    "order_book_feed_process_depth":
+        ConfigVar(key="order_book_feed_process_depth",
+                  prompt="How many levels per side of the order books tracked in separate processes would you like "
+                         "to keep? >>> ",
+                  type_str="int",
+                  default=20,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  required_if=lambda: False),
+    "order_book_recording_enabled":
+        ConfigVar(key="order_book_recording_enabled",
+                  prompt="Would you like to record the exchange order book messages to the data folder, to replay "
+                         "them later? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool,
+                  required_if=lambda: False),
     "create_command_timeout":
         ConfigVar(key="create_command_timeout",
                   prompt="Network timeout when fetching the minimum order amount"
@@ -42,6 +42,7 @@ class HummingbotApplication(*commands):
     KILL_TIMEOUT = 10.0
     APP_WARNING_EXPIRY_DURATION = 3600.0
     APP_WARNING_STATUS_LIMIT = 6
+    RATE_LIMITS_STATUS_LIMIT = 10
 
     _main_app: Optional["HummingbotApplication"] = None
 
@@ -110,7 +110,8 @@ class CoinflexPerpetualDerivative(ExchangeBase, PerpetualTrading):
                 throttler=self._throttler,
                 api_factory=self._api_factory),
             trading_pairs=self._trading_pairs,
-            domain=self._domain)
+            domain=self._domain,
+            throttler=self._throttler)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
         self._next_funding_fee_timestamp = self.get_next_funding_timestamp()
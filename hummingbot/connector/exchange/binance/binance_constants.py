@@ -49,6 +49,12 @@ ONE_DAY = 86400
 
 MAX_REQUEST = 5000
 
+# Response headers with the capacity used in the rate limit pools, as counted by the exchange
+RATE_LIMIT_HEADERS = {
+    "X-MBX-USED-WEIGHT-1M": REQUEST_WEIGHT,
+    "X-MBX-ORDER-COUNT-1D": ORDERS_24HR,
+}
+
 # Order States
 ORDER_STATE = {
     "PENDING": OrderState.PENDING_CREATE,
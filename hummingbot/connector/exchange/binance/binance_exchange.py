@@ -16,6 +16,7 @@ from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -172,7 +173,8 @@ class BinanceExchange(ExchangePyBase):
         order_result = await self._api_post(
             path_url=CONSTANTS.ORDER_PATH_URL,
             data=api_params,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.CREATE)
         o_id = str(order_result["orderId"])
         transact_time = order_result["transactTime"] * 1e-3
         return (o_id, transact_time)
@@ -186,7 +188,8 @@ class BinanceExchange(ExchangePyBase):
         cancel_result = await self._api_delete(
             path_url=CONSTANTS.ORDER_PATH_URL,
             params=api_params,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.CANCEL)
         if cancel_result.get("status") == "CANCELED":
             return True
         return False
@@ -469,7 +472,8 @@ class BinanceExchange(ExchangePyBase):
 
         account_info = await self._api_get(
             path_url=CONSTANTS.ACCOUNTS_PATH_URL,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.HOUSEKEEPING)
 
         balances = account_info["balances"]
         for balance_entry in balances:
@@ -500,7 +504,8 @@ class BinanceExchange(ExchangePyBase):
         resp_json = await self._api_request(
             method=RESTMethod.GET,
             path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL,
-            params=params
+            params=params,
+            priority=RequestPriority.HOUSEKEEPING
         )
 
         return float(resp_json["lastPrice"])
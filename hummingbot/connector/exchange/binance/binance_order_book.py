@@ -3,6 +3,7 @@ from typing import Dict, Optional
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import (
+    OrderBookDiffMessage,
     OrderBookMessage,
     OrderBookMessageType
 )
@@ -35,7 +36,7 @@ class BinanceOrderBook(OrderBook):
     def diff_message_from_exchange(cls,
                                    msg: Dict[str, any],
                                    timestamp: Optional[float] = None,
-                                   metadata: Optional[Dict] = None) -> OrderBookMessage:
+                                   metadata: Optional[Dict] = None) -> OrderBookDiffMessage:
         """
         Creates a diff message with the changes in the order book received from the exchange
         :param msg: the changes in the order book
@@ -45,13 +46,13 @@ class BinanceOrderBook(OrderBook):
         """
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
-            "trading_pair": msg["trading_pair"],
-            "first_update_id": msg["U"],
-            "update_id": msg["u"],
-            "bids": msg["b"],
-            "asks": msg["a"]
-        }, timestamp=timestamp)
+        return OrderBookDiffMessage(
+            trading_pair=msg["trading_pair"],
+            update_id=msg["u"],
+            bids=msg["b"],
+            asks=msg["a"],
+            timestamp=timestamp,
+            first_update_id=msg["U"])
 
     @classmethod
     def trade_message_from_exchange(cls, msg: Dict[str, any], metadata: Optional[Dict] = None):
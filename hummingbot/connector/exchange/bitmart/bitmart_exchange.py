@@ -17,6 +17,7 @@ from hummingbot.connector.exchange.bitmart.bitmart_auth import BitmartAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -174,7 +175,8 @@ class BitmartExchange(ExchangePyBase):
         order_result = await self._api_post(
             path_url=CONSTANTS.CREATE_ORDER_PATH_URL,
             data=api_params,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.CREATE)
         exchange_order_id = str(order_result["data"]["order_id"])
 
         return exchange_order_id, self.current_timestamp
@@ -186,7 +188,8 @@ class BitmartExchange(ExchangePyBase):
         cancel_result = await self._api_post(
             path_url=CONSTANTS.CANCEL_ORDER_PATH_URL,
             data=api_params,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.CANCEL)
         return cancel_result.get("data", {}).get("result", False)
 
     async def _format_trading_rules(self, symbols_details: Dict[str, Any]) -> List[TradingRule]:
@@ -252,7 +255,8 @@ class BitmartExchange(ExchangePyBase):
         remote_asset_names = set()
         account_info = await self._api_get(
             path_url=CONSTANTS.GET_ACCOUNT_SUMMARY_PATH_URL,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.HOUSEKEEPING)
         for account in account_info["data"]["wallet"]:
             asset_name = account["id"]
             self._account_available_balances[asset_name] = Decimal(str(account["available"]))
@@ -414,7 +418,8 @@ class BitmartExchange(ExchangePyBase):
 
         resp_json = await self._api_get(
             path_url=CONSTANTS.GET_LAST_TRADING_PRICES_PATH_URL,
-            params=params
+            params=params,
+            priority=RequestPriority.HOUSEKEEPING
         )
 
         return float(resp_json["data"]["tickers"][0]["last_price"])
@@ -70,7 +70,8 @@ class BybitExchange(ExchangeBase):
                 api_factory=self._api_factory,
                 throttler=self._throttler),
             trading_pairs=trading_pairs,
-            domain=self._domain)
+            domain=self._domain,
+            throttler=self._throttler)
         self._user_stream_tracker = UserStreamTracker(
             data_source=BybitAPIUserStreamDataSource(
                 auth=self._auth,
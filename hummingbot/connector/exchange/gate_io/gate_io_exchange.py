@@ -12,6 +12,7 @@ from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -191,6 +192,7 @@ class GateIoExchange(ExchangePyBase):
             data=data,
             is_auth_required=True,
             limit_id=endpoint,
+            priority=RequestPriority.CREATE,
         )
         if order_result.get("status") in {"cancelled"}:
             raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
@@ -212,6 +214,7 @@ class GateIoExchange(ExchangePyBase):
             params=params,
             is_auth_required=True,
             limit_id=CONSTANTS.ORDER_DELETE_LIMIT_ID,
+            priority=RequestPriority.CANCEL,
         )
         canceled = resp.get("status") == "cancelled"
         return canceled
@@ -225,7 +228,8 @@ class GateIoExchange(ExchangePyBase):
             account_info = await self._api_get(
                 path_url=CONSTANTS.USER_BALANCES_PATH_URL,
                 is_auth_required=True,
-                limit_id=CONSTANTS.USER_BALANCES_PATH_URL
+                limit_id=CONSTANTS.USER_BALANCES_PATH_URL,
+                priority=RequestPriority.HOUSEKEEPING
             )
             self._process_balance_message(account_info)
         except Exception as e:
@@ -480,7 +484,8 @@ class GateIoExchange(ExchangePyBase):
         resp_json = await self._api_request(
             method=RESTMethod.GET,
             path_url=CONSTANTS.TICKER_PATH_URL,
-            params=params
+            params=params,
+            priority=RequestPriority.HOUSEKEEPING
         )
 
         return float(resp_json[0]["last"])
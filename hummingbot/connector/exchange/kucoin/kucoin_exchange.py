@@ -16,6 +16,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -187,6 +188,7 @@ class KucoinExchange(ExchangePyBase):
             data=data,
             is_auth_required=True,
             limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+            priority=RequestPriority.CREATE,
         )
         return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
 
@@ -198,7 +200,8 @@ class KucoinExchange(ExchangePyBase):
         cancel_result = await self._api_delete(
             f"{CONSTANTS.ORDERS_PATH_URL}/{exchange_order_id}",
             is_auth_required=True,
-            limit_id=CONSTANTS.DELETE_ORDER_LIMIT_ID
+            limit_id=CONSTANTS.DELETE_ORDER_LIMIT_ID,
+            priority=RequestPriority.CANCEL
         )
         if tracked_order.exchange_order_id in cancel_result["data"].get("cancelledOrderIds", []):
             return True
@@ -291,7 +294,8 @@ class KucoinExchange(ExchangePyBase):
         response = await self._api_get(
             path_url=CONSTANTS.ACCOUNTS_PATH_URL,
             params={"type": "trade"},
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.HOUSEKEEPING)
 
         if response:
             for balance_entry in response["data"]:
@@ -333,6 +337,7 @@ class KucoinExchange(ExchangePyBase):
             path_url=CONSTANTS.FEE_PATH_URL,
             params=params,
             is_auth_required=True,
+            priority=RequestPriority.HOUSEKEEPING,
         )
         fees_json = resp["data"]
         for fee_json in fees_json:
@@ -410,7 +415,8 @@ class KucoinExchange(ExchangePyBase):
         resp_json = await self._api_request(
             path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL,
             method=RESTMethod.GET,
-            params=params
+            params=params,
+            priority=RequestPriority.HOUSEKEEPING
         )
 
         return float(resp_json["data"]["price"])
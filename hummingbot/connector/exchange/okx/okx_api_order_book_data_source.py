@@ -1,8 +1,11 @@
 import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.connector.exchange.okx import okx_constants as CONSTANTS, okx_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest, WSPlainTextRequest
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 
 
 class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    # The books channel checksum covers the best 25 levels of each side
+    ORDER_BOOK_CHECKSUM_DEPTH = 25
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -40,8 +45,8 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         order_book_message_content = {
             "trading_pair": trading_pair,
             "update_id": update_id,
-            "bids": [(bid[0], bid[3]) for bid in snapshot_data["bids"]],
-            "asks": [(ask[0], ask[3]) for ask in snapshot_data["asks"]],
+            "bids": [(bid[0], bid[1]) for bid in snapshot_data["bids"]],
+            "asks": [(ask[0], ask[1]) for ask in snapshot_data["asks"]],
         }
         snapshot_msg: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
@@ -105,9 +110,11 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             order_book_message_content = {
                 "trading_pair": trading_pair,
                 "update_id": update_id,
-                "bids": [(bid[0], bid[3]) for bid in diff_data["bids"]],
-                "asks": [(ask[0], ask[3]) for ask in diff_data["asks"]],
+                "bids": [(bid[0], bid[1]) for bid in diff_data["bids"]],
+                "asks": [(ask[0], ask[1]) for ask in diff_data["asks"]],
             }
+            if "checksum" in diff_data:
+                order_book_message_content["checksum"] = diff_data["checksum"]
             diff_message: OrderBookMessage = OrderBookMessage(
                 OrderBookMessageType.DIFF,
                 order_book_message_content,
@@ -115,6 +122,15 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             message_queue.put_nowait(diff_message)
 
+    def _order_book_checksum(self, order_book: OrderBook) -> int:
+        # OKX interleaves the bid and ask levels starting with the best bid, with prices and sizes formatted the way
+        # they are sent in the books channel (no trailing zeros nor exponents)
+        return order_book.checksum(depth=self.ORDER_BOOK_CHECKSUM_DEPTH, level_format=self._checksum_level_format)
+
+    @staticmethod
+    def _checksum_level_format(price: float, amount: float) -> str:
+        return f"{np.format_float_positional(price, trim='-')}:{np.format_float_positional(amount, trim='-')}"
+
     async def _subscribe_channels(self, ws: WSAssistant):
         try:
             for trading_pair in self._trading_pairs:
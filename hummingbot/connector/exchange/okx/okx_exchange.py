@@ -12,6 +12,7 @@ from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -142,6 +143,7 @@ class OkxExchange(ExchangePyBase):
             exchange_info = await self._api_get(
                 path_url=self.trading_pairs_request_path,
                 params={"instType": "SPOT"},
+                priority=RequestPriority.HOUSEKEEPING,
             )
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         except Exception:
@@ -177,6 +179,7 @@ class OkxExchange(ExchangePyBase):
             data=data,
             is_auth_required=True,
             limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            priority=RequestPriority.CREATE,
         )
         data = exchange_order_id["data"][0]
         if data["sCode"] != "0":
@@ -195,6 +198,7 @@ class OkxExchange(ExchangePyBase):
             path_url=CONSTANTS.OKX_ORDER_CANCEL_PATH,
             data=params,
             is_auth_required=True,
+            priority=RequestPriority.CANCEL,
         )
         if cancel_result["data"][0]["sCode"] == "0":
             final_result = True
@@ -212,6 +216,7 @@ class OkxExchange(ExchangePyBase):
         resp_json = await self._api_request(
             path_url=CONSTANTS.OKX_TICKER_PATH,
             params=params,
+            priority=RequestPriority.HOUSEKEEPING,
         )
 
         ticker_data, *_ = resp_json["data"]
@@ -220,7 +225,8 @@ class OkxExchange(ExchangePyBase):
     async def _update_balances(self):
         msg = await self._api_request(
             path_url=CONSTANTS.OKX_BALANCE_PATH,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.HOUSEKEEPING)
 
         if msg['code'] == '0':
             balances = msg['data'][0]['details']
@@ -251,6 +257,7 @@ class OkxExchange(ExchangePyBase):
         exchange_info = await self._api_get(
             path_url=self.trading_rules_request_path,
             params={"instType": "SPOT"},
+            priority=RequestPriority.HOUSEKEEPING,
         )
         trading_rules_list = await self._format_trading_rules(exchange_info)
         self._trading_rules.clear()
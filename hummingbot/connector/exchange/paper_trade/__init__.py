@@ -4,6 +4,7 @@ from hummingbot.client.config.config_helpers import get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_registry import SharedOrderBookTracker
 
 
 def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> OrderBookTracker:
@@ -11,7 +12,11 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
     try:
         connector_instance = conn_setting.non_trading_connector_instance_with_default_configuration(
             trading_pairs=trading_pairs)
-        return connector_instance.order_book_tracker
+        tracker = connector_instance.order_book_tracker
+        if isinstance(tracker, SharedOrderBookTracker):
+            # The paper trade order books record the simulated fills, so they can't be shared with other connectors
+            tracker = connector_instance.create_order_book_tracker(trading_pairs)
+        return tracker
     except Exception as exception:
         raise Exception(f"Connector {connector_name} OrderBookTracker class not found ({exception})")
 
@@ -1,7 +1,8 @@
 import asyncio
 from decimal import Decimal
-from typing import Dict, List, Iterator, Mapping, Optional
+from typing import Dict, List, Iterator, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 from bidict import bidict
 
 from hummingbot.connector.budget_checker import BudgetChecker
@@ -57,6 +58,32 @@ cdef class ExchangeBase(ConnectorBase):
     def order_book_tracker(self) -> Optional[OrderBookTracker]:
         return self._order_book_tracker
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs the connector can be used on, while the order books of the other trading pairs are still
+        initializing
+        """
+        if self._order_book_tracker is None or not self._components_ready_except_order_books():
+            return []
+        return self._order_book_tracker.ready_trading_pairs
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates whether the connector can be used on the trading pair, which is the case once all the connector's
+        components are ready and the order book of the trading pair is initialized, even if the other order books are
+        still initializing.
+
+        :param trading_pair: the trading pair to check
+        """
+        if self._order_book_tracker is None:
+            return self.ready
+        return (self._components_ready_except_order_books()
+                and self._order_book_tracker.is_order_book_ready(trading_pair))
+
+    def _components_ready_except_order_books(self) -> bool:
+        return all(ready for component, ready in self.status_dict.items() if component != "order_books_initialized")
+
     async def trading_pair_symbol_map(self):
         if not self.trading_pair_symbol_map_ready():
             async with self._mapping_initialization_lock:
@@ -173,6 +200,14 @@ cdef class ExchangeBase(ConnectorBase):
                                           result_price,
                                           result_volume)
 
+    cdef tuple c_get_prices_and_vwaps_for_volumes(self, str trading_pair, bint is_buy, list volumes):
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            tuple results = order_book.c_get_prices_and_vwaps_for_volumes(
+                is_buy, np.asarray(volumes, dtype="float64"))
+        return ([self.c_quantize_order_price(trading_pair, Decimal(price)) for price in results[0]],
+                [self.c_quantize_order_price(trading_pair, Decimal(vwap)) for vwap in results[1]])
+
     cdef ClientOrderBookQueryResult c_get_price_for_quote_volume(self, str trading_pair, bint is_buy, double volume):
         cdef:
             OrderBook order_book = self.c_get_order_book(trading_pair)
@@ -224,7 +259,7 @@ cdef class ExchangeBase(ConnectorBase):
     cdef ClientOrderBookQueryResult c_get_quote_volume_for_price(self, str trading_pair, bint is_buy, object price):
         cdef:
             OrderBook order_book = self.c_get_order_book(trading_pair)
-            OrderBookQueryResult result = order_book.c_get_volume_for_price(is_buy, float(price))
+            OrderBookQueryResult result = order_book.c_get_quote_volume_for_price(is_buy, float(price))
             object query_price = self.c_quantize_order_price(trading_pair, Decimal(result.query_price))
             object result_price = self.c_quantize_order_price(trading_pair, Decimal(result.result_price))
             object result_volume = self.c_quantize_order_amount(trading_pair, Decimal(result.result_volume))
@@ -255,6 +290,22 @@ cdef class ExchangeBase(ConnectorBase):
     def get_price_for_volume(self, trading_pair: str, is_buy: bool, volume: Decimal):
         return self.c_get_price_for_volume(trading_pair, is_buy, volume)
 
+    def get_prices_and_vwaps_for_volumes(self,
+                                         trading_pair: str,
+                                         is_buy: bool,
+                                         volumes: List[Decimal]) -> Tuple[List[Decimal], List[Decimal]]:
+        """
+        Queries the fill price and VWAP of several volumes, e.g. the order levels of a strategy, in a single sweep of
+        the order book.
+
+        :param trading_pair: the trading pair of the order book
+        :param is_buy: True to query the ask side, False to query the bid side
+        :param volumes: the base volumes, sorted in ascending order
+        :return: the price of the last level needed to fill each volume and the VWAP of each volume, NaN for the
+        volumes larger than the side of the book
+        """
+        return self.c_get_prices_and_vwaps_for_volumes(trading_pair, is_buy, list(volumes))
+
     def get_quote_volume_for_base_amount(self, trading_pair: str, is_buy: bool,
                                          base_amount: Decimal) -> ClientOrderBookQueryResult:
         return self.c_get_quote_volume_for_base_amount(trading_pair, is_buy, base_amount)
@@ -265,6 +316,25 @@ cdef class ExchangeBase(ConnectorBase):
     def get_quote_volume_for_price(self, trading_pair: str, is_buy: bool, price: Decimal) -> ClientOrderBookQueryResult:
         return self.c_get_quote_volume_for_price(trading_pair, is_buy, price)
 
+    def get_volumes_for_prices(self,
+                               trading_pair: str,
+                               is_buy: bool,
+                               prices: Sequence[Decimal],
+                               quote_volume: bool = False) -> np.ndarray:
+        """
+        Queries the order book volume available up to several prices in one call, e.g. to size the levels of an
+        order ladder.
+
+        :param trading_pair: the trading pair of the order book
+        :param is_buy: True to query the ask side, False to query the bid side
+        :param prices: the limit prices
+        :param quote_volume: if True the volumes are in quote currency, otherwise in base currency
+        :return: for each price, the cumulative volume of the levels priced at or better than it
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+        return order_book.get_volumes_for_prices(is_buy, np.asarray(prices, dtype="float64"), quote_volume)
+
     def get_price(self, trading_pair: str, is_buy: bool) -> Decimal:
         return self.c_get_price(trading_pair, is_buy)
 
@@ -1,12 +1,15 @@
 import asyncio
 import copy
+import functools
 import logging
+import os
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Any, AsyncIterable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
+from hummingbot import data_path
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
@@ -14,13 +17,19 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message_recorder import OrderBookMessageRecorder
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_registry import SharedOrderBookTracker
+from hummingbot.core.data_type.shared_memory_order_book_tracker import SharedMemoryOrderBookTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -42,6 +51,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     TICK_INTERVAL_LIMIT = 60.0
 
     def __init__(self):
+        from hummingbot.client.config.global_config_map import global_config_map  # avoids chance of circular import
+
         super().__init__()
 
         self._last_poll_timestamp = 0
@@ -56,7 +67,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_fees_polling_task = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(self.rate_limits_rules)
+        self._throttler: AsyncThrottlerBase = (
+            SlidingWindowThrottler(self.rate_limits_rules)
+            if global_config_map["sliding_window_throttler_enabled"].value
+            else AsyncThrottler(self.rate_limits_rules))
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -65,10 +79,14 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
-        self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
-            trading_pairs=self.trading_pairs,
-            domain=self.domain))
+        if global_config_map["order_book_sharing_enabled"].value:
+            self._set_order_book_tracker(SharedOrderBookTracker(
+                exchange=self.name,
+                data_source=self._orderbook_ds,
+                trading_pairs=self.trading_pairs,
+                domain=self.domain))
+        else:
+            self._set_order_book_tracker(self._create_order_book_tracker(self._orderbook_ds))
 
         # init UserStream Data Source and Tracker
         self._userstream_ds = self._create_user_stream_data_source()
@@ -650,7 +668,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         Checks connectivity with the exchange using the API
         """
         try:
-            await self._api_get(path_url=self.check_network_request_path)
+            await self._api_get(path_url=self.check_network_request_path, priority=RequestPriority.HOUSEKEEPING)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -781,7 +799,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     # === Exchange / Trading logic methods that call the API ===
 
     async def _update_trading_rules(self):
-        exchange_info = await self._api_get(path_url=self.trading_rules_request_path)
+        exchange_info = await self._api_get(path_url=self.trading_rules_request_path,
+                                            priority=RequestPriority.HOUSEKEEPING)
         trading_rules_list = await self._format_trading_rules(exchange_info)
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
@@ -811,7 +830,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                            data: Optional[Dict[str, Any]] = None,
                            is_auth_required: bool = False,
                            return_err: bool = False,
-                           limit_id: Optional[str] = None) -> Dict[str, Any]:
+                           limit_id: Optional[str] = None,
+                           priority: RequestPriority = DEFAULT_PRIORITY) -> Dict[str, Any]:
 
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
         if is_auth_required:
@@ -827,6 +847,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             is_auth_required=is_auth_required,
             return_err=return_err,
             throttler_limit_id=limit_id if limit_id else path_url,
+            priority=priority,
         )
 
     async def _status_polling_loop_fetch_updates(self):
@@ -875,6 +896,49 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
         raise NotImplementedError
 
+    def create_order_book_tracker(self, trading_pairs: List[str]) -> OrderBookTracker:
+        """
+        Creates a tracker of the trading pairs order books with a new data source, not shared with other connectors.
+        Used by the OrderBookTrackerRegistry to track the order books shared by the connectors of the exchange.
+
+        :param trading_pairs: the trading pairs to track
+        """
+        data_source = self._create_order_book_data_source()
+        data_source.trading_pairs = trading_pairs
+        return self._create_order_book_tracker(data_source)
+
+    def _create_order_book_tracker(self, data_source: OrderBookTrackerDataSource) -> OrderBookTracker:
+        """
+        Creates the tracker of the data source trading pairs order books. The order books are tracked in a feed process
+        if order_book_feed_process_enabled is set, otherwise their messages are recorded to the data folder if
+        order_book_recording_enabled is set.
+
+        :param data_source: the data source of the order books
+        """
+        from hummingbot.client.config.global_config_map import global_config_map  # avoids chance of circular import
+
+        trading_pairs = data_source.trading_pairs
+        if global_config_map["order_book_feed_process_enabled"].value:
+            from hummingbot.connector.exchange.paper_trade import get_order_book_tracker
+
+            # The feed process creates its own non trading connector to track the order books
+            return SharedMemoryOrderBookTracker(
+                data_source=data_source,
+                trading_pairs=trading_pairs,
+                tracker_factory=functools.partial(get_order_book_tracker, self.name),
+                depth=(global_config_map["order_book_feed_process_depth"].value
+                       or SharedMemoryOrderBookTracker.DEFAULT_DEPTH))
+        recorder = None
+        if global_config_map["order_book_recording_enabled"].value:
+            recorder = OrderBookMessageRecorder.get_instance(
+                os.path.join(data_path(), f"{self.name}_order_books.hbob"))
+        return OrderBookTracker(
+            data_source=data_source,
+            trading_pairs=trading_pairs,
+            domain=self.domain,
+            throttler=self._throttler,
+            recorder=recorder)
+
     @abstractmethod
     def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
         raise NotImplementedError
@@ -885,7 +949,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _initialize_trading_pair_symbol_map(self):
         try:
-            exchange_info = await self._api_get(path_url=self.trading_pairs_request_path)
+            exchange_info = await self._api_get(path_url=self.trading_pairs_request_path,
+                                                priority=RequestPriority.HOUSEKEEPING)
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
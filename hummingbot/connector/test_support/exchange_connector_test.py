@@ -11,10 +11,15 @@ from aioresponses import aioresponses
 from aioresponses.core import RequestCall
 from bidict import bidict
 
+from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_registry import SharedOrderBookTracker
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -412,6 +417,28 @@ class AbstractExchangeConnectorTests:
             supported_types = self.exchange.supported_order_types()
             self.assertEqual(self.expected_supported_order_types, supported_types)
 
+        def test_order_book_tracker_is_not_shared_by_default(self):
+            tracker = self.exchange.order_book_tracker
+
+            self.assertIsInstance(tracker, OrderBookTracker)
+            self.assertIs(self.exchange._orderbook_ds, tracker.data_source)
+            self.assertIs(self.exchange._throttler, tracker._throttler)
+
+        def test_order_book_tracker_is_shared_when_enabled(self):
+            with patch.object(global_config_map["order_book_sharing_enabled"], "value", True):
+                exchange = self.create_exchange_instance()
+
+            self.assertIsInstance(exchange.order_book_tracker, SharedOrderBookTracker)
+            self.assertIs(exchange._orderbook_ds, exchange.order_book_tracker.data_source)
+
+        def test_sliding_window_throttler_is_opt_in(self):
+            self.assertIsInstance(self.exchange._throttler, AsyncThrottler)
+
+            with patch.object(global_config_map["sliding_window_throttler_enabled"], "value", True):
+                exchange = self.create_exchange_instance()
+
+            self.assertIsInstance(exchange._throttler, SlidingWindowThrottler)
+
         def test_restore_tracking_states_only_registers_open_orders(self):
             orders = []
             orders.append(InFlightOrder(
@@ -11,7 +11,8 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce_low_res
-from hummingbot.core.web_assistant.connections.data_types import RESTRequest
+from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -104,3 +105,28 @@ class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
     async def pre_process(self, request: RESTRequest) -> RESTRequest:
         await self._synchronizer.update_server_time_if_not_initialized(time_provider=self._time_provider())
         return request
+
+
+class RateLimitHeadersRESTPostProcessor(RESTPostProcessorBase):
+    """
+    This post processor is intended to be used in those connectors whose exchange reports in the response headers the
+    capacity used in its rate limits (e.g. Binance X-MBX-USED-WEIGHT-1M). It feeds the reported usage back into the
+    throttler, so the requests of other clients sharing the same limits are accounted for.
+    """
+
+    def __init__(self, throttler: AsyncThrottlerBase, limit_id_by_header: Dict[str, str]):
+        """
+        :param throttler: the throttler of the connector
+        :param limit_id_by_header: the limit_id of the rate limit reported in each header
+        """
+        super().__init__()
+        self._throttler = throttler
+        self._limit_id_by_header = limit_id_by_header
+
+    async def post_process(self, response: RESTResponse) -> RESTResponse:
+        headers = response.headers or {}
+        for header, limit_id in self._limit_id_by_header.items():
+            value = headers.get(header)
+            if value is not None and value.isdigit():
+                self._throttler.update_capacity_used(limit_id=limit_id, capacity_used=int(value))
+        return response
@@ -4,7 +4,9 @@ import time
 
 from abc import ABC, abstractmethod
 from typing import (
+    Dict,
     List,
+    Optional,
     Tuple,
 )
 
@@ -12,6 +14,7 @@ from hummingbot.core.api_throttler.data_types import (
     RateLimit,
     TaskLog,
 )
+from hummingbot.core.api_throttler.throttler_metrics import LimitMetrics
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -40,6 +43,8 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 limit_metrics: Optional[List[LimitMetrics]] = None,
+                 reported_capacity_used: Optional[Dict[str, int]] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -48,6 +53,8 @@ class AsyncRequestContextBase(ABC):
         :param rate_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param limit_metrics: The metrics of the related rate limits, updated when the task waits and is executed
+        :param reported_capacity_used: Shared capacity used per limit_id reported by the exchange and not logged yet
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -55,6 +62,9 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._limit_metrics: List[LimitMetrics] = limit_metrics or []
+        self._reported_capacity_used: Dict[str, int] = (reported_capacity_used
+                                                        if reported_capacity_used is not None else {})
 
     def flush(self):
         """
@@ -72,14 +82,36 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def task_waiting(self):
+        for metrics in self._limit_metrics:
+            metrics.task_waiting()
+
+    def task_stopped_waiting(self):
+        for metrics in self._limit_metrics:
+            metrics.task_stopped_waiting()
+
+    def task_executed(self, wait_time: float):
+        for metrics in self._limit_metrics:
+            metrics.task_executed(wait_time)
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        start: float = time.time()
+        waiting: bool = False
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if self.within_capacity():
+                        break
+                if not waiting:
+                    waiting = True
+                    self.task_waiting()
+                await asyncio.sleep(self._retry_interval)
+        finally:
+            if waiting:
+                self.task_stopped_waiting()
+        self.task_executed(time.time() - start if waiting else 0.0)
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
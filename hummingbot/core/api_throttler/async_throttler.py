@@ -5,6 +5,7 @@ from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RequestPriority
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -26,6 +27,14 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                           for task in self._task_logs
                                           if rate_limit.limit_id == task.rate_limit.limit_id and
                                           now - task.timestamp - (task.rate_limit.time_interval * self._safety_margin_pct) <= task.rate_limit.time_interval])
+                if rate_limit.limit_id in self._reported_capacity_used:
+                    capacity_used = AsyncThrottlerBase._log_reported_capacity_used(
+                        task_logs=self._task_logs,
+                        reported_capacity_used=self._reported_capacity_used,
+                        rate_limit=rate_limit,
+                        capacity_used=capacity_used,
+                        safety_margin_pct=self._safety_margin_pct,
+                        now=now)
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
@@ -51,11 +60,12 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: RequestPriority = DEFAULT_PRIORITY) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: not used, the waiting tasks are run in the order they find capacity
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -66,4 +76,6 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            limit_metrics=self.get_related_limit_metrics(related_rate_limits),
+            reported_capacity_used=self._reported_capacity_used,
         )
@@ -2,12 +2,14 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit, RequestPriority, TaskLog
+from hummingbot.core.api_throttler.throttler_metrics import LimitMetrics, RateLimitUsage
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -56,6 +58,9 @@ class AsyncThrottlerBase(ABC):
         # List of TaskLog used to determine the API requests within a set time window.
         self._task_logs: List[TaskLog] = []
 
+        # Capacity used per limit_id reported by the exchange, logged as a task the next time the limit is checked
+        self._reported_capacity_used: Dict[str, int] = {}
+
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
@@ -63,6 +68,12 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Dictionary of limit_id to the metrics of the tasks executed against the limit
+        self._limit_metrics: Dict[str, LimitMetrics] = {
+            limit.limit_id: LimitMetrics(limit.limit_id)
+            for limit in self._rate_limits
+        }
+
     def get_related_limits(self, limit_id: str) -> Tuple[RateLimit, List[Tuple[RateLimit, int]]]:
         rate_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_id, None)
         linked_limits: List[RateLimit] = [] if rate_limit is None else rate_limit.linked_limits
@@ -76,6 +87,105 @@ class AsyncThrottlerBase(ABC):
 
         return rate_limit, related_limits
 
+    def get_related_limit_metrics(self, related_limits: List[Tuple[RateLimit, int]]) -> List[LimitMetrics]:
+        return [self._limit_metrics[limit.limit_id] for limit, _ in related_limits]
+
+    def capacity_used(self, limit_id: str) -> int:
+        """
+        Returns the weight of the tasks logged for the limit within its time interval. It scans all the task logs, so
+        it is meant for the status and metrics, not for the path of the requests.
+        """
+        rate_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_id)
+        if rate_limit is None:
+            return 0
+        now: float = time.time()
+        expiration: float = now - rate_limit.time_interval * (1 + self._safety_margin_pct)
+        capacity_used: int = sum(task.weight
+                                 for task in self._task_logs
+                                 if task.rate_limit.limit_id == limit_id and task.timestamp >= expiration)
+        return self._log_reported_capacity_used(task_logs=self._task_logs,
+                                                reported_capacity_used=self._reported_capacity_used,
+                                                rate_limit=rate_limit,
+                                                capacity_used=capacity_used,
+                                                safety_margin_pct=self._safety_margin_pct,
+                                                now=now)
+
+    @staticmethod
+    def _reported_usage_interval_end(rate_limit: RateLimit, now: float) -> float:
+        """
+        Returns the end of the exchange interval the usage reported now belongs to. Exchanges count the usage they
+        report in fixed intervals aligned to the epoch (e.g. Binance X-MBX-USED-WEIGHT-1M is reset every minute), not
+        in sliding windows.
+        """
+        return (math.floor(now / rate_limit.time_interval) + 1) * rate_limit.time_interval
+
+    @classmethod
+    def _log_reported_capacity_used(cls,
+                                    task_logs: List[TaskLog],
+                                    reported_capacity_used: Dict[str, int],
+                                    rate_limit: RateLimit,
+                                    capacity_used: int,
+                                    safety_margin_pct: float,
+                                    now: float) -> int:
+        """
+        Logs the capacity reported by the exchange for the limit beyond the capacity used by the logged tasks, as a
+        task expiring when the exchange resets its count at the end of its current interval.
+        :param task_logs: the task logs of the throttler
+        :param reported_capacity_used: the capacity used per limit_id reported by the exchange and not logged yet
+        :param rate_limit: the limit being checked
+        :param capacity_used: the weight of the tasks logged for the limit within its time interval
+        :param safety_margin_pct: the safety margin of the throttler
+        :param now: the current time
+        :return: the capacity used by the limit, including the reported capacity
+        """
+        reported: Optional[int] = reported_capacity_used.pop(rate_limit.limit_id, None)
+        if reported is None or reported <= capacity_used:
+            return capacity_used
+        # Tasks expire one time interval (plus the safety margin) after their timestamp
+        expiration: float = cls._reported_usage_interval_end(rate_limit, now)
+        timestamp: float = expiration - rate_limit.time_interval * (1 + safety_margin_pct)
+        task_logs.append(TaskLog(timestamp=timestamp, rate_limit=rate_limit, weight=reported - capacity_used))
+        cls.logger().debug(f"Capacity used of {rate_limit.limit_id} increased by {reported - capacity_used} to match "
+                           f"the {reported} reported by the exchange.")
+        return reported
+
+    def update_capacity_used(self, limit_id: str, capacity_used: int):
+        """
+        Resyncs the limit with the capacity used reported by the exchange. If the exchange counts more than the tasks
+        logged by the throttler, for instance the requests of other clients sharing the same IP or API key, the
+        difference is logged as a task of the limit, expiring when the exchange resets its count at the end of its
+        current interval. A lower count is ignored, since it may not include the requests still in flight.
+        The report is called for every response, so it is only stored here, and compared with the logged tasks the
+        next time the capacity of the limit is checked, while the tasks are scanned anyway.
+        :param limit_id: the limit_id of the limit the exchange reported the usage of
+        :param capacity_used: the weight used in the limit, as reported by the exchange
+        """
+        if limit_id not in self._id_to_limit_map:
+            return
+        self._reported_capacity_used[limit_id] = max(capacity_used, self._reported_capacity_used.get(limit_id, 0))
+
+    def record_rejection(self, limit_id: str, status_code: int):
+        """
+        Records that the exchange rejected a request of the limit for going over its rate limits, along with the
+        utilization the throttler had for each of the related limits.
+        :param limit_id: the limit_id of the rejected request
+        :param status_code: the HTTP status of the response
+        """
+        _, related_limits = self.get_related_limits(limit_id=limit_id)
+        for rate_limit, _ in related_limits:
+            utilization: float = self.capacity_used(rate_limit.limit_id) / rate_limit.limit
+            self._limit_metrics[rate_limit.limit_id].task_rejected(utilization)
+        self.logger().debug(f"Request of {limit_id} rejected by the exchange with status {status_code}.")
+
+    def limit_usage(self) -> List[RateLimitUsage]:
+        """
+        Returns the current usage of each rate limit along with the wait times and rejections of its tasks
+        """
+        return [self._limit_metrics[rate_limit.limit_id].usage(limit=rate_limit.limit,
+                                                               time_interval=rate_limit.time_interval,
+                                                               capacity_used=self.capacity_used(rate_limit.limit_id))
+                for rate_limit in self._rate_limits]
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: RequestPriority = DEFAULT_PRIORITY) -> AsyncRequestContextBase:
         raise NotImplementedError
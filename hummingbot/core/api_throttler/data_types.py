@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,20 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority classes of the throttled requests, from the most to the least urgent. Throttlers supporting priorities
+    give capacity to the waiting requests of a class before the ones of the following classes.
+    """
+    CANCEL = 0          # Order cancellations
+    CREATE = 1          # Order creations
+    STATUS = 2          # Order status updates and any request without a priority
+    HOUSEKEEPING = 3    # Balances, trading rules, fees and last traded prices polling
+
+
+DEFAULT_PRIORITY = RequestPriority.STATUS
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -0,0 +1,344 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    AsyncRequestContextBase,
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit, RequestPriority, TaskLog
+from hummingbot.core.api_throttler.throttler_metrics import LimitMetrics
+
+
+class LimitWindow:
+    """
+    The tasks logged against a single RateLimit within its time interval, oldest first, with their total weight.
+    Tasks are logged in the order they are executed, so the expired ones are always at the front of the window.
+    The usage reported by the exchange beyond the logged tasks is kept apart, since it expires when the exchange resets
+    its count rather than one time interval after it was reported.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        """
+        :param rate_limit: the RateLimit of the window
+        :param safety_margin_pct: percentage of the time interval tasks are kept in the window after it ends
+        """
+        self._rate_limit: RateLimit = rate_limit
+        self._safety_margin_pct: float = safety_margin_pct
+        self._task_logs: Deque[TaskLog] = deque()
+        self._capacity_used: int = 0
+        self._reported_capacity: int = 0
+        self._reported_until: float = 0.0
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def task_logs(self) -> Deque[TaskLog]:
+        return self._task_logs
+
+    @property
+    def capacity_used(self) -> int:
+        return self._capacity_used + self._reported_capacity
+
+    @property
+    def reported_capacity(self) -> int:
+        return self._reported_capacity
+
+    @property
+    def reported_until(self) -> float:
+        return self._reported_until
+
+    @property
+    def duration(self) -> float:
+        return self._rate_limit.time_interval * (1 + self._safety_margin_pct)
+
+    def flush(self, now: float):
+        """
+        Removes the tasks that have passed the rate limit period
+        """
+        expiration: float = now - self.duration
+        while len(self._task_logs) > 0 and self._task_logs[0].timestamp < expiration:
+            self._capacity_used -= self._task_logs.popleft().weight
+        if self._reported_capacity > 0 and now >= self._reported_until:
+            self._reported_capacity = 0
+
+    def within_capacity(self, weight: int) -> bool:
+        return self.capacity_used + weight <= self._rate_limit.limit
+
+    def available_at(self, weight: int) -> float:
+        """
+        Returns the time the window will have capacity for a task of the weight, as the expiration of the logged task
+        freeing the last unit of capacity it needs. Returns infinity if the weight is above the limit.
+        """
+        excess: int = self.capacity_used + weight - self._rate_limit.limit
+        freed: int = 0
+        reported_pending: bool = self._reported_capacity > 0
+        if excess <= 0:
+            return 0.0
+        for task in self._task_logs:
+            task_expiration: float = task.timestamp + self.duration
+            if reported_pending and self._reported_until <= task_expiration:
+                reported_pending = False
+                freed += self._reported_capacity
+                if freed >= excess:
+                    return self._reported_until
+            freed += task.weight
+            if freed >= excess:
+                return task_expiration
+        if reported_pending and freed + self._reported_capacity >= excess:
+            return self._reported_until
+        return math.inf
+
+    def log_task(self, timestamp: float, weight: int):
+        self._task_logs.append(TaskLog(timestamp=timestamp, rate_limit=self._rate_limit, weight=weight))
+        self._capacity_used += weight
+
+    def log_reported_usage(self, weight: int, until: float):
+        """
+        Adds usage reported by the exchange that was not logged as tasks, until the exchange resets its count
+        """
+        self._reported_capacity += weight
+        self._reported_until = max(self._reported_until, until)
+
+
+class CapacityScheduler:
+    """
+    Grants the tasks of a throttler the capacity they wait for, without polling.
+
+    A task that can't be executed right away waits on a future, in the lane of its priority. The scheduler computes the
+    time at which the next waiting task will have capacity, from the expiration of the tasks logged in its windows, and
+    wakes up at that time to log and release it. Waiting tasks are released by priority, then in the order they
+    arrived, except that a task is only held back by the waiting tasks sharing one of its limits.
+    """
+    # Delay added to the wake-up time, so tasks are sure to have expired when the scheduler checks them
+    WAKEUP_MARGIN: float = 0.001
+
+    def __init__(self):
+        # One lane per priority, from the most to the least urgent
+        self._lanes: Dict[RequestPriority, Deque[Tuple["SlidingWindowRequestContext", asyncio.Future]]] = {
+            priority: deque() for priority in sorted(RequestPriority)
+        }
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def waiting_tasks(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def waiting_tasks_by_priority(self) -> Dict[RequestPriority, int]:
+        return {priority: len(lane) for priority, lane in self._lanes.items()}
+
+    async def acquire(self, context: "SlidingWindowRequestContext"):
+        start: float = time.time()
+        context.flush()
+        if self.waiting_tasks == 0 and context.within_capacity():
+            context.log_task(start)
+            context.task_executed(0.0)
+            return
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._lanes[context.priority].append((context, future))
+        context.task_waiting()
+        try:
+            self.process_waiters()
+            await future
+        except asyncio.CancelledError:
+            # Later tasks held back by this one might be executed now
+            self.process_waiters()
+            raise
+        finally:
+            context.task_stopped_waiting()
+        context.task_executed(time.time() - start)
+
+    def process_waiters(self):
+        """
+        Releases the waiting tasks having capacity, and schedules the next wake-up
+        """
+        now: float = time.time()
+        held_windows: Set[LimitWindow] = set()
+        next_wakeup: float = math.inf
+
+        for priority, lane in self._lanes.items():
+            waiters: Deque[Tuple[SlidingWindowRequestContext, asyncio.Future]] = deque()
+            for context, future in lane:
+                if future.done():
+                    continue
+                windows: List[LimitWindow] = [window for window, _ in context.limit_windows]
+                if held_windows.isdisjoint(windows):
+                    for window in windows:
+                        window.flush(now)
+                    if context.within_capacity():
+                        context.log_task(now)
+                        future.set_result(None)
+                        continue
+                    next_wakeup = min(next_wakeup, context.available_at())
+                held_windows.update(windows)
+                waiters.append((context, future))
+            self._lanes[priority] = waiters
+
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        if next_wakeup < math.inf:
+            self._wakeup_handle = asyncio.get_event_loop().call_later(
+                max(next_wakeup - now, 0) + self.WAKEUP_MARGIN, self.process_waiters)
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits until all the windows of the limits related to its task
+    have capacity for it. Only the windows of the task are flushed and checked, so the cost of acquiring does not
+    depend on the number of tasks logged by the throttler. Tasks without capacity are woken up by the scheduler of the
+    throttler when it frees up.
+    """
+
+    def __init__(self,
+                 rate_limit: Optional[RateLimit],
+                 limit_windows: List[Tuple[LimitWindow, int]],
+                 scheduler: CapacityScheduler,
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 priority: RequestPriority = DEFAULT_PRIORITY,
+                 limit_metrics: Optional[List[LimitMetrics]] = None,
+                 ):
+        """
+        :param rate_limit: The RateLimit associated with this API Request
+        :param limit_windows: The windows of the related rate limits, with the weight of the task in each of them
+        :param scheduler: The scheduler releasing the tasks of the throttler waiting for capacity
+        :param lock: A shared asyncio.Lock used between all the contexts of the throttler
+        :param safety_margin_pct: Percentage of the time interval tasks are kept in the windows after it ends
+        :param retry_interval: Time between each limit check
+        :param priority: The priority class of the task while it waits for capacity
+        :param limit_metrics: The metrics of the related rate limits, updated when the task waits and is executed
+        """
+        # The task logs are kept per limit, in the windows
+        super().__init__(task_logs=[],
+                         rate_limit=rate_limit,
+                         related_limits=[(window.rate_limit, weight) for window, weight in limit_windows],
+                         lock=lock,
+                         safety_margin_pct=safety_margin_pct,
+                         retry_interval=retry_interval,
+                         limit_metrics=limit_metrics)
+        self._limit_windows: List[Tuple[LimitWindow, int]] = limit_windows
+        self._scheduler: CapacityScheduler = scheduler
+        self._priority: RequestPriority = priority
+
+    @property
+    def priority(self) -> RequestPriority:
+        return self._priority
+
+    @property
+    def limit_windows(self) -> List[Tuple[LimitWindow, int]]:
+        return self._limit_windows
+
+    def flush(self):
+        now: float = time.time()
+        for window, _ in self._limit_windows:
+            window.flush(now)
+
+    def within_capacity(self) -> bool:
+        for window, weight in self._limit_windows:
+            if not window.within_capacity(weight):
+                now: float = time.time()
+                if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    rate_limit: RateLimit = window.rate_limit
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {window.capacity_used} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                return False
+        return True
+
+    def available_at(self) -> float:
+        """
+        Returns the time all the windows of the task will have capacity for it
+        """
+        return max([window.available_at(weight) for window, weight in self._limit_windows], default=0.0)
+
+    def log_task(self, timestamp: float):
+        for window, weight in self._limit_windows:
+            window.log_task(timestamp, weight)
+
+    async def acquire(self):
+        await self._scheduler.acquire(self)
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in replacement of AsyncThrottler keeping the tasks logged for each rate limit in a separate window, along
+    with their total weight. Checking the capacity of a task and flushing the expired tasks only look at the windows
+    of the limits related to the task, in amortized constant time, instead of scanning the tasks of all the limits.
+    Each task is counted once in each of its related limits, with the weight defined for that limit.
+    Tasks waiting for capacity are released by a scheduler when it frees up, so retry_interval is not used. Waiting
+    tasks of a priority class get capacity before the ones of less urgent classes.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 ):
+        super().__init__(rate_limits=rate_limits, retry_interval=retry_interval, safety_margin_pct=safety_margin_pct)
+        self._limit_windows: Dict[str, LimitWindow] = {
+            limit.limit_id: LimitWindow(limit, self._safety_margin_pct)
+            for limit in self._rate_limits
+        }
+        self._scheduler: CapacityScheduler = CapacityScheduler()
+
+    @property
+    def waiting_tasks(self) -> int:
+        return self._scheduler.waiting_tasks
+
+    def waiting_tasks_by_priority(self) -> Dict[RequestPriority, int]:
+        return self._scheduler.waiting_tasks_by_priority()
+
+    def get_limit_window(self, limit_id: str) -> Optional[LimitWindow]:
+        return self._limit_windows.get(limit_id)
+
+    def capacity_used(self, limit_id: str) -> int:
+        window: Optional[LimitWindow] = self._limit_windows.get(limit_id)
+        if window is None:
+            return 0
+        window.flush(time.time())
+        return window.capacity_used
+
+    def update_capacity_used(self, limit_id: str, capacity_used: int):
+        window: Optional[LimitWindow] = self._limit_windows.get(limit_id)
+        if window is None:
+            return
+        now: float = time.time()
+        window.flush(now)
+        missing_capacity: int = capacity_used - window.capacity_used
+        if missing_capacity > 0:
+            # The waiting tasks are checked again when the scheduler wakes up, so they see the capacity used then
+            window.log_reported_usage(missing_capacity, self._reported_usage_interval_end(window.rate_limit, now))
+            self.logger().debug(f"Capacity used of {limit_id} increased by {missing_capacity} to match the "
+                                f"{capacity_used} reported by the exchange.")
+
+    def execute_task(self,
+                     limit_id: str,
+                     priority: RequestPriority = DEFAULT_PRIORITY) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the task, if it has to wait for capacity
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return SlidingWindowRequestContext(
+            rate_limit=rate_limit,
+            limit_windows=[(self._limit_windows[limit.limit_id], weight) for limit, weight in related_rate_limits],
+            scheduler=self._scheduler,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            priority=priority,
+            limit_metrics=self.get_related_limit_metrics(related_rate_limits),
+        )
@@ -0,0 +1,115 @@
+import bisect
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Tuple
+
+# Upper bounds in seconds of the wait time histogram buckets, the last bucket counts the longer waits
+WAIT_TIME_BUCKETS: Tuple[float, ...] = (0.0, 0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+# HTTP statuses returned by exchanges rejecting requests over their rate limits
+RATE_LIMIT_STATUS_CODES: Tuple[int, ...] = (418, 429)
+# Number of rejections for which the local utilization of the limit is kept
+REJECTION_HISTORY_SIZE: int = 100
+
+
+class RateLimitUsage(NamedTuple):
+    limit_id: str
+    limit: int
+    time_interval: float
+    capacity_used: int
+    waiting_tasks: int
+    executed_tasks: int
+    average_wait_time: float
+    max_wait_time: float
+    wait_time_histogram: Dict[float, int]
+    rejections: int
+    rejection_utilizations: List[float]
+
+    @property
+    def utilization(self) -> float:
+        return self.capacity_used / self.limit if self.limit > 0 else 0.0
+
+    @property
+    def min_utilization_at_rejection(self) -> float:
+        """
+        The lowest utilization of the limit, as seen by the throttler, when the exchange rejected a request over its
+        rate limits. A value well below 1 means the local model underestimates the usage seen by the exchange.
+        """
+        return min(self.rejection_utilizations, default=float("NaN"))
+
+    def wait_time_percentile(self, percentile: float) -> float:
+        """
+        Returns the upper bound of the histogram bucket holding the percentile of the wait times, infinity if it is in
+        the last bucket, or NaN without executed tasks
+        """
+        rank: float = percentile * sum(self.wait_time_histogram.values())
+        count: int = 0
+        if rank == 0:
+            return float("NaN")
+        for upper_bound, bucket_count in self.wait_time_histogram.items():
+            count += bucket_count
+            if count >= rank:
+                return upper_bound
+        return float("inf")
+
+
+class LimitMetrics:
+    """
+    Counters of the tasks executed against a single rate limit, updated by the request contexts of the throttler.
+    """
+
+    def __init__(self, limit_id: str):
+        self._limit_id: str = limit_id
+        self._waiting_tasks: int = 0
+        self._executed_tasks: int = 0
+        self._total_wait_time: float = 0.0
+        self._max_wait_time: float = 0.0
+        self._wait_time_histogram: List[int] = [0] * (len(WAIT_TIME_BUCKETS) + 1)
+        self._rejections: int = 0
+        self._rejection_utilizations: Deque[float] = deque(maxlen=REJECTION_HISTORY_SIZE)
+
+    @property
+    def limit_id(self) -> str:
+        return self._limit_id
+
+    @property
+    def waiting_tasks(self) -> int:
+        return self._waiting_tasks
+
+    @property
+    def executed_tasks(self) -> int:
+        return self._executed_tasks
+
+    @property
+    def rejections(self) -> int:
+        return self._rejections
+
+    def task_waiting(self):
+        self._waiting_tasks += 1
+
+    def task_stopped_waiting(self):
+        self._waiting_tasks -= 1
+
+    def task_executed(self, wait_time: float):
+        self._executed_tasks += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+        self._wait_time_histogram[bisect.bisect_left(WAIT_TIME_BUCKETS, wait_time)] += 1
+
+    def task_rejected(self, utilization: float):
+        self._rejections += 1
+        self._rejection_utilizations.append(utilization)
+
+    def usage(self, limit: int, time_interval: float, capacity_used: int) -> RateLimitUsage:
+        histogram: Dict[float, int] = dict(zip(WAIT_TIME_BUCKETS + (float("inf"),), self._wait_time_histogram))
+        return RateLimitUsage(
+            limit_id=self._limit_id,
+            limit=limit,
+            time_interval=time_interval,
+            capacity_used=capacity_used,
+            waiting_tasks=self._waiting_tasks,
+            executed_tasks=self._executed_tasks,
+            average_wait_time=self._total_wait_time / self._executed_tasks if self._executed_tasks > 0 else 0.0,
+            max_wait_time=self._max_wait_time,
+            wait_time_histogram=histogram,
+            rejections=self._rejections,
+            rejection_utilizations=list(self._rejection_utilizations),
+        )
@@ -58,3 +58,33 @@ class TradeType(Enum):
     BUY = 1
     SELL = 2
     RANGE = 3
+
+
+class TradeFlowStats(NamedTuple):
+    duration: float
+    trade_count: int
+    buy_volume: float
+    sell_volume: float
+    buy_quote_volume: float
+    sell_quote_volume: float
+
+    @property
+    def volume(self) -> float:
+        return self.buy_volume + self.sell_volume
+
+    @property
+    def quote_volume(self) -> float:
+        return self.buy_quote_volume + self.sell_quote_volume
+
+    @property
+    def vwap(self) -> float:
+        volume = self.volume
+        return self.quote_volume / volume if volume > 0 else float("NaN")
+
+    @property
+    def imbalance(self) -> float:
+        """
+        Buy minus sell volume, relative to the total volume: 1 if all the volume was bought, -1 if it was all sold
+        """
+        volume = self.volume
+        return (self.buy_volume - self.sell_volume) / volume if volume > 0 else 0.0
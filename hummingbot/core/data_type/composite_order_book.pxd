@@ -1,8 +1,17 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
+        OrderBook _original_order_book
         OrderBook _traded_order_book
 
-    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_sync_level(self, bint is_buy, double price)
+    cdef c_sync_book_ends(self)
+    cdef c_rebuild_composite_book(self)
+    cdef c_update_best_prices(self)
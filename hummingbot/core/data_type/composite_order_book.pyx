@@ -3,11 +3,13 @@
 
 from typing import Iterator
 
-from cython.operator cimport address as ref, dereference as deref, postincrement as inc
-from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from cython.operator cimport address as ref, dereference as deref, postincrement as inc, predecrement as dec
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -15,180 +17,227 @@ cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+    The exchange order book is kept in a separate original order book, and the entries of this order book are the
+    composite entries, i.e. the original entries minus the recorded fills. The composite entries are only updated at
+    the price levels changed by diffs and fills, so reading them costs the same as reading a plain order book.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
+        self._original_order_book = OrderBook()
         self._traded_order_book = OrderBook()
 
     @property
     def traded_order_book(self) -> OrderBook:
         return self._traded_order_book
 
+    @property
+    def max_depth(self) -> int:
+        return self._original_order_book.max_depth
+
+    @max_depth.setter
+    def max_depth(self, value: int):
+        self._original_order_book.max_depth = value
+        self.c_rebuild_composite_book()
+        self.c_update_best_prices()
+        self.c_invalidate_depth_index()
+
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self.c_rebuild_composite_book()
+        self.c_update_best_prices()
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(self._last_diff_uid)
 
     def record_filled_order(self, order_fill_event):
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            set[OrderBookEntry].reverse_iterator bid_order_it = self._traded_order_book._bid_book.rbegin()
-            set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry entry
-
-        price = order_fill_event.price
-        amount = float(order_fill_event.amount)
-        timestamp = order_fill_event.timestamp
-
-        if order_fill_event.trade_type is TradeType.BUY:
-            while ask_order_it != self._traded_order_book._ask_book.end():
-                entry = deref(ask_order_it)
-                # price is in the order book, sum the amount
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is outside of the ask price range, break and insert the new filled ask order into the ask book
-                elif entry.getPrice() > price:
-                    break
-                # price is further up the ask price range, continue searching
-                elif entry.getPrice() < price:
-                    inc(ask_order_it)
-            cpp_asks.push_back(OrderBookEntry(price, amount, timestamp))
-
-        elif order_fill_event.trade_type is TradeType.SELL:
-            while bid_order_it != self._traded_order_book._bid_book.rend():
-                entry = deref(bid_order_it)
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is further down the bid price range, continue searching
-                elif entry.getPrice() > price:
-                    inc(bid_order_it)
-                # price is outside of the bid price range, break and insert the new filled order into the bid book
-                elif entry.getPrice() < price:
-                    break
-            cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
-
-        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+            bint is_buy = order_fill_event.trade_type is TradeType.BUY
+            set[OrderBookEntry] *traded_book
+            set[OrderBookEntry].iterator traded_it
+            double price = float(order_fill_event.price)
+            double amount = float(order_fill_event.amount)
+            int64_t timestamp = int(order_fill_event.timestamp)
+
+        if not is_buy and order_fill_event.trade_type is not TradeType.SELL:
+            return
+
+        # Buy orders consume the ask book, sell orders consume the bid book.
+        traded_book = ref(self._traded_order_book._ask_book) if is_buy else ref(self._traded_order_book._bid_book)
+        traded_it = deref(traded_book).find(OrderBookEntry(price, 0, 0))
+        if traded_it != deref(traded_book).end():
+            amount += deref(traded_it).getAmount()
+            deref(traded_book).erase(traded_it)
+        deref(traded_book).insert(OrderBookEntry(price, amount, timestamp))
+
+        self.c_sync_level(is_buy, price)
+        self.c_update_best_prices()
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(self._last_diff_uid)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
-        return super().bid_entries()
+        return self._original_order_book.bid_entries()
 
     def original_ask_entries(self) -> Iterator[OrderBookRow]:
-        return super().ask_entries()
-
-    def bid_entries(self) -> Iterator[OrderBookRow]:
+        return self._original_order_book.ask_entries()
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._original_order_book.c_apply_diffs(bids, asks, update_id)
+
+        # The original book can also lose levels at both ends (crossed levels, depth limit) and gain levels at its
+        # worst end (depth limit refills) without a diff for them. The ends are synced first, while the composite book
+        # only holds levels that were in the original book before the diffs.
+        self.c_sync_book_ends()
+        for bid in bids:
+            self.c_sync_level(False, bid.getPrice())
+        for ask in asks:
+            self.c_sync_level(True, ask.getPrice())
+
+        self.c_update_best_prices()
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(update_id)
+        self._last_diff_uid = update_id
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._original_order_book.c_apply_snapshot(bids, asks, update_id)
+        self.c_rebuild_composite_book()
+        self.c_update_best_prices()
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(update_id)
+        self._snapshot_uid = update_id
+
+    cdef c_sync_level(self, bint is_buy, double price):
+        """
+        Sets the composite level at the price to the original level minus the recorded fills. Fills recorded at a
+        price missing from the original book expire.
+        """
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
-
-    def ask_entries(self) -> Iterator[OrderBookRow]:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry] *original_book = (ref(self._original_order_book._ask_book) if is_buy
+                                                  else ref(self._original_order_book._bid_book))
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._ask_book) if is_buy
+                                                else ref(self._traded_order_book._bid_book))
+            OrderBookEntry level = OrderBookEntry(price, 0, 0)
+            set[OrderBookEntry].iterator it = deref(book).find(level)
+            set[OrderBookEntry].iterator original_it = deref(original_book).find(level)
+            set[OrderBookEntry].iterator traded_it = deref(traded_book).find(level)
+            OrderBookEntry original_entry
+            OrderBookEntry traded_entry
+
+        if it != deref(book).end():
+            deref(book).erase(it)
+        if original_it == deref(original_book).end():
+            if traded_it != deref(traded_book).end():
+                deref(traded_book).erase(traded_it)
+            return
+
+        original_entry = deref(original_it)
+        if traded_it == deref(traded_book).end():
+            deref(book).insert(original_entry)
+            return
+
+        traded_entry = deref(traded_it)
+        if original_entry.getAmount() > traded_entry.getAmount():
+            deref(book).insert(OrderBookEntry(price,
+                                              original_entry.getAmount() - traded_entry.getAmount(),
+                                              original_entry.getUpdateId()))
+        elif original_entry.getAmount() < traded_entry.getAmount():
+            # The level stays consumed until the original level grows beyond its current amount.
+            deref(traded_book).erase(traded_it)
+            deref(traded_book).insert(OrderBookEntry(price, original_entry.getAmount(), traded_entry.getUpdateId()))
+
+    cdef c_sync_book_ends(self):
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
+            set[OrderBookEntry].iterator it
+            set[OrderBookEntry].iterator original_it
+            set[OrderBookEntry].iterator traded_it
+            set[OrderBookEntry] *original_bids = ref(self._original_order_book._bid_book)
+            set[OrderBookEntry] *original_asks = ref(self._original_order_book._ask_book)
+            set[OrderBookEntry] *traded_bids = ref(self._traded_order_book._bid_book)
+            set[OrderBookEntry] *traded_asks = ref(self._traded_order_book._ask_book)
+            double worst_price
+
+        # Bids are sorted by ascending price, so the worst level of each set is at begin() and the best at end() - 1.
+        while not self._bid_book.empty():
+            it = self._bid_book.end()
+            dec(it)
+            if deref(original_bids).find(deref(it)) != deref(original_bids).end():
+                break
+            self._bid_book.erase(it)
+        while not self._bid_book.empty():
+            it = self._bid_book.begin()
+            if deref(original_bids).find(deref(it)) != deref(original_bids).end():
+                break
+            self._bid_book.erase(it)
+        worst_price = deref(self._bid_book.begin()).getPrice() if not self._bid_book.empty() else float("inf")
+        original_it = deref(original_bids).begin()
+        while original_it != deref(original_bids).end() and deref(original_it).getPrice() < worst_price:
+            self.c_sync_level(False, deref(original_it).getPrice())
+            inc(original_it)
+        # Fills recorded above the best original bid were consumed by the exchange.
+        if not deref(original_bids).empty():
+            it = deref(original_bids).end()
+            dec(it)
+            while (not deref(traded_bids).empty()
+                   and deref(deref(traded_bids).rbegin()).getPrice() > deref(it).getPrice()):
+                traded_it = deref(traded_bids).end()
+                dec(traded_it)
+                deref(traded_bids).erase(traded_it)
+
+        # Asks are sorted by ascending price, so the best level of each set is at begin() and the worst at end() - 1.
+        while not self._ask_book.empty():
+            it = self._ask_book.begin()
+            if deref(original_asks).find(deref(it)) != deref(original_asks).end():
+                break
+            self._ask_book.erase(it)
+        while not self._ask_book.empty():
+            it = self._ask_book.end()
+            dec(it)
+            if deref(original_asks).find(deref(it)) != deref(original_asks).end():
+                break
+            self._ask_book.erase(it)
+        worst_price = deref(self._ask_book.rbegin()).getPrice() if not self._ask_book.empty() else float("-inf")
+        original_it = deref(original_asks).end()
+        while original_it != deref(original_asks).begin():
+            dec(original_it)
+            if deref(original_it).getPrice() <= worst_price:
+                break
+            self.c_sync_level(True, deref(original_it).getPrice())
+        # Fills recorded below the best original ask were consumed by the exchange.
+        if not deref(original_asks).empty():
+            it = deref(original_asks).begin()
+            while (not deref(traded_asks).empty()
+                   and deref(deref(traded_asks).begin()).getPrice() < deref(it).getPrice()):
+                deref(traded_asks).erase(deref(traded_asks).begin())
+
+    cdef c_rebuild_composite_book(self):
+        cdef:
+            set[OrderBookEntry].iterator it
 
+        # Fills recorded at prices missing from the original book expire.
+        it = self._traded_order_book._bid_book.begin()
+        while it != self._traded_order_book._bid_book.end():
+            if self._original_order_book._bid_book.find(deref(it)) == self._original_order_book._bid_book.end():
+                self._traded_order_book._bid_book.erase(inc(it))
             else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
-
-    cdef double c_get_price(self, bint is_buy) except? -1:
-        cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
-        if deref(book).size() < 1:
-            raise EnvironmentError("Order book is empty - no price quote is possible.")
-
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
+                inc(it)
+        it = self._traded_order_book._ask_book.begin()
+        while it != self._traded_order_book._ask_book.end():
+            if self._original_order_book._ask_book.find(deref(it)) == self._original_order_book._ask_book.end():
+                self._traded_order_book._ask_book.erase(inc(it))
             else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+                inc(it)
+
+        self._bid_book.clear()
+        self._ask_book.clear()
+        it = self._original_order_book._bid_book.begin()
+        while it != self._original_order_book._bid_book.end():
+            self.c_sync_level(False, deref(it).getPrice())
+            inc(it)
+        it = self._original_order_book._ask_book.begin()
+        while it != self._original_order_book._ask_book.end():
+            self.c_sync_level(True, deref(it).getPrice())
+            inc(it)
+
+    cdef c_update_best_prices(self):
+        self._best_bid = deref(self._bid_book.rbegin()).getPrice() if not self._bid_book.empty() else float("NaN")
+        self._best_ask = deref(self._ask_book.begin()).getPrice() if not self._ask_book.empty() else float("NaN")
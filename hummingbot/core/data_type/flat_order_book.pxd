@@ -0,0 +1,26 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+cimport numpy as np
+
+
+cdef class FlatOrderBook(OrderBook):
+    cdef vector[OrderBookEntry] _bid_levels
+    cdef vector[OrderBookEntry] _ask_levels
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_depth_limit(self)
+    cdef size_t c_kept_levels(self, bint is_ask)
+    cdef c_build_depth_index(self, bint is_buy)
+    cdef np.ndarray c_entries_to_numpy(self, bint is_buy, size_t depth)
+    cdef list c_simulate_trades(self, bint is_buy, np.ndarray amounts)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef size_t c_find_level(self, vector[OrderBookEntry] *levels, double price, bint is_ask)
+    cdef c_apply_level(self, vector[OrderBookEntry] *levels, OrderBookEntry entry, bint is_ask)
+    cdef c_truncate_overlap_levels(self)
+    cdef c_update_best_prices(self)
+    cdef size_t c_visible_levels(self, vector[OrderBookEntry] *levels)
@@ -0,0 +1,280 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from typing import Iterator
+
+import numpy as np
+
+from cython.operator cimport address as ref, dereference as deref, postincrement as inc
+from libcpp.set cimport set
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+cdef class FlatOrderBook(OrderBook):
+    """
+    Order book storing each side in a contiguous sorted vector instead of a std::set.
+
+    Each side is sorted from the worst to the best price (bids by ascending, asks by descending price), so the levels
+    near the top of the book, where most updates happen, sit at the end of the vectors and are inserted or removed by
+    moving only a few entries. Diffs, snapshots, depth limits and the entries iterators behave as in OrderBook, so the
+    class can be selected per connector through OrderBookTrackerDataSource.order_book_create_function.
+    """
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            self.c_apply_level(ref(self._bid_levels), bid, False)
+        for ask in asks:
+            self.c_apply_level(ref(self._ask_levels), ask, True)
+
+        if self._max_depth > 0:
+            self.c_apply_depth_limit()
+        self.c_truncate_overlap_levels()
+        self.c_update_best_prices()
+
+        # The cumulative depth index is rebuilt lazily on the next volume query.
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(update_id)
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double best_bid_price = float("NaN")
+            double best_ask_price = float("NaN")
+            set[OrderBookEntry] bid_book
+            set[OrderBookEntry] ask_book
+            set[OrderBookEntry].reverse_iterator ask_iterator
+
+        # The entries are sorted through sets first, so duplicated price levels keep the same entry as in OrderBook.
+        for bid in bids:
+            bid_book.insert(bid)
+            if not (bid.getPrice() <= best_bid_price):
+                best_bid_price = bid.getPrice()
+        for ask in asks:
+            ask_book.insert(ask)
+            if not (ask.getPrice() >= best_ask_price):
+                best_ask_price = ask.getPrice()
+        self._bid_levels.assign(bid_book.begin(), bid_book.end())
+        self._ask_levels.clear()
+        self._ask_levels.reserve(ask_book.size())
+        self._bid_dropped_price = self._ask_dropped_price = float("NaN")
+        ask_iterator = ask_book.rbegin()
+        while ask_iterator != ask_book.rend():
+            self._ask_levels.push_back(deref(ask_iterator))
+            inc(ask_iterator)
+        if self._max_depth > 0:
+            self.c_apply_depth_limit()
+
+        # Record the current best prices, for faster c_get_price() calls.
+        self._best_bid = best_bid_price
+        self._best_ask = best_ask_price
+        if self._dex:
+            self.c_truncate_overlap_levels()
+            self.c_update_best_prices()
+
+        # The cumulative depth index is rebuilt lazily on the next volume query.
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(update_id)
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+
+    cdef size_t c_find_level(self, vector[OrderBookEntry] *levels, double price, bint is_ask):
+        """
+        Returns the index of the first level that is not worse than the price, or the number of levels if all of them
+        are worse.
+        """
+        cdef:
+            size_t low = 0
+            size_t high = deref(levels).size()
+            size_t middle
+            double level_price
+
+        while low < high:
+            middle = low + (high - low) // 2
+            level_price = deref(levels)[middle].getPrice()
+            if (level_price <= price) if is_ask else (level_price >= price):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    cdef c_apply_level(self, vector[OrderBookEntry] *levels, OrderBookEntry entry, bint is_ask):
+        cdef:
+            size_t index
+
+        # Levels not better than the dropped ones can't be placed, as the dropped levels may still be live.
+        if entry.getAmount() > 0 and ((entry.getPrice() >= self._ask_dropped_price) if is_ask
+                                      else (entry.getPrice() <= self._bid_dropped_price)):
+            return
+        index = self.c_find_level(levels, entry.getPrice(), is_ask)
+        if index < deref(levels).size() and deref(levels)[index].getPrice() == entry.getPrice():
+            if entry.getAmount() > 0:
+                deref(levels)[index] = entry
+            else:
+                deref(levels).erase(deref(levels).begin() + index)
+        elif entry.getAmount() > 0:
+            deref(levels).insert(deref(levels).begin() + index, entry)
+
+    cdef c_truncate_overlap_levels(self):
+        """
+        Removes overlapping entries between the bid and ask sides, following the same rules as truncateOverlapEntries:
+        centralised exchanges keep the newer entry, dexes keep the entry with the larger quote amount.
+        """
+        cdef:
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+
+        while not self._bid_levels.empty() and not self._ask_levels.empty():
+            top_bid = self._bid_levels.back()
+            top_ask = self._ask_levels.back()
+            if not (top_bid.getPrice() >= top_ask.getPrice()):
+                break
+            if self._dex:
+                if top_bid.getAmount() * top_bid.getPrice() > top_ask.getAmount() * top_ask.getPrice():
+                    self._ask_levels.pop_back()
+                else:
+                    self._bid_levels.pop_back()
+            else:
+                if top_bid.getUpdateId() > top_ask.getUpdateId():
+                    self._ask_levels.pop_back()
+                else:
+                    self._bid_levels.pop_back()
+
+    cdef c_update_best_prices(self):
+        # Record the current best prices, for faster c_get_price() calls.
+        if not self._bid_levels.empty():
+            self._best_bid = self._bid_levels.back().getPrice()
+        if not self._ask_levels.empty():
+            self._best_ask = self._ask_levels.back().getPrice()
+
+    cdef c_apply_depth_limit(self):
+        """
+        The best max_depth levels of each side are visible, and up to max_depth further levels are kept to refill the
+        visible levels when they are removed. Levels beyond that are dropped, and the best dropped price is recorded,
+        as with the OrderBook overflow stores.
+        """
+        cdef:
+            size_t capacity = 2 * self._max_depth
+            size_t dropped
+
+        # The levels are sorted from the worst, so the last dropped level is the best one.
+        if self._bid_levels.size() > capacity:
+            dropped = self._bid_levels.size() - capacity
+            self._bid_dropped_price = self._bid_levels[dropped - 1].getPrice()
+            self._bid_levels.erase(self._bid_levels.begin(), self._bid_levels.begin() + dropped)
+        if self._ask_levels.size() > capacity:
+            dropped = self._ask_levels.size() - capacity
+            self._ask_dropped_price = self._ask_levels[dropped - 1].getPrice()
+            self._ask_levels.erase(self._ask_levels.begin(), self._ask_levels.begin() + dropped)
+
+    cdef size_t c_kept_levels(self, bint is_ask):
+        return self._ask_levels.size() if is_ask else self._bid_levels.size()
+
+    cdef size_t c_visible_levels(self, vector[OrderBookEntry] *levels):
+        if self._max_depth > 0 and deref(levels).size() > self._max_depth:
+            return self._max_depth
+        return deref(levels).size()
+
+    cdef c_build_depth_index(self, bint is_buy):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+            vector[double] *cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+            size_t visible_levels = self.c_visible_levels(levels)
+            size_t index
+            OrderBookEntry entry
+            double base_volume = 0
+            double quote_volume = 0
+
+        deref(prices).clear()
+        deref(cum_base).clear()
+        deref(cum_quote).clear()
+        deref(prices).reserve(visible_levels)
+        deref(cum_base).reserve(visible_levels)
+        deref(cum_quote).reserve(visible_levels)
+        for index in range(visible_levels):
+            entry = deref(levels)[deref(levels).size() - 1 - index]
+            base_volume += entry.getAmount()
+            quote_volume += entry.getAmount() * entry.getPrice()
+            deref(prices).push_back(entry.getPrice())
+            deref(cum_base).push_back(base_volume)
+            deref(cum_quote).push_back(quote_volume)
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t index = 0
+            OrderBookEntry entry
+        while index < self.c_visible_levels(ref(self._bid_levels)):
+            entry = self._bid_levels[self._bid_levels.size() - 1 - index]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            index += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t index = 0
+            OrderBookEntry entry
+        while index < self.c_visible_levels(ref(self._ask_levels)):
+            entry = self._ask_levels[self._ask_levels.size() - 1 - index]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            index += 1
+
+    cdef np.ndarray c_entries_to_numpy(self, bint is_buy, size_t depth):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t size = min(depth, self.c_visible_levels(levels))
+            np.ndarray[np.float64_t, ndim=2] result = np.empty((size, 3), dtype="float64")
+            OrderBookEntry entry
+            size_t index
+
+        for index in range(size):
+            entry = deref(levels)[deref(levels).size() - 1 - index]
+            result[index, 0] = entry.getPrice()
+            result[index, 1] = entry.getAmount()
+            result[index, 2] = entry.getUpdateId()
+        return result
+
+    cdef list c_simulate_trades(self, bint is_buy, np.ndarray amounts):
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] query_amounts = np.ascontiguousarray(amounts, dtype="float64").ravel()
+            size_t query_count = query_amounts.shape[0]
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t visible_levels = self.c_visible_levels(levels)
+            size_t level = 0
+            double best_price = float("NaN")
+            vector[double] prices
+            vector[double] level_amounts
+            vector[int64_t] update_ids
+            double total_amount = 0
+            double total_cost = 0
+            OrderBookEntry entry
+            size_t index
+            list results = []
+
+        if visible_levels > 0:
+            best_price = self._best_ask if is_buy else self._best_bid
+        for index in range(query_count):
+            if index > 0 and query_amounts[index] < query_amounts[index - 1]:
+                raise ValueError("The amounts must be sorted in ascending order.")
+            while total_amount < query_amounts[index] and level < visible_levels:
+                entry = deref(levels)[deref(levels).size() - 1 - level]
+                level += 1
+                prices.push_back(entry.getPrice())
+                level_amounts.push_back(entry.getAmount())
+                update_ids.push_back(entry.getUpdateId())
+                total_amount += entry.getAmount()
+                total_cost += entry.getPrice() * entry.getAmount()
+            results.append(self.c_simulation_result(is_buy, query_amounts[index], best_price, ref(prices),
+                                                    ref(level_amounts), ref(update_ids), total_amount, total_cost))
+        return results
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+        if deref(levels).size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
@@ -1,17 +1,25 @@
 # distutils: language=c++
 
-from libc.stdint cimport int64_t
+from libc.stdint cimport int64_t, uint32_t
+from libcpp.map cimport map
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.pubsub cimport PubSub
-from .order_book_query_result cimport OrderBookQueryResult
+from .order_book_query_result cimport OrderBookQueryResult, OrderBookSimulationResult
+from .order_book_trade_flow cimport OrderBookTradeFlow
+from cpython cimport array
 cimport numpy as np
 
 
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
+    cdef set[OrderBookEntry] _bid_overflow_book
+    cdef set[OrderBookEntry] _ask_overflow_book
+    cdef size_t _max_depth
+    cdef double _bid_dropped_price
+    cdef double _ask_dropped_price
     cdef int64_t _snapshot_uid
     cdef int64_t _last_diff_uid
     cdef double _best_bid
@@ -19,21 +27,66 @@ cdef class OrderBook(PubSub):
     cdef double _last_trade_price
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
+    cdef OrderBookTradeFlow _trade_flow
     cdef bint _dex
+    cdef double _top_of_book_tolerance
+    cdef double _notified_best_bid
+    cdef double _notified_best_ask
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_cum_base
+    cdef vector[double] _bid_depth_cum_quote
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_cum_base
+    cdef vector[double] _ask_depth_cum_quote
+    cdef bint _bid_depth_index_valid
+    cdef bint _ask_depth_index_valid
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_check_top_of_book(self, int64_t update_id)
+    cdef c_trigger_top_of_book_changed(self, int64_t update_id)
+    cdef c_apply_depth_limit(self)
+    cdef size_t c_kept_levels(self, bint is_ask)
+    cdef bint c_is_stale(self)
+    cdef c_add_level_entries(self, vector[OrderBookEntry] *entries, array.array levels, int64_t update_id)
+    cdef vector[OrderBookEntry] c_coalesce_entries(self, vector[OrderBookEntry] entries)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_invalidate_depth_index(self)
+    cdef c_build_depth_index(self, bint is_buy)
+    cdef c_ensure_depth_index(self, bint is_buy)
+    cdef size_t c_depth_index_search(self, vector[double] *cumulative, double target)
+    cdef size_t c_depth_index_price_search(self, bint is_buy, double price)
+    cdef np.ndarray c_entries_to_numpy(self, bint is_buy, size_t depth)
+    cdef uint32_t c_checksum(self,
+                             size_t depth,
+                             object level_format,
+                             bint interleave,
+                             bint asks_first,
+                             str separator)
+    cdef OrderBookSimulationResult c_simulate_trade(self, bint is_buy, double amount)
+    cdef list c_simulate_trades(self, bint is_buy, np.ndarray amounts)
+    cdef list c_simulate_rows(self, bint is_buy, double amount)
+    cdef OrderBookSimulationResult c_simulation_result(self,
+                                                       bint is_buy,
+                                                       double amount,
+                                                       double best_price,
+                                                       vector[double] *prices,
+                                                       vector[double] *level_amounts,
+                                                       vector[int64_t] *update_ids,
+                                                       double total_amount,
+                                                       double total_cost)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef np.ndarray c_get_volumes_for_prices(self, bint is_buy, np.ndarray prices, bint quote_volume)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef tuple c_get_prices_and_vwaps_for_volumes(self, bint is_buy, np.ndarray volumes)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
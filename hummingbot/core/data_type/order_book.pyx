@@ -3,11 +3,14 @@
 import bisect
 import logging
 import time
+import zlib
 from typing import (
+    Callable,
     Dict,
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
 )
 
@@ -19,17 +22,26 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
-from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_diff_window cimport OrderBookDiffWindow
+from hummingbot.core.data_type.order_book_message import OrderBookDiffMessage, OrderBookMessage
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult, OrderBookSimulationResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_trade_flow cimport OrderBookTradeFlow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from libc.stdint cimport SIZE_MAX
+from libcpp.utility cimport pair
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
-    OrderBookTradeEvent
+    OrderBookTopOfBookChangedEvent,
+    OrderBookTradeEvent,
+    TradeType,
 )
+from libc.math cimport fabs, isnan
+from cpython cimport array
 
 cimport numpy as np
 
@@ -37,8 +49,19 @@ ob_logger = None
 NaN = float("nan")
 
 
+def checksum_level_format(price: float, amount: float) -> str:
+    return f"{price}:{amount}"
+
+
+cdef bint top_price_moved(double price, double reference_price, double tolerance):
+    if isnan(price) or isnan(reference_price):
+        return isnan(price) != isnan(reference_price)
+    return fabs(price - reference_price) > tolerance * fabs(reference_price)
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChanged.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -47,7 +70,14 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, max_depth: int = 0):
+        """
+        :param dex: whether the book belongs to a decentralized exchange, which changes how crossed levels are removed
+        :param max_depth: if greater than zero, only the best max_depth levels of each side are kept in the book. Up
+        to max_depth further levels per side are kept in an overflow store, to refill the book when levels are removed.
+        Levels beyond the overflow store are dropped, and the book is stale once the kept levels can't fill max_depth
+        levels anymore, until the next snapshot.
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,7 +85,14 @@ cdef class OrderBook(PubSub):
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
+        self._trade_flow = OrderBookTradeFlow()
         self._dex = dex
+        self._max_depth = max_depth
+        self._bid_dropped_price = self._ask_dropped_price = float("NaN")
+        self._bid_depth_index_valid = False
+        self._ask_depth_index_valid = False
+        self._top_of_book_tolerance = 0
+        self._notified_best_bid = self._notified_best_ask = float("NaN")
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,23 +103,58 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
+            elif self._max_depth > 0:
+                result = self._bid_overflow_book.find(bid)
+                if result != self._bid_overflow_book.end():
+                    self._bid_overflow_book.erase(result)
             if bid.getAmount() > 0:
-                self._bid_book.insert(bid)
+                # Levels not better than the dropped ones can't be placed, as the dropped levels may still be live.
+                if bid.getPrice() <= self._bid_dropped_price:
+                    continue
+                # With a depth limit, levels worse than the best overflow level belong to the overflow store.
+                if (self._max_depth > 0
+                        and not self._bid_overflow_book.empty()
+                        and bid.getPrice() <= deref(self._bid_overflow_book.rbegin()).getPrice()):
+                    self._bid_overflow_book.insert(bid)
+                else:
+                    self._bid_book.insert(bid)
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
+            elif self._max_depth > 0:
+                result = self._ask_overflow_book.find(ask)
+                if result != self._ask_overflow_book.end():
+                    self._ask_overflow_book.erase(result)
             if ask.getAmount() > 0:
-                self._ask_book.insert(ask)
+                if ask.getPrice() >= self._ask_dropped_price:
+                    continue
+                if (self._max_depth > 0
+                        and not self._ask_overflow_book.empty()
+                        and ask.getPrice() >= deref(self._ask_overflow_book.begin()).getPrice()):
+                    self._ask_overflow_book.insert(ask)
+                else:
+                    self._ask_book.insert(ask)
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
-        truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if self._max_depth > 0:
+            self.c_apply_depth_limit()
+            # Levels removed by the truncation are refilled from the overflow store, which can cross again.
+            book_size = self._bid_book.size() + self._ask_book.size()
+            truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+            while self._bid_book.size() + self._ask_book.size() < book_size:
+                self.c_apply_depth_limit()
+                book_size = self._bid_book.size() + self._ask_book.size()
+                truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        else:
+            truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -94,6 +166,10 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        # The cumulative depth index is rebuilt lazily on the next volume query.
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(update_id)
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
@@ -109,6 +185,9 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._bid_overflow_book.clear()
+        self._ask_overflow_book.clear()
+        self._bid_dropped_price = self._ask_dropped_price = float("NaN")
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -117,6 +196,8 @@ cdef class OrderBook(PubSub):
             self._ask_book.insert(ask)
             if not (ask.getPrice() >= best_ask_price):
                 best_ask_price = ask.getPrice()
+        if self._max_depth > 0:
+            self.c_apply_depth_limit()
 
         if self._dex:
             truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
@@ -134,12 +215,125 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        # The cumulative depth index is rebuilt lazily on the next volume query.
+        self.c_invalidate_depth_index()
+        self.c_check_top_of_book(update_id)
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_apply_depth_limit(self):
+        """
+        Keeps the best max_depth levels of each side in the book, moving the rest to the overflow stores. Levels
+        missing from the book are promoted back from the overflow stores, and the overflow stores are trimmed to
+        max_depth levels. The best price trimmed from each side is recorded, as the levels kept can only be trusted
+        down to it.
+        """
+        cdef:
+            set[OrderBookEntry].iterator it
+
+        # Bids are sorted by ascending price, so the worst level of each set is at begin() and the best at end() - 1.
+        while self._bid_book.size() > self._max_depth:
+            it = self._bid_book.begin()
+            self._bid_overflow_book.insert(deref(it))
+            self._bid_book.erase(it)
+        while self._bid_book.size() < self._max_depth and not self._bid_overflow_book.empty():
+            it = self._bid_overflow_book.end()
+            dec(it)
+            self._bid_book.insert(deref(it))
+            self._bid_overflow_book.erase(it)
+        while self._bid_overflow_book.size() > self._max_depth:
+            it = self._bid_overflow_book.begin()
+            # The levels are trimmed from the worst, so the last one trimmed is the best dropped level.
+            self._bid_dropped_price = deref(it).getPrice()
+            self._bid_overflow_book.erase(it)
+
+        # Asks are sorted by ascending price, so the best level of each set is at begin() and the worst at end() - 1.
+        while self._ask_book.size() > self._max_depth:
+            it = self._ask_book.end()
+            dec(it)
+            self._ask_overflow_book.insert(deref(it))
+            self._ask_book.erase(it)
+        while self._ask_book.size() < self._max_depth and not self._ask_overflow_book.empty():
+            it = self._ask_overflow_book.begin()
+            self._ask_book.insert(deref(it))
+            self._ask_overflow_book.erase(it)
+        while self._ask_overflow_book.size() > self._max_depth:
+            it = self._ask_overflow_book.end()
+            dec(it)
+            self._ask_dropped_price = deref(it).getPrice()
+            self._ask_overflow_book.erase(it)
+
+    cdef size_t c_kept_levels(self, bint is_ask):
+        if is_ask:
+            return self._ask_book.size() + self._ask_overflow_book.size()
+        return self._bid_book.size() + self._bid_overflow_book.size()
+
+    cdef bint c_is_stale(self):
+        cdef:
+            bint bids_stale = (not isnan(self._bid_dropped_price)
+                               and (self._max_depth == 0 or self.c_kept_levels(False) < self._max_depth))
+            bint asks_stale = (not isnan(self._ask_dropped_price)
+                               and (self._max_depth == 0 or self.c_kept_levels(True) < self._max_depth))
+        return bids_stale or asks_stale
+
+    @property
+    def stale(self) -> bool:
+        """
+        Whether a side of the book may be missing live levels dropped by the depth limit, because the levels kept
+        can't fill max_depth levels anymore. The book has to be replaced by a new snapshot.
+        """
+        return self.c_is_stale()
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @max_depth.setter
+    def max_depth(self, value: int):
+        cdef:
+            set[OrderBookEntry].iterator it
+
+        self._max_depth = value
+        if self._max_depth > 0:
+            self.c_apply_depth_limit()
+        else:
+            it = self._bid_overflow_book.begin()
+            while it != self._bid_overflow_book.end():
+                self._bid_book.insert(deref(it))
+                inc(it)
+            it = self._ask_overflow_book.begin()
+            while it != self._ask_overflow_book.end():
+                self._ask_book.insert(deref(it))
+                inc(it)
+            self._bid_overflow_book.clear()
+            self._ask_overflow_book.clear()
+        self.c_invalidate_depth_index()
+
+    cdef c_check_top_of_book(self, int64_t update_id):
+        """
+        Triggers a TopOfBookChanged event if the best bid or ask moved by more than the tolerance since the last event.
+        Nothing is done when no listener is registered for the event.
+        """
+        if self._events.find(self.TOP_OF_BOOK_CHANGED_EVENT_TAG) == self._events.end():
+            return
+        if (top_price_moved(self._best_bid, self._notified_best_bid, self._top_of_book_tolerance) or
+                top_price_moved(self._best_ask, self._notified_best_ask, self._top_of_book_tolerance)):
+            self.c_trigger_top_of_book_changed(update_id)
+
+    cdef c_trigger_top_of_book_changed(self, int64_t update_id):
+        self._notified_best_bid = self._best_bid
+        self._notified_best_ask = self._best_ask
+        self.c_trigger_event(self.TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                             OrderBookTopOfBookChangedEvent(self._best_bid, self._best_ask, update_id))
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
+        self._trade_flow.c_add_trade(trade_event.timestamp,
+                                     trade_event.price,
+                                     trade_event.amount,
+                                     trade_event.type is TradeType.BUY)
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
     @property
@@ -150,6 +344,28 @@ cdef class OrderBook(PubSub):
     def last_trade_price(self, value: float):
         self._last_trade_price = value
 
+    @property
+    def top_of_book_tolerance(self) -> float:
+        """
+        Relative move of the best bid or ask, since the last TopOfBookChanged event, needed to trigger a new event.
+        With the default of 0 every change of the top of the book triggers an event.
+        """
+        return self._top_of_book_tolerance
+
+    @top_of_book_tolerance.setter
+    def top_of_book_tolerance(self, value: float):
+        if value < 0:
+            raise ValueError("The top of book tolerance can't be negative.")
+        self._top_of_book_tolerance = value
+
+    @property
+    def trade_flow(self) -> OrderBookTradeFlow:
+        """
+        Rolling aggregates of the trades applied to the book. No window is aggregated and no trade is kept until some
+        are configured, e.g. with `trade_flow.add_window(60)` or `trade_flow.history_size = 100`.
+        """
+        return self._trade_flow
+
     @property
     def last_applied_trade(self) -> float:
         return self._last_applied_trade
@@ -172,12 +388,68 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the order book without creating an OrderBookRow per level.
+
+        :param depth: the maximum number of levels to export from each side, all levels if None
+        :return: the bid and ask arrays, best price first, with the price, amount and update_id columns of OrderBookRow
+        """
+        cdef:
+            size_t max_levels = SIZE_MAX if depth is None else max(depth, 0)
+        return self.c_entries_to_numpy(False, max_levels), self.c_entries_to_numpy(True, max_levels)
+
+    def checksum(self,
+                 depth: int,
+                 level_format: Callable[[float, float], str] = checksum_level_format,
+                 interleave: bool = True,
+                 asks_first: bool = False,
+                 separator: str = ":") -> int:
+        """
+        Calculates the CRC32 checksum of the best levels of the book, to compare with the checksums published by
+        exchanges that support them.
+
+        :param depth: the number of levels of each side included in the checksum
+        :param level_format: formats the price and amount of a level the way the exchange does
+        :param interleave: if True levels are taken alternately from each side, otherwise one side after the other
+        :param asks_first: if True ask levels come before bid levels
+        :param separator: the string placed between the formatted levels
+        :return: the unsigned CRC32 of the formatted levels
+        """
+        return self.c_checksum(max(depth, 0), level_format, interleave, asks_first, separator)
+
+    cdef uint32_t c_checksum(self,
+                             size_t depth,
+                             object level_format,
+                             bint interleave,
+                             bint asks_first,
+                             str separator):
+        cdef:
+            np.ndarray[np.float64_t, ndim=2] first = self.c_entries_to_numpy(asks_first, depth)
+            np.ndarray[np.float64_t, ndim=2] second = self.c_entries_to_numpy(not asks_first, depth)
+            size_t first_levels = first.shape[0]
+            size_t second_levels = second.shape[0]
+            size_t index
+            list levels = []
+
+        if interleave:
+            for index in range(max(first_levels, second_levels)):
+                if index < first_levels:
+                    levels.append(level_format(first[index, 0], first[index, 1]))
+                if index < second_levels:
+                    levels.append(level_format(second[index, 0], second[index, 1]))
+        else:
+            for index in range(first_levels):
+                levels.append(level_format(first[index, 0], first[index, 1]))
+            for index in range(second_levels):
+                levels.append(level_format(second[index, 0], second[index, 1]))
+        return zlib.crc32(separator.join(levels).encode("utf-8"))
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -198,6 +470,100 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diff_messages(self,
+                            messages: List[OrderBookMessage],
+                            coalesce: bool = False,
+                            diff_window: Optional[OrderBookDiffWindow] = None) -> int:
+        """
+        Applies a batch of consecutive diff messages to the order book in a single update.
+
+        The level arrays of OrderBookDiffMessage diffs are copied and the price and amount strings of plain
+        OrderBookMessage diffs are parsed straight into the C++ entry buffers, without building the intermediate
+        OrderBookRow lists. Messages of connector specific subclasses are read through their own bids and asks
+        properties.
+
+        :param messages: the diff messages, in the order they were received
+        :param coalesce: if True, the messages are first merged into a single net diff keyed by price, where the
+        entry with the highest update id wins, so levels overwritten within the batch are only applied once
+        :param diff_window: if provided, the parsed messages are also added to it, to be replayed over later snapshots
+
+        :return: the number of price level updates dropped by coalescing
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t update_id = self._last_diff_uid
+            size_t entries_count
+            size_t bids_start
+            size_t asks_start
+            OrderBookDiffWindow window = diff_window
+
+        for message in messages:
+            update_id = message.update_id
+            bids_start = cpp_bids.size()
+            asks_start = cpp_asks.size()
+            if type(message) is OrderBookDiffMessage:
+                self.c_add_level_entries(ref(cpp_bids), message.bid_levels, update_id)
+                self.c_add_level_entries(ref(cpp_asks), message.ask_levels, update_id)
+            elif type(message) is OrderBookMessage:
+                for row in message.content["bids"]:
+                    cpp_bids.push_back(OrderBookEntry(float(row[0]), float(row[1]), update_id))
+                for row in message.content["asks"]:
+                    cpp_asks.push_back(OrderBookEntry(float(row[0]), float(row[1]), update_id))
+            else:
+                for row in message.bids:
+                    cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+                for row in message.asks:
+                    cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            if window is not None:
+                window.c_add_diff(update_id, ref(cpp_bids), bids_start, ref(cpp_asks), asks_start)
+
+        if not coalesce:
+            self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+            return 0
+
+        entries_count = cpp_bids.size() + cpp_asks.size()
+        cpp_bids = self.c_coalesce_entries(cpp_bids)
+        cpp_asks = self.c_coalesce_entries(cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+        return entries_count - cpp_bids.size() - cpp_asks.size()
+
+    cdef c_add_level_entries(self, vector[OrderBookEntry] *entries, array.array levels, int64_t update_id):
+        """
+        Adds the entries of a flat array of alternating prices and amounts to an entry buffer.
+        """
+        cdef:
+            Py_ssize_t i
+            Py_ssize_t levels_count = len(levels) // 2
+            double *values = levels.data.as_doubles
+
+        for i in range(levels_count):
+            deref(entries).push_back(OrderBookEntry(values[2 * i], values[2 * i + 1], update_id))
+
+    cdef vector[OrderBookEntry] c_coalesce_entries(self, vector[OrderBookEntry] entries):
+        """
+        Merges diff entries into one entry per price level. The entry with the highest update id wins, and later
+        entries win over earlier ones with the same update id.
+        """
+        cdef:
+            map[double, OrderBookEntry] net_entries
+            map[double, OrderBookEntry].iterator net_it
+            vector[OrderBookEntry] result
+
+        for entry in entries:
+            net_it = net_entries.find(entry.getPrice())
+            if net_it == net_entries.end():
+                net_entries.insert(pair[double, OrderBookEntry](entry.getPrice(), entry))
+            elif entry.getUpdateId() >= deref(net_it).second.getUpdateId():
+                deref(net_it).second = entry
+
+        result.reserve(net_entries.size())
+        net_it = net_entries.begin()
+        while net_it != net_entries.end():
+            result.push_back(deref(net_it).second)
+            inc(net_it)
+        return result
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -281,33 +647,149 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
-    def simulate_buy(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for ask_entry in self.ask_entries():
-            ask_entry = ask_entry
-            if ask_entry.amount < amount_left:
-                retval.append(ask_entry)
-                amount_left -= ask_entry.amount
+    cdef np.ndarray c_entries_to_numpy(self, bint is_buy, size_t depth):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            size_t levels = min(depth, deref(book).size())
+            np.ndarray[np.float64_t, ndim=2] result = np.empty((levels, 3), dtype="float64")
+            set[OrderBookEntry].iterator it = deref(book).begin() if is_buy else deref(book).end()
+            OrderBookEntry entry
+            size_t index
+
+        # Asks are exported from the start and bids from the end of their sets, so both arrays start at the best price.
+        for index in range(levels):
+            if is_buy:
+                entry = deref(it)
+                inc(it)
             else:
-                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
-                amount_left = 0.0
-                break
-        return retval
+                dec(it)
+                entry = deref(it)
+            result[index, 0] = entry.getPrice()
+            result[index, 1] = entry.getAmount()
+            result[index, 2] = entry.getUpdateId()
+        return result
+
+    cdef OrderBookSimulationResult c_simulate_trade(self, bint is_buy, double amount):
+        return self.c_simulate_trades(is_buy, np.array([amount], dtype="float64"))[0]
+
+    cdef list c_simulate_trades(self, bint is_buy, np.ndarray amounts):
+        """
+        Simulates market orders of several amounts in a single sweep of the book, each amount continuing the sweep
+        from the level reached by the previous one.
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] query_amounts = np.ascontiguousarray(amounts, dtype="float64").ravel()
+            size_t query_count = query_amounts.shape[0]
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry].iterator it = deref(book).begin() if is_buy else deref(book).end()
+            size_t remaining_levels = deref(book).size()
+            double best_price = NaN
+            vector[double] prices
+            vector[double] level_amounts
+            vector[int64_t] update_ids
+            double total_amount = 0
+            double total_cost = 0
+            OrderBookEntry entry
+            size_t index
+            list results = []
+
+        if remaining_levels > 0:
+            best_price = self._best_ask if is_buy else self._best_bid
+        for index in range(query_count):
+            if index > 0 and query_amounts[index] < query_amounts[index - 1]:
+                raise ValueError("The amounts must be sorted in ascending order.")
+            # Asks are read from the start and bids from the end of their sets, so both start at the best price.
+            while total_amount < query_amounts[index] and remaining_levels > 0:
+                if is_buy:
+                    entry = deref(it)
+                    inc(it)
+                else:
+                    dec(it)
+                    entry = deref(it)
+                remaining_levels -= 1
+                prices.push_back(entry.getPrice())
+                level_amounts.push_back(entry.getAmount())
+                update_ids.push_back(entry.getUpdateId())
+                total_amount += entry.getAmount()
+                total_cost += entry.getPrice() * entry.getAmount()
+            results.append(self.c_simulation_result(is_buy, query_amounts[index], best_price, ref(prices),
+                                                    ref(level_amounts), ref(update_ids), total_amount, total_cost))
+        return results
+
+    cdef OrderBookSimulationResult c_simulation_result(self,
+                                                       bint is_buy,
+                                                       double amount,
+                                                       double best_price,
+                                                       vector[double] *prices,
+                                                       vector[double] *level_amounts,
+                                                       vector[int64_t] *update_ids,
+                                                       double total_amount,
+                                                       double total_cost):
+        """
+        Builds the result of a simulated market order from the levels swept to fill it. Only the part of the last
+        level needed to reach the amount is filled.
+        """
+        cdef:
+            size_t levels = deref(prices).size()
+            np.ndarray[np.float64_t, ndim=1] result_prices = np.empty(levels, dtype="float64")
+            np.ndarray[np.float64_t, ndim=1] result_amounts = np.empty(levels, dtype="float64")
+            np.ndarray[np.int64_t, ndim=1] result_update_ids = np.empty(levels, dtype="int64")
+            double average_price = NaN
+            double slippage_bps = NaN
+            size_t index
+
+        for index in range(levels):
+            result_prices[index] = deref(prices)[index]
+            result_amounts[index] = deref(level_amounts)[index]
+            result_update_ids[index] = deref(update_ids)[index]
+        if total_amount > amount and levels > 0:
+            result_amounts[levels - 1] = amount - (total_amount - deref(level_amounts)[levels - 1])
+            total_cost -= (total_amount - amount) * deref(prices)[levels - 1]
+            total_amount = amount
+        if total_amount > 0:
+            average_price = total_cost / total_amount
+            slippage_bps = (average_price - best_price if is_buy else best_price - average_price) / best_price * 1e4
+        return OrderBookSimulationResult(is_buy, amount, result_prices, result_amounts, result_update_ids,
+                                         total_amount, total_cost, average_price, slippage_bps)
+
+    def simulate_trade(self, is_buy: bool, amount: float) -> OrderBookSimulationResult:
+        """
+        Simulates a market order against the book, without changing it.
+
+        :param is_buy: True to simulate a buy order filled by the asks, False a sell order filled by the bids
+        :param amount: the base amount of the order
+        :return: the filled levels, the filled amount, the total cost, the average price and the slippage in basis
+        points of the average price from the best price. The filled amount is lower than the order amount if the side
+        of the book is not deep enough.
+        """
+        return self.c_simulate_trade(is_buy, amount)
+
+    def simulate_trades(self, is_buy: bool, amounts: Sequence[float]) -> List[OrderBookSimulationResult]:
+        """
+        Simulates market orders of several amounts in a single sweep of the book.
+
+        :param is_buy: True to simulate buy orders filled by the asks, False sell orders filled by the bids
+        :param amounts: the base amounts of the orders, sorted in ascending order
+        :return: the simulation result of each amount
+        """
+        return self.c_simulate_trades(is_buy, np.asarray(amounts, dtype="float64"))
+
+    cdef list c_simulate_rows(self, bint is_buy, double amount):
+        """
+        Levels filled by a simulated market order. An order with no amount to fill is quoted as an empty fill of the
+        best level, so the rows always hold the price the order would start filling at.
+        """
+        cdef list rows = self.c_simulate_trade(is_buy, amount).rows()
+        if len(rows) == 0 and amount <= 0:
+            for entry in (self.ask_entries() if is_buy else self.bid_entries()):
+                return [OrderBookRow(entry.price, amount, entry.update_id)]
+        return rows
+
+    def simulate_buy(self, amount: float) -> List[OrderBookRow]:
+        return self.c_simulate_rows(True, amount)
 
     def simulate_sell(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for bid_entry in self.bid_entries():
-            bid_entry = bid_entry
-            if bid_entry.amount < amount_left:
-                retval.append(bid_entry)
-                amount_left -= bid_entry.amount
-            else:
-                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
-                amount_left = 0.0
-                break
-        return retval
+        return self.c_simulate_rows(False, amount)
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
@@ -319,145 +801,299 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_index_valid = False
+        self._ask_depth_index_valid = False
+
+    cdef c_build_depth_index(self, bint is_buy):
+        """
+        Rebuilds the cumulative depth index of one side of the book, ordered from the best price outwards.
+
+        For each level i the index stores the level price, and the cumulative base and quote volumes of levels 0..i.
+        """
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+            vector[double] *cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            double base_volume = 0
+            double quote_volume = 0
+
+        deref(prices).clear()
+        deref(cum_base).clear()
+        deref(cum_quote).clear()
+        if is_buy:
+            deref(prices).reserve(self._ask_book.size())
+            deref(cum_base).reserve(self._ask_book.size())
+            deref(cum_quote).reserve(self._ask_book.size())
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                base_volume += entry.getAmount()
+                quote_volume += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cum_base).push_back(base_volume)
+                deref(cum_quote).push_back(quote_volume)
+                inc(ask_it)
+        else:
+            deref(prices).reserve(self._bid_book.size())
+            deref(cum_base).reserve(self._bid_book.size())
+            deref(cum_quote).reserve(self._bid_book.size())
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                base_volume += entry.getAmount()
+                quote_volume += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cum_base).push_back(base_volume)
+                deref(cum_quote).push_back(quote_volume)
+                inc(bid_it)
+
+    cdef c_ensure_depth_index(self, bint is_buy):
+        if is_buy and not self._ask_depth_index_valid:
+            self.c_build_depth_index(True)
+            self._ask_depth_index_valid = True
+        elif not is_buy and not self._bid_depth_index_valid:
+            self.c_build_depth_index(False)
+            self._bid_depth_index_valid = True
+
+    cdef size_t c_depth_index_search(self, vector[double] *cumulative, double target):
+        """
+        Returns the index of the first level whose cumulative volume reaches the target, or the number of levels if
+        the whole side of the book is not enough.
+        """
+        cdef:
+            size_t low = 0
+            size_t high = deref(cumulative).size()
+            size_t middle
+
+        while low < high:
+            middle = low + (high - low) // 2
+            if deref(cumulative)[middle] >= target:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+
+        index = self.c_depth_index_search(cum_base, volume)
+        if index < deref(cum_base).size():
+            result_price = deref(prices)[index]
+            cumulative_volume = deref(cum_base)[index]
+        elif deref(cum_base).size() > 0:
+            cumulative_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+        cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+
+        index = self.c_depth_index_search(cum_base, volume)
+        if index < deref(cum_base).size():
+            if index > 0:
+                total_cost = deref(cum_quote)[index - 1]
+                total_volume = deref(cum_base)[index - 1]
+            # Only the part of the last level needed to reach the volume is taken.
+            total_cost += (volume - total_volume) * deref(prices)[index]
+            total_volume += volume - total_volume
+            result_vwap = total_cost / total_volume
+        elif deref(cum_base).size() > 0:
+            total_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
+    cdef tuple c_get_prices_and_vwaps_for_volumes(self, bint is_buy, np.ndarray volumes):
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] query_volumes = np.ascontiguousarray(volumes, dtype="float64").ravel()
+            size_t query_count = query_volumes.shape[0]
+            np.ndarray[np.float64_t, ndim=1] result_prices = np.full(query_count, NaN, dtype="float64")
+            np.ndarray[np.float64_t, ndim=1] result_vwaps = np.full(query_count, NaN, dtype="float64")
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t levels
+            size_t level = 0
+            size_t index
+            double volume
+            double total_cost = 0
+            double total_volume = 0
+
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+        cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+        levels = deref(cum_base).size()
+
+        for index in range(query_count):
+            volume = query_volumes[index]
+            if index > 0 and volume < query_volumes[index - 1]:
+                raise ValueError("The volumes must be sorted in ascending order.")
+            if isnan(volume):
+                continue
+            # Each volume continues the sweep from the level reached by the previous one.
+            while level < levels and deref(cum_base)[level] < volume:
+                level += 1
+            if level == levels:
+                break
+            result_prices[index] = deref(prices)[level]
+            total_cost = total_volume = 0
+            if level > 0:
+                total_cost = deref(cum_quote)[level - 1]
+                total_volume = deref(cum_base)[level - 1]
+            # Only the part of the last level needed to reach the volume is taken.
+            total_cost += (volume - total_volume) * deref(prices)[level]
+            result_vwaps[index] = total_cost / volume if volume > 0 else deref(prices)[level]
+
+        return result_prices, result_vwaps
+
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+
+        index = self.c_depth_index_search(cum_quote, quote_volume)
+        if index < deref(cum_quote).size():
+            result_price = deref(prices)[index]
+            cumulative_volume = deref(cum_quote)[index]
+        elif deref(cum_quote).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+        cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+
+        index = self.c_depth_index_search(cum_base, base_amount)
+        if index < deref(cum_base).size():
+            if index > 0:
+                cumulative_volume = deref(cum_quote)[index - 1]
+                cumulative_base_amount = deref(cum_base)[index - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[index]
+        elif deref(cum_quote).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
+    cdef size_t c_depth_index_price_search(self, bint is_buy, double price):
+        """
+        Returns the number of levels, from the best price outwards, priced at or better than the price.
+        """
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            size_t low = 0
+            size_t high = deref(prices).size()
+            size_t middle
+
+        # Ask prices are ascending and bid prices descending in the index
+        while low < high:
+            middle = low + (high - low) // 2
+            if (deref(prices)[middle] > price) if is_buy else (deref(prices)[middle] < price):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+
+        levels = self.c_depth_index_price_search(is_buy, price)
+        if levels > 0:
+            result_price = deref(prices)[levels - 1]
+            cumulative_volume = deref(cum_base)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+
+        levels = self.c_depth_index_price_search(is_buy, price)
+        if levels > 0:
+            result_price = deref(prices)[levels - 1]
+            cumulative_volume = deref(cum_quote)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef np.ndarray c_get_volumes_for_prices(self, bint is_buy, np.ndarray prices, bint quote_volume):
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] query_prices = np.ascontiguousarray(prices, dtype="float64").ravel()
+            size_t query_count = query_prices.shape[0]
+            np.ndarray[np.float64_t, ndim=1] result = np.zeros(query_count, dtype="float64")
+            vector[double] *cumulative
+            size_t index
+            size_t levels
+
+        self.c_ensure_depth_index(is_buy)
+        if quote_volume:
+            cumulative = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+        else:
+            cumulative = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+        for index in range(query_count):
+            levels = self.c_depth_index_price_search(is_buy, query_prices[index])
+            if levels > 0:
+                result[index] = deref(cumulative)[levels - 1]
+        return result
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -467,6 +1103,19 @@ cdef class OrderBook(PubSub):
     def get_price_for_quote_volume(self, is_buy: bool, quote_volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_quote_volume(is_buy, quote_volume)
 
+    def get_prices_and_vwaps_for_volumes(self,
+                                         is_buy: bool,
+                                         volumes: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Queries the fill price and VWAP of several volumes in a single sweep of the book.
+
+        :param is_buy: True to query the ask side, False to query the bid side
+        :param volumes: the base volumes, sorted in ascending order
+        :return: the price of the last level needed to fill each volume and the VWAP of each volume, NaN for the
+        volumes larger than the side of the book
+        """
+        return self.c_get_prices_and_vwaps_for_volumes(is_buy, np.asarray(volumes, dtype="float64"))
+
     def get_quote_volume_for_base_amount(self, is_buy: bool, base_amount: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_base_amount(is_buy, base_amount)
 
@@ -476,6 +1125,17 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_volumes_for_prices(self, is_buy: bool, prices: Sequence[float], quote_volume: bool = False) -> np.ndarray:
+        """
+        Queries the volume available up to several prices in one call.
+
+        :param is_buy: True to query the ask side, False to query the bid side
+        :param prices: the limit prices
+        :param quote_volume: if True the volumes are in quote currency, otherwise in base currency
+        :return: for each price, the cumulative volume of the levels priced at or better than it
+        """
+        return self.c_get_volumes_for_prices(is_buy, np.asarray(prices, dtype="float64"), quote_volume)
+
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
@@ -490,3 +1150,21 @@ cdef class OrderBook(PubSub):
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
             self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+    def restore_from_snapshot_and_diff_window(self, snapshot: OrderBookMessage, diff_window: OrderBookDiffWindow) -> int:
+        """
+        Applies the snapshot, then replays in a single update the diffs of the window newer than the snapshot.
+
+        :return: the number of diffs replayed
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            size_t position = diff_window.c_replay_position(snapshot.update_id)
+            int64_t update_id
+
+        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        if position < len(diff_window):
+            update_id = diff_window.c_collect_diffs(position, ref(cpp_bids), ref(cpp_asks))
+            self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+        return len(diff_window) - position
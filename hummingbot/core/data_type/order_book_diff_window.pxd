@@ -0,0 +1,29 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.deque cimport deque
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+
+cdef class OrderBookDiffWindow:
+    cdef deque[int64_t] _update_ids
+    cdef deque[size_t] _bid_counts
+    cdef deque[size_t] _ask_counts
+    cdef deque[OrderBookEntry] _bids
+    cdef deque[OrderBookEntry] _asks
+    cdef size_t _capacity
+    cdef int64_t _last_evicted_update_id
+
+    cdef c_add_diff(self,
+                    int64_t update_id,
+                    vector[OrderBookEntry] *bids,
+                    size_t bids_start,
+                    vector[OrderBookEntry] *asks,
+                    size_t asks_start)
+    cdef c_evict_diffs(self, size_t size)
+    cdef size_t c_replay_position(self, int64_t update_id)
+    cdef int64_t c_collect_diffs(self,
+                                 size_t position,
+                                 vector[OrderBookEntry] *bids,
+                                 vector[OrderBookEntry] *asks)
@@ -0,0 +1,127 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from typing import List
+
+
+cdef class OrderBookDiffWindow:
+    """
+    Ring buffer of the latest diffs applied to an order book, kept to replay them over a new snapshot.
+
+    The diffs are stored already parsed, in columnar form: the update ids and the number of bid and ask entries of
+    each diff, and the entries of all the diffs in a single buffer per side. Diffs are expected in the order they were
+    received, with non-decreasing update ids, so the ones newer than a snapshot are found with a binary search.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: the number of diffs kept, older diffs are evicted when new ones are added
+        """
+        self._capacity = max(capacity, 1)
+        self._last_evicted_update_id = -1
+
+    def __len__(self) -> int:
+        return self._update_ids.size()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int):
+        self._capacity = max(value, 1)
+        self.c_evict_diffs(self._capacity)
+
+    @property
+    def update_ids(self) -> List[int]:
+        return [update_id for update_id in self._update_ids]
+
+    @property
+    def last_evicted_update_id(self) -> int:
+        """
+        Update id of the last diff dropped from the window, -1 if none was dropped. Replaying the window over a
+        snapshot older than this misses diffs.
+        """
+        return self._last_evicted_update_id
+
+    def clear(self):
+        self._update_ids.clear()
+        self._bid_counts.clear()
+        self._ask_counts.clear()
+        self._bids.clear()
+        self._asks.clear()
+        self._last_evicted_update_id = -1
+
+    cdef c_add_diff(self,
+                    int64_t update_id,
+                    vector[OrderBookEntry] *bids,
+                    size_t bids_start,
+                    vector[OrderBookEntry] *asks,
+                    size_t asks_start):
+        """
+        Adds the entries of a diff, taken from bids_start and asks_start to the end of the bids and asks vectors.
+        """
+        cdef:
+            size_t index
+
+        for index in range(bids_start, bids.size()):
+            self._bids.push_back(bids[0][index])
+        for index in range(asks_start, asks.size()):
+            self._asks.push_back(asks[0][index])
+        self._update_ids.push_back(update_id)
+        self._bid_counts.push_back(bids.size() - bids_start)
+        self._ask_counts.push_back(asks.size() - asks_start)
+        self.c_evict_diffs(self._capacity)
+
+    cdef c_evict_diffs(self, size_t size):
+        cdef:
+            size_t index
+
+        while self._update_ids.size() > size:
+            for index in range(self._bid_counts.front()):
+                self._bids.pop_front()
+            for index in range(self._ask_counts.front()):
+                self._asks.pop_front()
+            self._last_evicted_update_id = self._update_ids.front()
+            self._update_ids.pop_front()
+            self._bid_counts.pop_front()
+            self._ask_counts.pop_front()
+
+    cdef size_t c_replay_position(self, int64_t update_id):
+        """
+        Returns the position of the first diff with an update id greater than update_id.
+        """
+        cdef:
+            size_t low = 0
+            size_t high = self._update_ids.size()
+            size_t middle
+
+        while low < high:
+            middle = low + (high - low) // 2
+            if self._update_ids[middle] <= update_id:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    cdef int64_t c_collect_diffs(self,
+                                 size_t position,
+                                 vector[OrderBookEntry] *bids,
+                                 vector[OrderBookEntry] *asks):
+        """
+        Appends the entries of the diffs from position onwards to bids and asks, and returns the update id of the last
+        diff.
+        """
+        cdef:
+            size_t bids_offset = 0
+            size_t asks_offset = 0
+            size_t index
+
+        for index in range(position):
+            bids_offset += self._bid_counts[index]
+            asks_offset += self._ask_counts[index]
+        for index in range(bids_offset, self._bids.size()):
+            bids.push_back(self._bids[index])
+        for index in range(asks_offset, self._asks.size()):
+            asks.push_back(self._asks[index])
+        return self._update_ids.back()
@@ -1,7 +1,9 @@
+import time
+from array import array
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -95,3 +97,117 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+@total_ordering
+class OrderBookDiffMessage:
+    """
+    Compact order book diff message. The price levels are parsed once, when the message is created, into flat arrays
+    of doubles holding the price and amount of each level one after the other. The message has the same interface as
+    a diff OrderBookMessage, and the content dict of the OrderBookMessage format is only built when it is requested.
+    """
+    __slots__ = ("trading_pair", "update_id", "first_update_id", "timestamp", "checksum", "bid_levels", "ask_levels")
+
+    def __init__(
+        self,
+        trading_pair: str,
+        update_id: int,
+        bids: Iterable[Sequence[Any]],
+        asks: Iterable[Sequence[Any]],
+        timestamp: Optional[float] = None,
+        first_update_id: Optional[int] = None,
+        checksum: Optional[int] = None,
+    ):
+        """
+        :param trading_pair: the trading pair of the order book
+        :param update_id: the update id of the diff
+        :param bids: the bid levels, as [price, amount, ...] rows of numbers or number strings
+        :param asks: the ask levels, as [price, amount, ...] rows of numbers or number strings
+        :param timestamp: the timestamp of the diff, defaults to the current time so the messages can always be ordered
+        :param first_update_id: the first update id covered by the diff, defaults to the update id
+        :param checksum: the exchange order book checksum published with the diff, if any
+        """
+        self.trading_pair: str = trading_pair
+        self.update_id: int = update_id
+        self.first_update_id: int = update_id if first_update_id is None else first_update_id
+        self.timestamp: float = time.time() if timestamp is None else timestamp
+        self.checksum: Optional[int] = checksum
+        self.bid_levels: array = self._levels_array(bids)
+        self.ask_levels: array = self._levels_array(asks)
+
+    @classmethod
+    def from_order_book_message(cls, message: OrderBookMessage) -> "OrderBookDiffMessage":
+        return cls(trading_pair=message.trading_pair,
+                   update_id=message.update_id,
+                   bids=[(row.price, row.amount) for row in message.bids],
+                   asks=[(row.price, row.amount) for row in message.asks],
+                   timestamp=message.timestamp,
+                   first_update_id=message.first_update_id,
+                   checksum=message.content.get("checksum"))
+
+    @staticmethod
+    def _levels_array(rows: Iterable[Sequence[Any]]) -> array:
+        levels = array("d")
+        for price, amount, *trash in rows:
+            levels.append(float(price))
+            levels.append(float(amount))
+        return levels
+
+    @property
+    def type(self) -> OrderBookMessageType:
+        return OrderBookMessageType.DIFF
+
+    @property
+    def trade_id(self) -> int:
+        return -1
+
+    @property
+    def has_update_id(self) -> bool:
+        return True
+
+    @property
+    def has_trade_id(self) -> bool:
+        return False
+
+    @property
+    def content(self) -> Dict[str, any]:
+        content = {
+            "trading_pair": self.trading_pair,
+            "update_id": self.update_id,
+            "first_update_id": self.first_update_id,
+            "bids": [[price, amount] for price, amount in self._level_pairs(self.bid_levels)],
+            "asks": [[price, amount] for price, amount in self._level_pairs(self.ask_levels)],
+        }
+        if self.checksum is not None:
+            content["checksum"] = self.checksum
+        return content
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount in self._level_pairs(self.ask_levels)]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount in self._level_pairs(self.bid_levels)]
+
+    @staticmethod
+    def _level_pairs(levels: array) -> Iterator[Tuple[float, float]]:
+        return zip(levels[0::2], levels[1::2])
+
+    def to_order_book_message(self) -> OrderBookMessage:
+        """
+        :return: the diff as a plain OrderBookMessage, for the code that requires one
+        """
+        return OrderBookMessage(OrderBookMessageType.DIFF, self.content, timestamp=self.timestamp)
+
+    # Diff messages compare the same way whatever their representation
+    __eq__ = OrderBookMessage.__eq__
+    __lt__ = OrderBookMessage.__lt__
+
+    def __hash__(self):
+        return hash((self.type, self.update_id, self.trade_id))
+
+    def __repr__(self) -> str:
+        return (f"OrderBookDiffMessage(trading_pair={self.trading_pair!r}, update_id={self.update_id}, "
+                f"first_update_id={self.first_update_id}, timestamp={self.timestamp}, "
+                f"bids={len(self.bid_levels) // 2}, asks={len(self.ask_levels) // 2})")
@@ -0,0 +1,304 @@
+import json
+import os
+import struct
+import threading
+import zlib
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookDiffMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+
+FILE_MAGIC = b"HBOBMSG1"
+CHUNK_HEADER = struct.Struct("<I")
+CHUNK_COUNTS = struct.Struct("<III")
+
+HAS_CHECKSUM = 1
+# The update ids of the message are floats (e.g. exchanges using timestamps as update ids), stored with their bits
+FLOAT_UPDATE_IDS = 2
+
+# Columns with one value per message, in the order they are stored in a chunk
+MESSAGE_COLUMNS = (
+    ("types", "B"),
+    ("flags", "B"),
+    ("trade_types", "B"),
+    ("trading_pairs", "H"),
+    ("bid_counts", "I"),
+    ("ask_counts", "I"),
+    ("timestamps", "d"),
+    ("update_ids", "q"),
+    ("first_update_ids", "q"),
+    ("checksums", "q"),
+)
+# A message row, used to check the values of a message fit their columns before appending any of them
+MESSAGE_ROW = struct.Struct("<" + "".join(type_code for _, type_code in MESSAGE_COLUMNS))
+FLOAT_BITS = struct.Struct("<d")
+INTEGER_BITS = struct.Struct("<q")
+
+
+def _float_to_integer_bits(value: float) -> int:
+    return INTEGER_BITS.unpack(FLOAT_BITS.pack(value))[0]
+
+
+def _integer_bits_to_float(value: int) -> float:
+    return FLOAT_BITS.unpack(INTEGER_BITS.pack(value))[0]
+
+
+class OrderBookMessageRecorder:
+    """
+    Records order book messages to an append-only file of compressed chunks. Each chunk stores its messages in columns,
+    one array per message field plus the price and amount of all the levels, so the chunks compress well and are read
+    back without parsing each message.
+    Trades are stored as a single level holding the trade price and amount.
+
+    The chunks are compressed and written by a writer thread of the recorder, one at a time and in order, so recording
+    doesn't block the event loop. The file is opened on the first write and reopened if the recorder is used again
+    after being closed.
+    """
+    CHUNK_SIZE: int = 1000
+
+    _instances: Dict[str, "OrderBookMessageRecorder"] = {}
+    _instances_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, path: str) -> "OrderBookMessageRecorder":
+        """
+        Returns the process wide recorder of the file. The trackers recording to the same file share it, so they
+        write through a single handle and their chunks are never interleaved.
+        """
+        path = os.path.abspath(path)
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE):
+        """
+        :param path: the recording file, the messages are appended to it if it already exists
+        :param chunk_size: the number of messages per chunk
+        """
+        self._path: str = path
+        self._chunk_size: int = chunk_size
+        self._file: Optional[BinaryIO] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._last_write: Optional[Future] = None
+        self._recorded_messages: int = 0
+        self._reset_chunk()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def recorded_messages(self) -> int:
+        return self._recorded_messages
+
+    def _reset_chunk(self):
+        self._columns: Dict[str, array] = {name: array(type_code) for name, type_code in MESSAGE_COLUMNS}
+        self._levels: array = array("d")
+        self._trading_pair_indexes: Dict[str, int] = {}
+        self._trade_ids: List[Union[int, str]] = []
+        self._chunk_messages: int = 0
+
+    def record(self, message: Union[OrderBookMessage, OrderBookDiffMessage]):
+        """
+        Records a message. The values of the message are all checked before it is added to the chunk, so a message
+        that can't be recorded raises without leaving a partial row behind.
+        """
+        trading_pair = message.trading_pair
+        flags = 0
+        trade_type = 0
+        checksum = None
+        trade_id = None
+        update_id = message.update_id
+        first_update_id = message.first_update_id
+        if type(message) is OrderBookDiffMessage:
+            bid_count = len(message.bid_levels) // 2
+            ask_count = len(message.ask_levels) // 2
+            levels = (message.bid_levels, message.ask_levels)
+            checksum = message.checksum
+        elif message.type is OrderBookMessageType.TRADE:
+            bid_count, ask_count = 1, 0
+            levels = ((float(message.content["price"]), float(message.content["amount"])),)
+            trade_type = int(float(message.content["trade_type"]))
+            update_id = message.content.get("update_id", -1)
+            trade_id = message.trade_id
+        else:
+            bids = message.bids
+            asks = message.asks
+            bid_count, ask_count = len(bids), len(asks)
+            levels = ([value for row in bids for value in (row.price, row.amount)],
+                      [value for row in asks for value in (row.price, row.amount)])
+            if message.type is OrderBookMessageType.DIFF:
+                checksum = message.content.get("checksum")
+
+        if checksum is not None:
+            flags |= HAS_CHECKSUM
+        if isinstance(update_id, float) or isinstance(first_update_id, float):
+            flags |= FLOAT_UPDATE_IDS
+            update_id = _float_to_integer_bits(float(update_id))
+            first_update_id = _float_to_integer_bits(float(first_update_id))
+        row = (message.type.value,
+               flags,
+               trade_type,
+               self._trading_pair_indexes.get(trading_pair, len(self._trading_pair_indexes)),
+               bid_count,
+               ask_count,
+               message.timestamp if message.timestamp is not None else float("NaN"),
+               update_id,
+               first_update_id,
+               checksum if checksum is not None else 0)
+        # Raises if a value doesn't fit its column
+        MESSAGE_ROW.pack(*row)
+
+        self._trading_pair_indexes.setdefault(trading_pair, row[3])
+        for (name, _), value in zip(MESSAGE_COLUMNS, row):
+            self._columns[name].append(value)
+        for side_levels in levels:
+            self._levels.extend(side_levels)
+        if trade_id is not None:
+            self._trade_ids.append(trade_id)
+        self._chunk_messages += 1
+        self._recorded_messages += 1
+        if self._chunk_messages >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> Optional[Future]:
+        """
+        Writes the recorded messages not written yet as a new chunk. The chunk is compressed and written by the writer
+        thread.
+
+        :return: the future of the last chunk write, if any chunk was written
+        """
+        if self._last_write is not None and self._last_write.done() and self._last_write.exception() is not None:
+            # The chunks are written in the background, their errors are raised by the next flush
+            failed_write, self._last_write = self._last_write, None
+            raise failed_write.exception()
+        if self._chunk_messages > 0:
+            strings = json.dumps({"trading_pairs": list(self._trading_pair_indexes.keys()),
+                                  "trade_ids": self._trade_ids}).encode("utf8")
+            payload = b"".join(
+                [CHUNK_COUNTS.pack(self._chunk_messages, len(self._levels) // 2, len(strings)), strings]
+                + [self._columns[name].tobytes() for name, _ in MESSAGE_COLUMNS]
+                + [self._levels.tobytes()])
+            self._reset_chunk()
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order_book_recorder")
+            self._last_write = self._writer.submit(self._write_chunk, payload)
+        return self._last_write
+
+    def _write_chunk(self, payload: bytes):
+        compressed_payload = zlib.compress(payload)
+        if self._file is None:
+            self._file = open(self._path, "ab")
+        # The magic is written along with the first chunk, so a new file never holds it without a chunk
+        header = FILE_MAGIC if self._file.tell() == 0 else b""
+        self._file.write(header + CHUNK_HEADER.pack(len(compressed_payload)) + compressed_payload)
+        self._file.flush()
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """
+        Writes the recorded messages not written yet, and closes the file once all the chunks are written
+        """
+        self.flush()
+        if self._writer is not None:
+            self._writer.submit(self._close_file)
+            self._writer.shutdown(wait=True)
+            self._writer = None
+            self._last_write = None
+
+    def __enter__(self) -> "OrderBookMessageRecorder":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def read_order_book_messages(path: str) -> Iterator[Union[OrderBookMessage, OrderBookDiffMessage]]:
+    """
+    Reads the order book messages of a recording file, in the order they were recorded. The diff messages are read as
+    OrderBookDiffMessage.
+    """
+    with open(path, "rb") as recording:
+        if recording.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError(f"{path} is not an order book messages recording.")
+        file_size = os.fstat(recording.fileno()).st_size
+        while recording.tell() + CHUNK_HEADER.size <= file_size:
+            compressed_size, = CHUNK_HEADER.unpack(recording.read(CHUNK_HEADER.size))
+            compressed_payload = recording.read(compressed_size)
+            if len(compressed_payload) < compressed_size:
+                # The last chunk was not completely written
+                return
+            yield from _chunk_messages(zlib.decompress(compressed_payload))
+
+
+def _chunk_messages(payload: bytes) -> Iterator[Union[OrderBookMessage, OrderBookDiffMessage]]:
+    message_count, level_count, strings_size = CHUNK_COUNTS.unpack_from(payload)
+    offset = CHUNK_COUNTS.size
+    strings = json.loads(payload[offset:offset + strings_size].decode("utf8"))
+    offset += strings_size
+    columns = {}
+    for name, type_code in MESSAGE_COLUMNS:
+        columns[name] = np.frombuffer(payload, dtype=np.dtype(type_code), count=message_count, offset=offset).tolist()
+        offset += message_count * np.dtype(type_code).itemsize
+    levels = memoryview(payload)[offset:offset + level_count * 16]
+
+    trading_pairs = strings["trading_pairs"]
+    trade_ids = iter(strings["trade_ids"])
+    level_index = 0
+    for index in range(message_count):
+        message_type = OrderBookMessageType(columns["types"][index])
+        trading_pair = trading_pairs[columns["trading_pairs"][index]]
+        timestamp = columns["timestamps"][index]
+        update_id = columns["update_ids"][index]
+        first_update_id = columns["first_update_ids"][index]
+        flags = columns["flags"][index]
+        if flags & FLOAT_UPDATE_IDS:
+            update_id = _integer_bits_to_float(update_id)
+            first_update_id = _integer_bits_to_float(first_update_id)
+        bids_end = level_index + columns["bid_counts"][index]
+        asks_end = bids_end + columns["ask_counts"][index]
+        if message_type is OrderBookMessageType.DIFF:
+            message = OrderBookDiffMessage(trading_pair=trading_pair,
+                                           update_id=update_id,
+                                           bids=(),
+                                           asks=(),
+                                           timestamp=timestamp,
+                                           first_update_id=first_update_id,
+                                           checksum=columns["checksums"][index] if flags & HAS_CHECKSUM else None)
+            message.bid_levels.frombytes(levels[level_index * 16:bids_end * 16])
+            message.ask_levels.frombytes(levels[bids_end * 16:asks_end * 16])
+        else:
+            level_values = array("d")
+            level_values.frombytes(levels[level_index * 16:asks_end * 16])
+            if message_type is OrderBookMessageType.TRADE:
+                message = OrderBookMessage(message_type, {
+                    "trading_pair": trading_pair,
+                    "trade_type": float(columns["trade_types"][index]),
+                    "trade_id": next(trade_ids),
+                    "update_id": update_id,
+                    "price": level_values[0],
+                    "amount": level_values[1],
+                }, timestamp=timestamp)
+            else:
+                bid_values = level_values[:(bids_end - level_index) * 2]
+                ask_values = level_values[(bids_end - level_index) * 2:]
+                message = OrderBookMessage(message_type, {
+                    "trading_pair": trading_pair,
+                    "update_id": update_id,
+                    "bids": [[price, amount] for price, amount in zip(bid_values[0::2], bid_values[1::2])],
+                    "asks": [[price, amount] for price, amount in zip(ask_values[0::2], ask_values[1::2])],
+                }, timestamp=timestamp)
+        level_index = asks_end
+        yield message
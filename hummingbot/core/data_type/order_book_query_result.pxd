@@ -14,3 +14,16 @@ cdef class ClientOrderBookQueryResult:
         public object query_volume
         public object result_price
         public object result_volume
+
+
+cdef class OrderBookSimulationResult:
+    cdef:
+        public bint is_buy
+        public double query_amount
+        public object prices
+        public object amounts
+        public object update_ids
+        public double filled_amount
+        public double total_cost
+        public double average_price
+        public double slippage_bps
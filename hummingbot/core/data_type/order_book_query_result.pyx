@@ -1,5 +1,10 @@
 # distutils: language=c++
 
+from typing import List
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
 cdef class OrderBookQueryResult:
     def __cinit__(self, double query_price, double query_volume, double result_price, double result_volume):
         self.query_price = query_price
@@ -14,3 +19,35 @@ cdef class ClientOrderBookQueryResult:
         self.query_volume = query_volume
         self.result_price = result_price
         self.result_volume = result_volume
+
+
+cdef class OrderBookSimulationResult:
+    """
+    Result of a simulated market order. The levels it fills are kept as parallel arrays of prices, filled amounts
+    and update ids, from the best price to the worst one.
+    """
+    def __cinit__(self,
+                  bint is_buy,
+                  double query_amount,
+                  object prices,
+                  object amounts,
+                  object update_ids,
+                  double filled_amount,
+                  double total_cost,
+                  double average_price,
+                  double slippage_bps):
+        self.is_buy = is_buy
+        self.query_amount = query_amount
+        self.prices = prices
+        self.amounts = amounts
+        self.update_ids = update_ids
+        self.filled_amount = filled_amount
+        self.total_cost = total_cost
+        self.average_price = average_price
+        self.slippage_bps = slippage_bps
+
+    def rows(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, update_id)
+                for price, amount, update_id in zip(self.prices.tolist(),
+                                                    self.amounts.tolist(),
+                                                    self.update_ids.tolist())]
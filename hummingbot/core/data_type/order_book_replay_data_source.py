@@ -0,0 +1,113 @@
+import asyncio
+import math
+from typing import Any, Dict, List, Optional, Set
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_recorder import read_order_book_messages
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Data source replaying the order book messages recorded by an OrderBookMessageRecorder, at the pace they were
+    recorded or faster.
+    The initial order book of each trading pair is built from the first snapshot recorded for it, and the replay starts
+    once all the initial order books were created, so an OrderBookTracker tracking the replayed messages rebuilds the
+    order books it recorded.
+    """
+
+    def __init__(self, path: str, trading_pairs: List[str], speed: Optional[float] = 1.0):
+        """
+        :param path: the recording file
+        :param trading_pairs: the trading pairs to replay
+        :param speed: how many times faster than recorded the messages are replayed, None to replay them as fast as
+        they are consumed
+        """
+        super().__init__(trading_pairs)
+        self._path: str = path
+        self._speed: Optional[float] = speed
+        self._snapshot_messages_queue_key = "order_book_snapshot"
+        self._initialized_trading_pairs: Set[str] = set()
+        self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._replay_finished: asyncio.Event = asyncio.Event()
+        self._last_snapshots: Dict[str, OrderBookMessage] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+        self._replayed_messages: int = 0
+
+    @property
+    def replayed_messages(self) -> int:
+        return self._replayed_messages
+
+    @property
+    def replay_finished(self) -> bool:
+        return self._replay_finished.is_set()
+
+    async def wait_for_replay_finished(self):
+        await self._replay_finished.wait()
+
+    async def get_last_traded_prices(self,
+                                     trading_pairs: List[str],
+                                     domain: Optional[str] = None) -> Dict[str, float]:
+        # The pairs without replayed trades are still returned, so the tracker doesn't request their prices again
+        return {trading_pair: self._last_traded_prices.get(trading_pair, float("NaN")) for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book: OrderBook = await super().get_new_order_book(trading_pair)
+        self._initialized_trading_pairs.add(trading_pair)
+        if self._initialized_trading_pairs.issuperset(self._trading_pairs):
+            self._order_books_initialized.set()
+        return order_book
+
+    async def listen_for_subscriptions(self):
+        """
+        Replays the recorded messages of the trading pairs, each message being stored in the queue of its type
+        """
+        await self._order_books_initialized.wait()
+        trading_pairs = set(self._trading_pairs)
+        first_timestamp: Optional[float] = None
+        start_time: float = self._time()
+        for message in read_order_book_messages(self._path):
+            if message.trading_pair not in trading_pairs:
+                continue
+            if self._speed is None:
+                await asyncio.sleep(0)
+            elif not math.isnan(message.timestamp):
+                if first_timestamp is None:
+                    first_timestamp = message.timestamp
+                delay = (message.timestamp - first_timestamp) / self._speed - (self._time() - start_time)
+                if delay > 0:
+                    await self._sleep(delay)
+
+            if message.type is OrderBookMessageType.DIFF:
+                self._message_queue[self._diff_messages_queue_key].put_nowait(message)
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                self._last_snapshots[message.trading_pair] = message
+                self._message_queue[self._snapshot_messages_queue_key].put_nowait(message)
+            else:
+                self._last_traded_prices[message.trading_pair] = message.content["price"]
+                self._message_queue[self._trade_messages_queue_key].put_nowait(message)
+            self._replayed_messages += 1
+        self._replay_finished.set()
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        message_queue = self._message_queue[self._snapshot_messages_queue_key]
+        while True:
+            output.put_nowait(await message_queue.get())
+
+    async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Returns the last snapshot replayed for the trading pair, or the first one recorded before the replay starts
+        """
+        if trading_pair in self._last_snapshots:
+            return self._last_snapshots[trading_pair]
+        for message in read_order_book_messages(self._path):
+            if message.type is OrderBookMessageType.SNAPSHOT and message.trading_pair == trading_pair:
+                return message
+        raise ValueError(f"No order book snapshot was recorded for {trading_pair}.")
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import math
 import time
 from collections import defaultdict, deque
 from enum import Enum
@@ -7,12 +8,15 @@ from typing import Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_diff_window import OrderBookDiffWindow
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_recorder import OrderBookMessageRecorder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +27,12 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker():
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_PAST_DIFF_WINDOW_SIZE: int = 100000
+    PAST_DIFF_WINDOW_DURATION: float = 10.0
+    PAST_DIFF_WINDOW_RESIZE_INTERVAL: float = 10.0
+    MAX_DIFF_BATCH_SIZE: int = 100
+    DIFF_COALESCING_QUEUE_THRESHOLD: int = 10
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS: int = 20
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,20 +41,49 @@ class OrderBookTracker():
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 order_book_max_depth: int = 0,
+                 throttler: Optional[AsyncThrottlerBase] = None,
+                 recorder: Optional[OrderBookMessageRecorder] = None):
+        """
+        :param data_source: the data source providing the order book messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if the connector supports several
+        :param order_book_max_depth: if greater than zero, the tracked order books only keep the best
+        order_book_max_depth levels per side. If it is lower than the depth of the exchange checksums, the order books
+        are not validated with the checksums, and the periodic snapshots restore the levels dropped by the cap
+        :param throttler: the throttler the data source's snapshot requests go through. If provided, the initial
+        order books are fetched concurrently and the throttler keeps the requests within the rate limits, otherwise
+        they are fetched one per second
+        :param recorder: if provided, records the snapshot, diff and trade messages applied to the order books, along
+        with the initial order books as snapshots. The recorder is closed when the tracker stops
+        """
         self._domain: Optional[str] = domain
+        self._order_book_max_depth: int = order_book_max_depth
+        self._throttler: Optional[AsyncThrottlerBase] = throttler
+        self._recorder: Optional[OrderBookMessageRecorder] = recorder
         self._data_source: OrderBookTrackerDataSource = data_source
+        self._data_source.order_book_max_depth = order_book_max_depth
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
-        self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
+        self._past_diffs_windows: Dict[str, OrderBookDiffWindow] = defaultdict(
+            lambda: OrderBookDiffWindow(self.PAST_DIFF_WINDOW_SIZE))
+        self._past_diffs_window_durations: Dict[str, float] = defaultdict(lambda: self.PAST_DIFF_WINDOW_DURATION)
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._coalesced_diff_messages: Dict[str, int] = defaultdict(int)
+        self._collapsed_diff_levels: Dict[str, int] = defaultdict(int)
+        self._checksum_mismatches: Dict[str, int] = defaultdict(int)
+        self._order_book_resync_tasks: Dict[str, asyncio.Task] = {}
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -64,10 +103,65 @@ class OrderBookTracker():
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def order_book_max_depth(self) -> int:
+        return self._order_book_max_depth
+
+    @order_book_max_depth.setter
+    def order_book_max_depth(self, value: int):
+        """
+        Caps the tracked order books. Whether the periodic snapshots are requested is decided when the tracker starts,
+        so a cap changing whether the order books can be validated with the checksums should be set before that.
+        """
+        self._order_book_max_depth = value
+        self._data_source.order_book_max_depth = value
+        for order_book in self._order_books.values():
+            order_book.max_depth = value
+
+    @property
+    def recorder(self) -> Optional[OrderBookMessageRecorder]:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[OrderBookMessageRecorder]):
+        self._recorder = recorder
+
     @property
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book is initialized and tracked, while the other order books are still initializing
+        """
+        return list(self._order_books.keys())
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_books
+
+    @property
+    def coalesced_diff_messages(self) -> Dict[str, int]:
+        """
+        Number of diff messages per trading pair that were merged into a net diff because the pair's tracking queue
+        was backed up
+        """
+        return dict(self._coalesced_diff_messages)
+
+    @property
+    def collapsed_diff_levels(self) -> Dict[str, int]:
+        """
+        Number of price level updates per trading pair that were skipped because a later diff overwrote them
+        """
+        return dict(self._collapsed_diff_levels)
+
+    @property
+    def checksum_mismatches(self) -> Dict[str, int]:
+        """
+        Number of times per trading pair the order book did not match the exchange checksum and had to be resynced
+        """
+        return dict(self._checksum_mismatches)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -137,7 +231,12 @@ class OrderBookTracker():
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._order_book_resync_tasks.values():
+            task.cancel()
+        self._order_book_resync_tasks.clear()
         self._order_books_initialized.clear()
+        if self._recorder is not None:
+            self._recorder.close()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -169,17 +268,54 @@ class OrderBookTracker():
     async def _initial_order_book_for_trading_pair(self, trading_pair: str) -> OrderBook:
         return await self._data_source.get_new_order_book(trading_pair)
 
+    def _record_message(self, message: OrderBookMessage):
+        """
+        Records the message if a recorder is set. Recording errors are logged, they never stop the message from being
+        applied to the order books.
+        """
+        if self._recorder is None:
+            return
+        try:
+            self._recorder.record(message)
+        except Exception:
+            self.logger().error(f"Unexpected error recording {message.type.name} message of {message.trading_pair}.",
+                                exc_info=True)
+
+    async def _init_order_book(self, trading_pair: str):
+        order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+        if self._order_book_max_depth > 0:
+            order_book.max_depth = self._order_book_max_depth
+        if self._recorder is not None:
+            bids, asks = order_book.to_numpy()
+            self._record_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": trading_pair,
+                "update_id": order_book.snapshot_uid,
+                "bids": bids[:, :2].tolist(),
+                "asks": asks[:, :2].tolist(),
+            }, timestamp=time.time()))
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._order_books)}/{len(self._trading_pairs)} completed.")
+
     async def _init_order_books(self):
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        if self._throttler is None:
+            for trading_pair in self._trading_pairs:
+                await self._init_order_book(trading_pair)
+                await asyncio.sleep(1)
+        else:
+            # The snapshot requests wait for the throttler, the semaphore only bounds the number of pending requests
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS)
+
+            async def init_order_book(trading_pair: str):
+                async with semaphore:
+                    await self._init_order_book(trading_pair)
+
+            await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
     async def _order_book_diff_router(self):
@@ -195,6 +331,7 @@ class OrderBookTracker():
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                self._record_message(ob_message)
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
@@ -233,13 +370,14 @@ class OrderBookTracker():
 
     async def _order_book_snapshot_router(self):
         """
-        Route the real-time order book snapshot messages to the correct order book.
+        Route the real-time order book snapshot messages to the correct order book. The snapshots of the order books
+        still initializing are dropped, their initial order book is fetched from a newer snapshot.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                self._record_message(ob_message)
                 if trading_pair not in self._tracking_message_queues:
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
@@ -250,39 +388,122 @@ class OrderBookTracker():
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _request_order_book_resync(self, trading_pair: str):
+        """
+        Requests a new snapshot for the pair, unless a requested snapshot has not been applied to its order book yet
+        """
+        if trading_pair not in self._order_book_resync_tasks:
+            self._order_book_resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        try:
+            await self._data_source.resync_order_book(trading_pair, self._order_book_snapshot_stream)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The next mismatch requests a new snapshot
+            self._order_book_resync_tasks.pop(trading_pair, None)
+            self.logger().network(
+                f"Unexpected error fetching order book snapshot to resync {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Unexpected error fetching order book snapshot to resync {trading_pair}."
+            )
+
+    def _resize_past_diffs_window(self, trading_pair: str, diffs_per_second: float):
+        """
+        Sizes the pair's diff window to hold the diffs received during its window duration, at the observed rate
+        """
+        window_size: int = math.ceil(diffs_per_second * self._past_diffs_window_durations[trading_pair])
+        self._past_diffs_windows[trading_pair].capacity = min(max(window_size, self.PAST_DIFF_WINDOW_SIZE),
+                                                              self.MAX_PAST_DIFF_WINDOW_SIZE)
+
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window = self._past_diffs_windows[trading_pair]
+        past_diffs_window: OrderBookDiffWindow = self._past_diffs_windows[trading_pair]
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
+        window_resize_timestamp: float = last_message_timestamp
+        window_resize_diff_messages: int = 0
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                # Process the message held back by the last diff batch, then saved messages if there are any
+                if pending_message is not None:
+                    message = pending_message
+                    pending_message = None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    # Drain the diffs already queued for the pair, so they are applied to the book in one batch.
+                    # If the queue is backed up the batch is merged into a net diff before being applied.
+                    coalesce: bool = message_queue.qsize() > self.DIFF_COALESCING_QUEUE_THRESHOLD
+                    diff_messages: List[OrderBookMessage] = [message]
+                    while (len(saved_messages) == 0
+                           and len(diff_messages) < self.MAX_DIFF_BATCH_SIZE
+                           and not message_queue.empty()):
+                        queued_message: OrderBookMessage = message_queue.get_nowait()
+                        if queued_message.type is not OrderBookMessageType.DIFF:
+                            pending_message = queued_message
+                            break
+                        diff_messages.append(queued_message)
+
+                    collapsed_levels: int = order_book.apply_diff_messages(
+                        diff_messages, coalesce=coalesce, diff_window=past_diffs_window)
+                    diff_messages_accepted += len(diff_messages)
+                    window_resize_diff_messages += len(diff_messages)
+
+                    if trading_pair not in self._order_book_resync_tasks:
+                        if order_book.stale:
+                            self.logger().info(f"The {trading_pair} order book ran out of the levels kept beyond "
+                                               f"its depth limit. Requesting a new snapshot.")
+                            self._request_order_book_resync(trading_pair)
+                        elif not self._data_source.validate_order_book(order_book, diff_messages[-1]):
+                            self._checksum_mismatches[trading_pair] += 1
+                            self.logger().warning(f"The {trading_pair} order book does not match the exchange "
+                                                  f"checksum. Requesting a new snapshot.")
+                            self._request_order_book_resync(trading_pair)
+                    if coalesce:
+                        self._coalesced_diff_messages[trading_pair] += len(diff_messages)
+                        self._collapsed_diff_levels[trading_pair] += collapsed_levels
+
+                    # Adapt the diff window to the message rate of the pair.
+                    now: float = time.time()
+                    if now - window_resize_timestamp >= self.PAST_DIFF_WINDOW_RESIZE_INTERVAL:
+                        self._resize_past_diffs_window(
+                            trading_pair, window_resize_diff_messages / (now - window_resize_timestamp))
+                        window_resize_timestamp = now
+                        window_resize_diff_messages = 0
 
                     # Output some statistics periodically.
-                    now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}. "
+                                            f"Collapsed price levels: {self._collapsed_diff_levels[trading_pair]}.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                    if past_diffs_window.last_evicted_update_id > message.update_id:
+                        # Diffs newer than the snapshot were dropped from the window, keep the diffs for longer.
+                        self._past_diffs_window_durations[trading_pair] *= 2
+                        past_diffs_window.capacity = min(past_diffs_window.capacity * 2,
+                                                         self.MAX_PAST_DIFF_WINDOW_SIZE)
+                        self.logger().debug(f"Order book snapshot for {trading_pair} is older than the diff window. "
+                                            f"Diff window size increased to {past_diffs_window.capacity}.")
+                    try:
+                        replayed_diffs: int = order_book.restore_from_snapshot_and_diff_window(
+                            message, past_diffs_window)
+                    finally:
+                        # A failed restore must not keep the checksum validation disabled for the pair
+                        self._order_book_resync_tasks.pop(trading_pair, None)
+                    self.logger().debug(f"Processed order book snapshot for {trading_pair}. "
+                                        f"Replayed {replayed_diffs} diffs.")
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -297,11 +518,11 @@ class OrderBookTracker():
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
                 trading_pair: str = trade_message.trading_pair
+                self._record_message(trade_message)
 
                 if trading_pair not in self._order_books:
                     messages_rejected += 1
@@ -6,13 +6,16 @@ from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import OrderBookDiffMessage, OrderBookMessage
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # Number of levels per side covered by the exchange order book checksums, None if the exchange has no checksums.
+    # Order books capped below this depth can't be validated, they are refreshed with the periodic snapshots instead.
+    ORDER_BOOK_CHECKSUM_DEPTH: Optional[int] = None
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -22,6 +25,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
+        self._order_book_max_depth: int = 0
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
 
     @classmethod
@@ -30,6 +34,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
         return cls._logger
 
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @trading_pairs.setter
+    def trading_pairs(self, trading_pairs: List[str]):
+        self._trading_pairs = trading_pairs
+
     @property
     def order_book_create_function(self) -> Callable[[], OrderBook]:
         return self._order_book_create_function
@@ -68,6 +80,56 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    @property
+    def order_book_max_depth(self) -> int:
+        """
+        The number of levels per side the tracked order books are capped to, 0 if they are not capped. It is set by
+        the order book tracker.
+        """
+        return self._order_book_max_depth
+
+    @order_book_max_depth.setter
+    def order_book_max_depth(self, value: int):
+        self._order_book_max_depth = value
+
+    @property
+    def validates_order_books(self) -> bool:
+        """
+        True if the order books are validated with the exchange checksums, in which case they are resynced when they
+        don't match instead of being refreshed with periodic snapshots. Order books capped to fewer levels than the
+        checksums cover are not validated, since they would never match.
+        """
+        return (self.ORDER_BOOK_CHECKSUM_DEPTH is not None
+                and not 0 < self._order_book_max_depth < self.ORDER_BOOK_CHECKSUM_DEPTH)
+
+    def validate_order_book(self, order_book: OrderBook, diff_message: OrderBookMessage) -> bool:
+        """
+        Checks the local order book against the checksum published by the exchange with the last diff applied to it.
+        Diffs without a checksum, and order books that are not validated, are always considered valid.
+
+        :param order_book: the order book the diff message has been applied to
+        :param diff_message: the last diff message applied to the order book
+
+        :return: False if the order book checksum does not match the exchange checksum, True otherwise
+        """
+        if not self.validates_order_books:
+            return True
+        expected_checksum: Optional[int] = self._expected_order_book_checksum(diff_message)
+        if expected_checksum is None:
+            return True
+        # Some exchanges publish the checksum as a signed 32 bits integer
+        return self._order_book_checksum(order_book) == expected_checksum & 0xFFFFFFFF
+
+    async def resync_order_book(self, trading_pair: str, output: asyncio.Queue):
+        """
+        Requests a new snapshot for a single trading pair, to recover an order book that failed its validation.
+        The snapshot message is added to the output queue like the periodic snapshots.
+
+        :param trading_pair: the trading pair of the order book to resync
+        :param output: a queue to add the snapshot message
+        """
+        output.put_nowait(await self._order_book_snapshot(trading_pair=trading_pair))
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -117,6 +179,9 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         :param ev_loop: the event loop the method will run in
         :param output: a queue to add the created snapshot messages
         """
+        if self.validates_order_books:
+            # Order books are validated with the exchange checksums and resynced only when they drift
+            return
         while True:
             try:
                 for trading_pair in self._trading_pairs:
@@ -173,6 +238,28 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
         raise NotImplementedError
 
+    def _expected_order_book_checksum(self, diff_message: OrderBookMessage) -> Optional[int]:
+        """
+        Extracts the exchange order book checksum from a diff message
+
+        :param diff_message: the diff message
+
+        :return: the checksum sent by the exchange with the diff, or None if the diff has no checksum
+        """
+        if isinstance(diff_message, OrderBookDiffMessage):
+            return diff_message.checksum
+        return diff_message.content.get("checksum")
+
+    def _order_book_checksum(self, order_book: OrderBook) -> int:
+        """
+        Calculates the checksum of the local order book, the same way the exchange does
+
+        :param order_book: the order book to calculate the checksum for
+
+        :return: the unsigned CRC32 checksum of the order book
+        """
+        return order_book.checksum(depth=self.ORDER_BOOK_CHECKSUM_DEPTH)
+
     async def _connected_websocket_assistant(self) -> WSAssistant:
         """
         Creates an instance of WSAssistant connected to the exchange
@@ -0,0 +1,194 @@
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange_py_base import ExchangePyBase
+
+OrderBookKey = Tuple[str, Optional[str], str]
+FeedConnectorFactory = Callable[[str], "ExchangePyBase"]
+
+
+def create_feed_connector(exchange: str) -> "ExchangePyBase":
+    """
+    Creates the non trading connector of the exchange with the default configuration
+    """
+    from hummingbot.client.settings import AllConnectorSettings  # avoids chance of circular import
+
+    conn_setting = AllConnectorSettings.get_connector_settings()[exchange]
+    return conn_setting.non_trading_connector_instance_with_default_configuration()
+
+
+class OrderBookTrackerRegistry:
+    """
+    Process wide registry of the order book trackers. The order books are reference counted per exchange, domain and
+    trading pair, so all the connectors tracking the same order book share a single tracker and exchange feed.
+
+    The trackers are created by a non trading connector of the exchange owned by the registry, so their data sources,
+    web assistants and throttler don't depend on the connectors sharing them. The feed connector of an exchange is
+    dropped once none of its order books is referenced anymore.
+    """
+    _shared_instance: Optional["OrderBookTrackerRegistry"] = None
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def get_instance(cls) -> "OrderBookTrackerRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = OrderBookTrackerRegistry()
+        return cls._shared_instance
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector_factory: FeedConnectorFactory = create_feed_connector):
+        """
+        :param connector_factory: creates the non trading connector of the exchange whose name is passed as parameter
+        """
+        self._connector_factory: FeedConnectorFactory = connector_factory
+        self._feed_connectors: Dict[Tuple[str, Optional[str]], "ExchangePyBase"] = {}
+        self._trackers: Dict[OrderBookKey, OrderBookTracker] = {}
+        self._reference_counts: Dict[OrderBookKey, int] = defaultdict(int)
+
+    def feed_connector(self, exchange: str, domain: Optional[str]) -> Optional["ExchangePyBase"]:
+        return self._feed_connectors.get((exchange, domain))
+
+    def acquire(self, exchange: str, domain: Optional[str], trading_pairs: List[str]) -> Dict[str, OrderBookTracker]:
+        """
+        Adds a reference to the order books of the trading pairs. The trading pairs not tracked yet are tracked by a
+        new tracker, created by the exchange feed connector and started.
+
+        :param exchange: the exchange name
+        :param domain: the exchange domain, if the connector supports several
+        :param trading_pairs: the trading pairs of the order books
+
+        :return: the tracker of each trading pair order book
+        """
+        trading_pairs = list(dict.fromkeys(trading_pairs))
+        new_trading_pairs = [trading_pair for trading_pair in trading_pairs
+                             if (exchange, domain, trading_pair) not in self._trackers]
+        if len(new_trading_pairs) > 0:
+            connector = self._feed_connectors.get((exchange, domain))
+            if connector is None:
+                connector = self._connector_factory(exchange)
+                self._feed_connectors[(exchange, domain)] = connector
+            tracker = connector.create_order_book_tracker(new_trading_pairs)
+            for trading_pair in new_trading_pairs:
+                self._trackers[(exchange, domain, trading_pair)] = tracker
+            tracker.start()
+            self.logger().debug(f"Started a shared {exchange} order book tracker for {new_trading_pairs}.")
+
+        trackers = {}
+        for trading_pair in trading_pairs:
+            key = (exchange, domain, trading_pair)
+            self._reference_counts[key] += 1
+            trackers[trading_pair] = self._trackers[key]
+        return trackers
+
+    def release(self, exchange: str, domain: Optional[str], trading_pairs: List[str]):
+        """
+        Removes a reference to the order books of the trading pairs. A tracker is stopped once none of its order books
+        is referenced anymore.
+        """
+        released_trackers = []
+        for trading_pair in dict.fromkeys(trading_pairs):
+            key = (exchange, domain, trading_pair)
+            if self._reference_counts.get(key, 0) == 0:
+                continue
+            self._reference_counts[key] -= 1
+            if self._reference_counts[key] == 0 and self._trackers[key] not in released_trackers:
+                released_trackers.append(self._trackers[key])
+
+        for tracker in released_trackers:
+            keys = [key for key, key_tracker in self._trackers.items() if key_tracker is tracker]
+            if any(self._reference_counts[key] > 0 for key in keys):
+                continue
+            tracker.stop()
+            for key in keys:
+                del self._trackers[key]
+                del self._reference_counts[key]
+            self.logger().debug(f"Stopped the shared {exchange} order book tracker for "
+                                f"{[trading_pair for _, _, trading_pair in keys]}.")
+
+        if not any(key[:2] == (exchange, domain) for key in self._trackers):
+            self._feed_connectors.pop((exchange, domain), None)
+
+    def reference_count(self, exchange: str, domain: Optional[str], trading_pair: str) -> int:
+        return self._reference_counts.get((exchange, domain, trading_pair), 0)
+
+    def get_tracker(self, exchange: str, domain: Optional[str], trading_pair: str) -> Optional[OrderBookTracker]:
+        return self._trackers.get((exchange, domain, trading_pair))
+
+
+class SharedOrderBookTracker:
+    """
+    Order book tracker of a connector whose order books are shared through the OrderBookTrackerRegistry. The order
+    books are acquired from the registry when the tracker is started, and released when it is stopped.
+    Used by the connectors only when order_book_sharing_enabled is set.
+    """
+
+    def __init__(self,
+                 exchange: str,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 registry: Optional[OrderBookTrackerRegistry] = None):
+        """
+        :param exchange: the exchange name
+        :param data_source: the connector's own data source, used for the requests that don't need the feed
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if the connector supports several
+        :param registry: the registry the order books are shared through, the process wide registry by default
+        """
+        self._exchange: str = exchange
+        self._domain: Optional[str] = domain
+        self._data_source: OrderBookTrackerDataSource = data_source
+        self._trading_pairs: List[str] = trading_pairs
+        self._registry: OrderBookTrackerRegistry = registry or OrderBookTrackerRegistry.get_instance()
+        self._trackers: Optional[Dict[str, OrderBookTracker]] = None
+        # The order books already initialized by the shared trackers, which never replace an order book once added
+        self._order_books: Dict[str, OrderBook] = {}
+
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        return self._data_source
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        if self._trackers is not None and len(self._order_books) < len(self._trackers):
+            for trading_pair, tracker in self._trackers.items():
+                if trading_pair not in self._order_books and trading_pair in tracker.order_books:
+                    self._order_books[trading_pair] = tracker.order_books[trading_pair]
+        return self._order_books
+
+    @property
+    def ready(self) -> bool:
+        return self._trackers is not None and all(tracker.ready for tracker in self._trackers.values())
+
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return list(self.order_books.keys())
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self.order_books
+
+    def start(self):
+        self.stop()
+        self._trackers = self._registry.acquire(self._exchange, self._domain, self._trading_pairs)
+
+    def stop(self):
+        if self._trackers is not None:
+            self._registry.release(self._exchange, self._domain, self._trading_pairs)
+            self._trackers = None
+            self._order_books = {}
@@ -0,0 +1,26 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.deque cimport deque
+from libcpp.vector cimport vector
+
+
+cdef class OrderBookTradeFlow:
+    cdef deque[double] _timestamps
+    cdef deque[double] _prices
+    cdef deque[double] _amounts
+    cdef deque[bint] _is_buys
+    cdef int64_t _first_sequence
+    cdef size_t _history_size
+    cdef double _last_timestamp
+    cdef vector[double] _durations
+    cdef vector[int64_t] _window_starts
+    cdef vector[double] _buy_volumes
+    cdef vector[double] _sell_volumes
+    cdef vector[double] _buy_quote_volumes
+    cdef vector[double] _sell_quote_volumes
+
+    cdef c_add_trade(self, double timestamp, double price, double amount, bint is_buy)
+    cdef c_expire(self, double timestamp)
+    cdef c_evict_trades(self)
+    cdef size_t c_window_index(self, double duration) except? 0
@@ -0,0 +1,223 @@
+# distutils: language=c++
+
+from typing import List, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeFlowStats, TradeType
+from libc.math cimport isnan
+
+cimport numpy as np
+
+
+cdef class OrderBookTradeFlow:
+    """
+    Rolling aggregates of the trades applied to an order book.
+
+    For each configured window, the buy and sell volumes (in base and quote) of the trades of the last `duration`
+    seconds are kept as running sums, updated when trades are added and when the window moves past older trades, so
+    reading them doesn't depend on the number of trades in the window. The latest `history_size` trades are kept as
+    well, whatever their age.
+
+    Trades are stored once, in columnar form, for as long as the longest window or the history needs them. They are
+    expected in the order they happened, with non-decreasing timestamps. A trade belongs to a window ending at time t
+    if its timestamp is greater than t - duration.
+    """
+
+    def __init__(self, durations: Optional[List[float]] = None, history_size: int = 0):
+        """
+        :param durations: the lengths in seconds of the rolling windows
+        :param history_size: the number of latest trades kept, regardless of the windows
+        """
+        self._first_sequence = 0
+        self._history_size = max(history_size, 0)
+        self._last_timestamp = float("NaN")
+        for duration in durations or []:
+            self.add_window(duration)
+
+    def __len__(self) -> int:
+        return self._timestamps.size()
+
+    @property
+    def durations(self) -> List[float]:
+        return [duration for duration in self._durations]
+
+    @property
+    def history_size(self) -> int:
+        return self._history_size
+
+    @history_size.setter
+    def history_size(self, value: int):
+        self._history_size = max(value, 0)
+        self.c_evict_trades()
+
+    @property
+    def last_timestamp(self) -> float:
+        return self._last_timestamp
+
+    def add_window(self, duration: float):
+        """
+        Adds a rolling window. The window only aggregates the trades added after it, since the trades kept until then
+        may not cover its whole duration.
+        """
+        if not duration > 0:
+            raise ValueError(f"Window duration must be positive, got {duration}.")
+        if duration in self.durations:
+            return
+        self._durations.push_back(duration)
+        self._window_starts.push_back(self._first_sequence + <int64_t>self._timestamps.size())
+        self._buy_volumes.push_back(0)
+        self._sell_volumes.push_back(0)
+        self._buy_quote_volumes.push_back(0)
+        self._sell_quote_volumes.push_back(0)
+
+    def remove_window(self, duration: float):
+        cdef:
+            size_t index = self.c_window_index(duration)
+
+        self._durations.erase(self._durations.begin() + index)
+        self._window_starts.erase(self._window_starts.begin() + index)
+        self._buy_volumes.erase(self._buy_volumes.begin() + index)
+        self._sell_volumes.erase(self._sell_volumes.begin() + index)
+        self._buy_quote_volumes.erase(self._buy_quote_volumes.begin() + index)
+        self._sell_quote_volumes.erase(self._sell_quote_volumes.begin() + index)
+        self.c_evict_trades()
+
+    def clear(self):
+        """
+        Drops all the trades, keeping the windows
+        """
+        cdef:
+            size_t index
+
+        self._first_sequence += self._timestamps.size()
+        self._timestamps.clear()
+        self._prices.clear()
+        self._amounts.clear()
+        self._is_buys.clear()
+        for index in range(self._durations.size()):
+            self._window_starts[index] = self._first_sequence
+            self._buy_volumes[index] = self._sell_volumes[index] = 0
+            self._buy_quote_volumes[index] = self._sell_quote_volumes[index] = 0
+        self._last_timestamp = float("NaN")
+
+    def add_trade(self, timestamp: float, price: float, amount: float, trade_type: TradeType):
+        self.c_add_trade(timestamp, price, amount, trade_type is TradeType.BUY)
+
+    def expire(self, timestamp: float):
+        """
+        Moves the windows to end at the timestamp, dropping the trades that are now too old from the aggregates
+        """
+        self.c_expire(timestamp)
+
+    def stats(self, duration: float, timestamp: Optional[float] = None) -> TradeFlowStats:
+        """
+        Returns the aggregates of a window, ending at the timestamp if given, or else at the last expiration or trade
+        """
+        cdef:
+            size_t index = self.c_window_index(duration)
+            int64_t end_sequence
+
+        if timestamp is not None:
+            self.c_expire(timestamp)
+        end_sequence = self._first_sequence + <int64_t>self._timestamps.size()
+        return TradeFlowStats(duration=duration,
+                              trade_count=end_sequence - self._window_starts[index],
+                              buy_volume=self._buy_volumes[index],
+                              sell_volume=self._sell_volumes[index],
+                              buy_quote_volume=self._buy_quote_volumes[index],
+                              sell_quote_volume=self._sell_quote_volumes[index])
+
+    def recent_trades(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Returns up to count of the latest trades, as rows of timestamp, price, amount and 1 for buys or 0 for sells,
+        oldest first. Without count, the trades kept in the history are returned.
+        """
+        cdef:
+            size_t size = self._timestamps.size()
+            size_t first
+            size_t index
+            np.ndarray[np.float64_t, ndim=2] result
+
+        count = self._history_size if count is None else max(count, 0)
+        first = size - min(<size_t>count, size)
+        result = np.empty((size - first, 4), dtype=np.float64)
+        for index in range(first, size):
+            result[index - first, 0] = self._timestamps[index]
+            result[index - first, 1] = self._prices[index]
+            result[index - first, 2] = self._amounts[index]
+            result[index - first, 3] = self._is_buys[index]
+        return result
+
+    cdef c_add_trade(self, double timestamp, double price, double amount, bint is_buy):
+        cdef:
+            size_t index
+
+        self._timestamps.push_back(timestamp)
+        self._prices.push_back(price)
+        self._amounts.push_back(amount)
+        self._is_buys.push_back(is_buy)
+        for index in range(self._durations.size()):
+            if is_buy:
+                self._buy_volumes[index] += amount
+                self._buy_quote_volumes[index] += amount * price
+            else:
+                self._sell_volumes[index] += amount
+                self._sell_quote_volumes[index] += amount * price
+        self.c_expire(timestamp)
+
+    cdef c_expire(self, double timestamp):
+        cdef:
+            size_t index
+            int64_t end_sequence = self._first_sequence + <int64_t>self._timestamps.size()
+            int64_t start
+            size_t position
+            double cutoff
+
+        if not isnan(timestamp) and not timestamp <= self._last_timestamp:
+            self._last_timestamp = timestamp
+        for index in range(self._durations.size()):
+            start = self._window_starts[index]
+            cutoff = self._last_timestamp - self._durations[index]
+            while start < end_sequence:
+                position = start - self._first_sequence
+                if self._timestamps[position] > cutoff:
+                    break
+                if self._is_buys[position]:
+                    self._buy_volumes[index] -= self._amounts[position]
+                    self._buy_quote_volumes[index] -= self._amounts[position] * self._prices[position]
+                else:
+                    self._sell_volumes[index] -= self._amounts[position]
+                    self._sell_quote_volumes[index] -= self._amounts[position] * self._prices[position]
+                start += 1
+            if start == end_sequence:
+                # Resets the sums of empty windows, so the rounding errors of the subtractions don't accumulate
+                self._buy_volumes[index] = self._sell_volumes[index] = 0
+                self._buy_quote_volumes[index] = self._sell_quote_volumes[index] = 0
+            self._window_starts[index] = start
+        self.c_evict_trades()
+
+    cdef c_evict_trades(self):
+        cdef:
+            int64_t first_needed = self._first_sequence + <int64_t>self._timestamps.size()
+            int64_t history_start = first_needed - <int64_t>self._history_size
+            int64_t start
+
+        for start in self._window_starts:
+            first_needed = min(first_needed, start)
+        first_needed = min(first_needed, history_start)
+        while self._first_sequence < first_needed:
+            self._timestamps.pop_front()
+            self._prices.pop_front()
+            self._amounts.pop_front()
+            self._is_buys.pop_front()
+            self._first_sequence += 1
+
+    cdef size_t c_window_index(self, double duration) except? 0:
+        cdef:
+            size_t index
+
+        for index in range(self._durations.size()):
+            if self._durations[index] == duration:
+                return index
+        raise ValueError(f"No {duration} seconds trade flow window is configured.")
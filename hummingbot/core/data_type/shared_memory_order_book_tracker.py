@@ -0,0 +1,370 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+OrderBookTrackerFactory = Callable[[List[str]], OrderBookTracker]
+
+
+class SharedOrderBookLevels:
+    """
+    Top levels of several order books in a shared memory block, written by a single process and read by the others.
+
+    Each order book has a seqlock sequence number. The writer makes the sequence odd before writing the levels and even
+    again once they are written, so a reader knows the levels it read are consistent if the sequence was even and
+    did not change while reading them.
+    The levels are stored as numpy arrays mapped on the shared memory, with the [price, amount, update_id] columns of
+    OrderBook.to_numpy, bids and asks starting at the best price.
+
+    The trades of each order book are written to a ring buffer of the last `trades_size` trades, as rows of timestamp,
+    price, amount and trade type, along with the total number of trades written. A row is written before the count is
+    increased, and a reader discards the rows the writer may have overwritten while it copied them.
+    """
+    MAX_READ_ATTEMPTS: int = 100
+    TRADES_SIZE: int = 1024
+
+    def __init__(self, trading_pairs: List[str], depth: int, name: Optional[str] = None, trades_size: int = TRADES_SIZE):
+        """
+        :param trading_pairs: the trading pairs of the order books
+        :param depth: the number of levels stored per order book side
+        :param name: the name of the shared memory block to attach to, a new block is created if None
+        :param trades_size: the number of trades kept per order book
+        """
+        self._trading_pairs: List[str] = trading_pairs
+        self._depth: int = depth
+        self._trades_size: int = trades_size
+        pairs_count = len(trading_pairs)
+        if name is None:
+            self._shared_memory = SharedMemory(create=True, size=self.block_size(pairs_count, depth, trades_size))
+        else:
+            self._shared_memory = SharedMemory(name=name)
+        buffer = self._shared_memory.buf
+        # Columns: sequence, bid levels count, ask levels count, trades count
+        self._headers: np.ndarray = np.ndarray((pairs_count, 4), dtype=np.int64, buffer=buffer)
+        # Columns: timestamp, last trade price
+        self._prices: np.ndarray = np.ndarray((pairs_count, 2), dtype=np.float64, buffer=buffer,
+                                              offset=self._headers.nbytes)
+        self._levels: np.ndarray = np.ndarray((pairs_count, 2, depth, 3), dtype=np.float64, buffer=buffer,
+                                              offset=self._headers.nbytes + self._prices.nbytes)
+        self._trades: np.ndarray = np.ndarray((pairs_count, trades_size, 4), dtype=np.float64, buffer=buffer,
+                                              offset=self._headers.nbytes + self._prices.nbytes + self._levels.nbytes)
+        self._read_levels: np.ndarray = np.empty((2, depth, 3), dtype=np.float64)
+        if name is None:
+            self._headers.fill(0)
+
+    @staticmethod
+    def block_size(pairs_count: int, depth: int, trades_size: int = TRADES_SIZE) -> int:
+        return max(1, pairs_count * (4 * 8 + 2 * 8 + 2 * depth * 3 * 8 + trades_size * 4 * 8))
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def sequence(self, index: int) -> int:
+        return int(self._headers[index, 0])
+
+    def trades_count(self, index: int) -> int:
+        return int(self._headers[index, 3])
+
+    def write(self, index: int, bids: np.ndarray, asks: np.ndarray, timestamp: float, last_trade_price: float):
+        """
+        Publishes the top levels of an order book
+
+        :param index: the index of the order book trading pair
+        :param bids: the bid levels, as exported by OrderBook.to_numpy
+        :param asks: the ask levels, as exported by OrderBook.to_numpy
+        :param timestamp: the time the levels were exported
+        :param last_trade_price: the last trade price of the order book
+        """
+        bids_count = min(bids.shape[0], self._depth)
+        asks_count = min(asks.shape[0], self._depth)
+        self._headers[index, 0] += 1
+        self._levels[index, 0, :bids_count] = bids[:bids_count]
+        self._levels[index, 1, :asks_count] = asks[:asks_count]
+        self._headers[index, 1] = bids_count
+        self._headers[index, 2] = asks_count
+        self._prices[index, 0] = timestamp
+        self._prices[index, 1] = last_trade_price
+        self._headers[index, 0] += 1
+
+    def read(self, index: int, order_book: OrderBook) -> Optional[int]:
+        """
+        Applies the published levels of an order book as a snapshot of the local order book
+
+        :param index: the index of the order book trading pair
+        :param order_book: the local order book
+
+        :return: the sequence number of the levels applied, None if the writer kept updating them while reading
+        """
+        read_levels = self._read_levels
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            sequence = self._headers[index, 0]
+            if sequence % 2 == 1:
+                continue
+            bids_count = self._headers[index, 1]
+            asks_count = self._headers[index, 2]
+            last_trade_price = self._prices[index, 1]
+            np.copyto(read_levels, self._levels[index])
+            if self._headers[index, 0] != sequence:
+                continue
+            order_book.apply_numpy_snapshot(read_levels[0, :bids_count], read_levels[1, :asks_count])
+            order_book.last_trade_price = last_trade_price
+            return int(sequence)
+        return None
+
+    def write_trade(self, index: int, timestamp: float, price: float, amount: float, trade_type: TradeType):
+        """
+        Publishes a trade of an order book
+        """
+        count = self._headers[index, 3]
+        self._trades[index, count % self._trades_size] = (timestamp, price, amount, trade_type.value)
+        self._headers[index, 3] = count + 1
+
+    def read_trades(self, index: int, start: int) -> Tuple[np.ndarray, int]:
+        """
+        Returns the trades of an order book published since the start count, as rows of timestamp, price, amount and
+        trade type, with the count of the first trade returned. Trades overwritten before being read are skipped, so
+        the first count returned is greater than the start count when some were lost.
+        """
+        count = int(self._headers[index, 3])
+        start = max(start, count - self._trades_size)
+        trades = self._trades[index, np.arange(start, count) % self._trades_size]
+        # The trades from the start count may have been overwritten by the ones written while copying them
+        overwritten = int(self._headers[index, 3]) - self._trades_size - start
+        if overwritten > 0:
+            trades = trades[overwritten:]
+            start += overwritten
+        return trades, start
+
+    def close(self):
+        self._headers = self._prices = self._levels = self._trades = None
+        self._shared_memory.close()
+
+    def unlink(self):
+        self._shared_memory.unlink()
+
+
+async def publish_order_books(levels: SharedOrderBookLevels,
+                              tracker: OrderBookTracker,
+                              publish_interval: float,
+                              parent_pid: Optional[int] = None):
+    """
+    Publishes the top levels of the tracked order books each time they change, and their trades as they are applied,
+    until the parent process exits
+    """
+    published_updates: Dict[str, tuple] = {}
+    # The order books keep weak references to their listeners
+    trade_forwarders: Dict[str, EventForwarder] = {}
+    while parent_pid is None or os.getppid() == parent_pid:
+        for index, trading_pair in enumerate(levels.trading_pairs):
+            order_book = tracker.order_books.get(trading_pair)
+            if order_book is None:
+                continue
+            if trading_pair not in trade_forwarders:
+                trade_forwarders[trading_pair] = EventForwarder(
+                    lambda event, index=index: levels.write_trade(index, event.timestamp, event.price, event.amount,
+                                                                  event.type))
+                order_book.add_listener(OrderBookEvent.TradeEvent, trade_forwarders[trading_pair])
+            update = (order_book.snapshot_uid, order_book.last_diff_uid, order_book.last_applied_trade,
+                      order_book.last_trade_price_rest_updated)
+            if published_updates.get(trading_pair) == update:
+                continue
+            bids, asks = order_book.to_numpy(levels.depth)
+            levels.write(index, bids, asks, time.time(), order_book.last_trade_price)
+            published_updates[trading_pair] = update
+        await asyncio.sleep(publish_interval)
+
+
+def run_order_book_feed(shared_memory_name: str,
+                        trading_pairs: List[str],
+                        depth: int,
+                        tracker_factory: OrderBookTrackerFactory,
+                        publish_interval: float,
+                        parent_pid: int):
+    """
+    Entry point of the feed process, tracking the order books and publishing them to the shared memory block
+    """
+    levels = SharedOrderBookLevels(trading_pairs, depth, name=shared_memory_name)
+    tracker = tracker_factory(trading_pairs)
+    tracker.start()
+    try:
+        asyncio.get_event_loop().run_until_complete(
+            publish_order_books(levels, tracker, publish_interval, parent_pid))
+    finally:
+        tracker.stop()
+        levels.close()
+
+
+class SharedMemoryOrderBookTracker:
+    """
+    Order book tracker running the exchange feed in a separate process, so that maintaining the order books does not
+    compete with the strategies on the event loop of this process. The feed process publishes the top levels and the
+    trades of its order books to shared memory. The published levels of a changed order book are copied and applied to
+    the local order book as a snapshot, they are not read in place. The published trades are applied to the local order
+    books, which emit their trade events and feed their trade flow as with a local tracker.
+    """
+    DEFAULT_DEPTH: int = 20
+    POLL_INTERVAL: float = 0.005
+    STOP_TIMEOUT: float = 1.0
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 tracker_factory: OrderBookTrackerFactory,
+                 depth: int = DEFAULT_DEPTH,
+                 poll_interval: float = POLL_INTERVAL):
+        """
+        :param data_source: the connector's data source, whose order book create function creates the local order
+        books
+        :param trading_pairs: the trading pairs to track
+        :param tracker_factory: creates the tracker of the trading pairs passed as parameter in the feed process. It is
+        pickled to be sent to the feed process
+        :param depth: the number of levels published per order book side. The local order books only hold these
+        levels, so the queries needing deeper levels (e.g. get_vwap_for_volume or simulate_trade for large amounts)
+        see a truncated book
+        :param poll_interval: the interval in seconds between the publications of the feed process, and between the
+        checks of the local order books for new publications
+        """
+        self._data_source: OrderBookTrackerDataSource = data_source
+        self._trading_pairs: List[str] = list(dict.fromkeys(trading_pairs))
+        self._tracker_factory: OrderBookTrackerFactory = tracker_factory
+        self._depth: int = depth
+        self._poll_interval: float = poll_interval
+        self._order_books: Dict[str, OrderBook] = {}
+        self._read_sequences: Dict[str, int] = {}
+        self._read_trades_counts: Dict[str, int] = {}
+        self._levels: Optional[SharedOrderBookLevels] = None
+        self._feed_process: Optional[multiprocessing.Process] = None
+        self._read_order_books_task: Optional[asyncio.Task] = None
+
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        return self._data_source
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._order_books
+
+    @property
+    def ready(self) -> bool:
+        return self._levels is not None and len(self._order_books) == len(self._trading_pairs)
+
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return list(self._order_books.keys())
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_books
+
+    @property
+    def feed_process(self) -> Optional[multiprocessing.Process]:
+        return self._feed_process
+
+    def start(self):
+        self.stop()
+        self.logger().info(f"Tracking the order books of {', '.join(self._trading_pairs)} in a feed process. The order "
+                           f"books keep the top {self._depth} levels per side.")
+        self._levels = SharedOrderBookLevels(self._trading_pairs, self._depth)
+        self._read_sequences.clear()
+        self._read_trades_counts.clear()
+        # The feed process is spawned rather than forked, so it doesn't inherit the event loop of this process
+        self._feed_process = multiprocessing.get_context("spawn").Process(
+            target=run_order_book_feed,
+            args=(self._levels.name, self._trading_pairs, self._depth, self._tracker_factory, self._poll_interval,
+                  os.getpid()),
+            daemon=True)
+        self._feed_process.start()
+        self._read_order_books_task = safe_ensure_future(self._read_order_books_loop())
+
+    def stop(self):
+        if self._read_order_books_task is not None:
+            self._read_order_books_task.cancel()
+            self._read_order_books_task = None
+        if self._feed_process is not None:
+            self._feed_process.terminate()
+            self._feed_process.join(self.STOP_TIMEOUT)
+            self._feed_process = None
+        if self._levels is not None:
+            self._levels.close()
+            self._levels.unlink()
+            self._levels = None
+
+    def read_order_books(self):
+        """
+        Updates the local order books whose levels were published since they were last read, then applies the trades
+        published since
+        """
+        for index, trading_pair in enumerate(self._trading_pairs):
+            sequence = self._levels.sequence(index)
+            if sequence != 0 and sequence != self._read_sequences.get(trading_pair):
+                order_book = self._order_books.get(trading_pair)
+                if order_book is None:
+                    order_book = self._data_source.order_book_create_function()
+                read_sequence = self._levels.read(index, order_book)
+                if read_sequence is not None:
+                    self._read_sequences[trading_pair] = read_sequence
+                    self._order_books[trading_pair] = order_book
+            if trading_pair in self._order_books:
+                self._apply_trades(index, trading_pair)
+
+    def _apply_trades(self, index: int, trading_pair: str):
+        read_count = self._read_trades_counts.get(trading_pair, 0)
+        if self._levels.trades_count(index) == read_count:
+            return
+        trades, start = self._levels.read_trades(index, read_count)
+        if start > read_count:
+            self.logger().warning(f"{start - read_count} trades of {trading_pair} were overwritten in the shared "
+                                  f"memory before being read.")
+        order_book = self._order_books[trading_pair]
+        for timestamp, price, amount, trade_type in trades:
+            order_book.apply_trade(OrderBookTradeEvent(trading_pair=trading_pair,
+                                                       timestamp=timestamp,
+                                                       type=TradeType(int(trade_type)),
+                                                       price=price,
+                                                       amount=amount))
+        self._read_trades_counts[trading_pair] = start + len(trades)
+
+    async def _read_order_books_loop(self):
+        while True:
+            try:
+                self.read_order_books()
+                if not self._feed_process.is_alive():
+                    self.logger().error(f"The order book feed process exited with code "
+                                        f"{self._feed_process.exitcode}.")
+                    return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Unexpected error reading the order books published by the feed process.",
+                                      exc_info=True)
+            await asyncio.sleep(self._poll_interval)
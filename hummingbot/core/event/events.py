@@ -31,6 +31,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChanged = 902
 
 
 class TokenApprovalEvent(Enum):
@@ -141,6 +142,12 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTopOfBookChangedEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+    update_id: int
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -4,6 +4,8 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RequestPriority
+from hummingbot.core.api_throttler.throttler_metrics import RATE_LIMIT_STATUS_CODES
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -42,7 +44,8 @@ class RESTAssistant:
             is_auth_required: bool = False,
             return_err: bool = False,
             timeout: Optional[float] = None,
-            headers: Optional[Dict[str, Any]] = None) -> Union[str, Dict[str, Any]]:
+            headers: Optional[Dict[str, Any]] = None,
+            priority: RequestPriority = DEFAULT_PRIORITY) -> Union[str, Dict[str, Any]]:
 
         headers = headers or {}
 
@@ -63,9 +66,11 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority):
             response = await self.call(request=request, timeout=timeout)
 
+            if response.status in RATE_LIMIT_STATUS_CODES:
+                self._throttler.record_rejection(throttler_limit_id, response.status)
             if 400 <= response.status:
                 if return_err:
                     error_response = await response.json()
@@ -1,6 +1,7 @@
 # distutils: language=c++
 import logging
 from decimal import Decimal
+import numpy as np
 import pandas as pd
 from typing import (
     List,
@@ -13,6 +14,7 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -20,7 +22,10 @@ from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketP
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.client.performance import PerformanceMetrics
 
+cimport numpy as np
+
 NaN = float("nan")
+ORDER_BOOK_LEVELS_CHUNK_SIZE = 16
 s_decimal_0 = Decimal(0)
 as_logger = None
 
@@ -616,6 +621,52 @@ cdef class ArbitrageStrategy(StrategyBase):
     # ---------------------------------------------------------------
 
 
+cdef class OrderBookLevelReader:
+    """
+    Reads the levels of one side of a market order book from the best price, as the rows returned by
+    ExchangeBase.order_book_bid_entries() and order_book_ask_entries(). The levels are copied from the order book in
+    native arrays, whose size doubles each time more levels are needed, instead of iterating the entries generators.
+    """
+    cdef:
+        ExchangeBase _market
+        str _trading_pair
+        OrderBook _order_book
+        bint _is_buy
+        size_t _depth
+        size_t _position
+        np.ndarray _levels
+
+    def __init__(self, object market_trading_pair_tuple, bint is_buy):
+        self._market = market_trading_pair_tuple.market
+        self._trading_pair = market_trading_pair_tuple.trading_pair
+        self._order_book = market_trading_pair_tuple.order_book
+        self._is_buy = is_buy
+        self._depth = ORDER_BOOK_LEVELS_CHUNK_SIZE
+        self._position = 0
+        self._levels = self._order_book.c_entries_to_numpy(is_buy, self._depth)
+
+    cdef object c_next(self):
+        """
+        :return: the next level with its price and amount quantized by the market, or None if there are no more levels
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=2] levels = self._levels
+
+        if self._position == <size_t> levels.shape[0]:
+            if <size_t> levels.shape[0] < self._depth:
+                return None
+            self._depth *= 2
+            self._levels = levels = self._order_book.c_entries_to_numpy(self._is_buy, self._depth)
+            if self._position == <size_t> levels.shape[0]:
+                return None
+        row = ClientOrderBookRow(
+            self._market.c_quantize_order_price(self._trading_pair, Decimal(levels[self._position, 0])),
+            self._market.c_quantize_order_amount(self._trading_pair, Decimal(levels[self._position, 1])),
+            int(levels[self._position, 2]))
+        self._position += 1
+        return row
+
+
 cdef list c_find_profitable_arbitrage_orders(object min_profitability,
                                              object buy_market_trading_pair_tuple,
                                              object sell_market_trading_pair_tuple,
@@ -646,61 +697,63 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         str buy_market_quote_asset = buy_market_trading_pair_tuple.quote_asset
 
     profitable_orders = []
-    bid_it = sell_market_trading_pair_tuple.order_book_bid_entries()
-    ask_it = buy_market_trading_pair_tuple.order_book_ask_entries()
-
-    try:
-        while True:
-            if bid_leftover_amount == 0 and ask_leftover_amount == 0:
-                # both current ask and bid orders are filled, advance to the next bid and ask order
-                current_bid = next(bid_it)
-                current_ask = next(ask_it)
-                ask_leftover_amount = current_ask.amount
-                bid_leftover_amount = current_bid.amount
-
-            elif bid_leftover_amount > 0 and ask_leftover_amount == 0:
-                # current ask order filled completely, advance to the next ask order
-                current_ask = next(ask_it)
-                ask_leftover_amount = current_ask.amount
-
-            elif ask_leftover_amount > 0 and bid_leftover_amount == 0:
-                # current bid order filled completely, advance to the next bid order
-                current_bid = next(bid_it)
-                bid_leftover_amount = current_bid.amount
-
-            elif bid_leftover_amount > 0 and ask_leftover_amount > 0:
-                # current ask and bid orders are not completely filled, no need to advance iterators
-                pass
-            else:
-                # something went wrong if leftover amount is negative
+    bid_reader = OrderBookLevelReader(sell_market_trading_pair_tuple, False)
+    ask_reader = OrderBookLevelReader(buy_market_trading_pair_tuple, True)
+
+    while True:
+        if bid_leftover_amount == 0 and ask_leftover_amount == 0:
+            # both current ask and bid orders are filled, advance to the next bid and ask order
+            current_bid = bid_reader.c_next()
+            current_ask = ask_reader.c_next()
+            if current_bid is None or current_ask is None:
                 break
+            ask_leftover_amount = current_ask.amount
+            bid_leftover_amount = current_bid.amount
 
-            # adjust price based on the quote token rates
-            current_bid_price_adjusted = current_bid.price * sell_market_conversion_rate
-            current_ask_price_adjusted = current_ask.price * buy_market_conversion_rate
-            # arbitrage not possible
-            if current_bid_price_adjusted < current_ask_price_adjusted:
+        elif bid_leftover_amount > 0 and ask_leftover_amount == 0:
+            # current ask order filled completely, advance to the next ask order
+            current_ask = ask_reader.c_next()
+            if current_ask is None:
                 break
-            # allow negative profitability for debugging
-            if min_profitability<0 and current_bid_price_adjusted/current_ask_price_adjusted < (1 + min_profitability):
-                break
-
-            step_amount = min(bid_leftover_amount, ask_leftover_amount)
+            ask_leftover_amount = current_ask.amount
 
-            # skip cases where step_amount=0 for exchanges like binance that include orders with 0 amount
-            if step_amount == 0:
-                continue
-
-            profitable_orders.append((current_bid_price_adjusted,
-                                      current_ask_price_adjusted,
-                                      current_bid.price,
-                                      current_ask.price,
-                                      step_amount))
-
-            ask_leftover_amount -= step_amount
-            bid_leftover_amount -= step_amount
+        elif ask_leftover_amount > 0 and bid_leftover_amount == 0:
+            # current bid order filled completely, advance to the next bid order
+            current_bid = bid_reader.c_next()
+            if current_bid is None:
+                break
+            bid_leftover_amount = current_bid.amount
 
-    except StopIteration:
-        pass
+        elif bid_leftover_amount > 0 and ask_leftover_amount > 0:
+            # current ask and bid orders are not completely filled, no need to advance iterators
+            pass
+        else:
+            # something went wrong if leftover amount is negative
+            break
+
+        # adjust price based on the quote token rates
+        current_bid_price_adjusted = current_bid.price * sell_market_conversion_rate
+        current_ask_price_adjusted = current_ask.price * buy_market_conversion_rate
+        # arbitrage not possible
+        if current_bid_price_adjusted < current_ask_price_adjusted:
+            break
+        # allow negative profitability for debugging
+        if min_profitability<0 and current_bid_price_adjusted/current_ask_price_adjusted < (1 + min_profitability):
+            break
+
+        step_amount = min(bid_leftover_amount, ask_leftover_amount)
+
+        # skip cases where step_amount=0 for exchanges like binance that include orders with 0 amount
+        if step_amount == 0:
+            continue
+
+        profitable_orders.append((current_bid_price_adjusted,
+                                  current_ask_price_adjusted,
+                                  current_bid.price,
+                                  current_ask.price,
+                                  step_amount))
+
+        ask_leftover_amount -= step_amount
+        bid_leftover_amount -= step_amount
 
     return profitable_orders
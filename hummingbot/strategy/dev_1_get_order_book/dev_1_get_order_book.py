@@ -55,10 +55,9 @@ class GetOrderBookStrategy(StrategyPyBase):
 
         order_book = self._exchange.order_books[self._trading_pair]
 
-        best_bid = order_book.snapshot[0][['price']].head(1)
-        best_bid.rename(columns={'price': 'best_bid_price'}, inplace=True)
-        best_ask = order_book.snapshot[1][['price']].head(1)
-        best_ask.rename(columns={'price': 'best_ask_price'}, inplace=True)
+        bids_array, asks_array = order_book.to_numpy(1)
+        best_bid = pd.DataFrame(data=bids_array[:, :1], columns=['best_bid_price'])
+        best_ask = pd.DataFrame(data=asks_array[:, :1], columns=['best_ask_price'])
         joined_df = pd.concat([best_bid, best_ask], axis=1)
 
         lines = ["    " + line for line in joined_df.to_string(index=False).split("\n")]
@@ -69,10 +68,9 @@ class GetOrderBookStrategy(StrategyPyBase):
     def get_order_book(self):
         order_book = self._exchange.order_books[self._trading_pair]
 
-        bids = order_book.snapshot[0][['price', 'amount']].head(self._lines)
-        bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-        asks = order_book.snapshot[1][['price', 'amount']].head(self._lines)
-        asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+        bids_array, asks_array = order_book.to_numpy(self._lines)
+        bids = pd.DataFrame(data=bids_array[:, :2], columns=['bid_price', 'bid_volume'])
+        asks = pd.DataFrame(data=asks_array[:, :2], columns=['ask_price', 'ask_volume'])
         joined_df = pd.concat([bids, asks], axis=1)
         text_lines = ["    " + line for line in joined_df.to_string(index=False).split("\n")]
         header = f"  Market: {self._exchange.name} | {self._trading_pair}\n"
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from typing import (
-    NamedTuple, Iterator
+    NamedTuple, Iterator, List, Tuple
 )
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import ClientOrderBookQueryResult
@@ -45,6 +45,11 @@ class MarketTradingPairTuple(NamedTuple):
     def get_price_for_volume(self, is_buy: bool, volume: Decimal) -> ClientOrderBookQueryResult:
         return self.market.get_price_for_volume(self.trading_pair, is_buy, volume)
 
+    def get_prices_and_vwaps_for_volumes(self,
+                                         is_buy: bool,
+                                         volumes: List[Decimal]) -> Tuple[List[Decimal], List[Decimal]]:
+        return self.market.get_prices_and_vwaps_for_volumes(self.trading_pair, is_buy, volumes)
+
     def order_book_bid_entries(self) -> Iterator[ClientOrderBookRow]:
         return self.market.order_book_bid_entries(self.trading_pair)
 
@@ -1,7 +1,14 @@
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.core.data_type.order_book cimport OrderBook
 from .asset_price_delegate cimport AssetPriceDelegate
 
 cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
     cdef:
         ExchangeBase _market
         str _trading_pair
+        OrderBook _order_book
+        object _top_of_book_changed_forwarder
+        object _mid_price
+        bint _mid_price_valid
+
+    cdef c_listen_to_order_book(self, OrderBook order_book)
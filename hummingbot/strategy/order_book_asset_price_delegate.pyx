@@ -1,4 +1,6 @@
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.connector.exchange_base import ExchangeBase
 from decimal import Decimal
 from .asset_price_delegate cimport AssetPriceDelegate
@@ -8,10 +10,35 @@ cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
         super().__init__()
         self._market = market
         self._trading_pair = trading_pair
+        self._order_book = None
+        self._top_of_book_changed_forwarder = EventForwarder(self._top_of_book_changed)
+        self._mid_price = Decimal("NaN")
+        self._mid_price_valid = False
 
     cdef object c_get_mid_price(self):
-        return (self._market.c_get_price(self._trading_pair, True) +
-                self._market.c_get_price(self._trading_pair, False))/Decimal('2')
+        # The mid price is only computed again after the order book notified a change of its top of book.
+        cdef:
+            OrderBook order_book = self._market.c_get_order_book(self._trading_pair)
+        if order_book is not self._order_book:
+            self.c_listen_to_order_book(order_book)
+        elif self._mid_price_valid:
+            return self._mid_price
+
+        self._mid_price = (self._market.c_get_price(self._trading_pair, True) +
+                           self._market.c_get_price(self._trading_pair, False))/Decimal('2')
+        self._mid_price_valid = not self._mid_price.is_nan()
+        return self._mid_price
+
+    cdef c_listen_to_order_book(self, OrderBook order_book):
+        if self._order_book is not None:
+            self._order_book.c_remove_listener(OrderBookEvent.TopOfBookChanged, self._top_of_book_changed_forwarder)
+        self._order_book = order_book
+        self._mid_price_valid = False
+        if order_book is not None:
+            order_book.c_add_listener(OrderBookEvent.TopOfBookChanged, self._top_of_book_changed_forwarder)
+
+    def _top_of_book_changed(self, event):
+        self._mid_price_valid = False
 
     @property
     def ready(self) -> bool:
@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+
+"""
+Order book micro-benchmarks.
+
+Replays a synthetic or recorded diff stream through the hot paths of each order book backend (OrderBook and
+FlatOrderBook) and through an OrderBookTracker, and reports the throughput and the p50/p99 latency of each operation.
+The results can be saved as a baseline, and later runs compared against it to catch performance regressions.
+
+The recorded stream format is described in test/benchmark/order_book_streams.py.
+
+    python test/benchmark/order_book_benchmark.py [--messages 20000] [--depth 200] [--file recorded_stream.jsonl]
+        [--order-books OrderBook FlatOrderBook] [--pairs 10] [--rate 0] [--repeats 3]
+        [--save-baseline baseline.json] [--baseline baseline.json] [--tolerance 0.25]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_diff_window import OrderBookDiffWindow
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookDiffMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from test.benchmark.order_book_streams import numpy_levels, recorded_stream, synthetic_stream
+
+RESTORE_DIFFS_COUNT = 100
+ORDER_BOOK_CLASSES: Dict[str, Type[OrderBook]] = {
+    "OrderBook": OrderBook,
+    "FlatOrderBook": FlatOrderBook,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    operations: int
+    elapsed: float
+    latencies: np.ndarray
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.elapsed if self.elapsed > 0 else float("inf")
+
+    @property
+    def p50(self) -> float:
+        return float(np.percentile(self.latencies, 50)) if len(self.latencies) > 0 else float("NaN")
+
+    @property
+    def p99(self) -> float:
+        return float(np.percentile(self.latencies, 99)) if len(self.latencies) > 0 else float("NaN")
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"operations": self.operations, "throughput": self.throughput, "p50": self.p50, "p99": self.p99}
+
+
+def measure(name: str, operation: Callable[[Any], Any], arguments: Iterable[Any]) -> BenchmarkResult:
+    """
+    Calls the operation once per argument, timing each call
+    """
+    latencies: List[float] = []
+    perf_counter = time.perf_counter
+    for argument in arguments:
+        start: float = perf_counter()
+        operation(argument)
+        latencies.append(perf_counter() - start)
+    return BenchmarkResult(name, len(latencies), sum(latencies), np.array(latencies))
+
+
+def new_order_book(snapshot: OrderBookMessage, order_book_class: Type[OrderBook] = OrderBook) -> OrderBook:
+    order_book: OrderBook = order_book_class()
+    order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+    return order_book
+
+
+def benchmark_apply_snapshot(stream: List[OrderBookMessage],
+                             order_book_class: Type[OrderBook] = OrderBook) -> BenchmarkResult:
+    snapshot: OrderBookMessage = stream[0]
+    order_book: OrderBook = order_book_class()
+    bids, asks = snapshot.bids, snapshot.asks
+    repetitions: int = max(len(stream) // 20, 1)
+    return measure("apply_snapshot",
+                   lambda _: order_book.apply_snapshot(bids, asks, snapshot.update_id),
+                   range(repetitions))
+
+
+def benchmark_apply_diffs(stream: List[OrderBookMessage],
+                          order_book_class: Type[OrderBook] = OrderBook) -> BenchmarkResult:
+    order_book: OrderBook = new_order_book(stream[0], order_book_class)
+    # The diffs are parsed beforehand, only the order book update is measured
+    diffs = [(message.bids, message.asks, message.update_id) for message in stream[1:]]
+    return measure("apply_diffs", lambda diff: order_book.apply_diffs(*diff), diffs)
+
+
+def benchmark_apply_numpy_diffs(stream: List[OrderBookMessage],
+                                order_book_class: Type[OrderBook] = OrderBook) -> BenchmarkResult:
+    order_book: OrderBook = order_book_class()
+    order_book.apply_numpy_snapshot(*numpy_levels(stream[0]))
+    diffs = [numpy_levels(message) for message in stream[1:]]
+    return measure("apply_numpy_diffs", lambda diff: order_book.apply_numpy_diffs(*diff), diffs)
+
+
+def benchmark_apply_diff_messages(stream: List[OrderBookMessage],
+                                  order_book_class: Type[OrderBook] = OrderBook) -> BenchmarkResult:
+    order_book: OrderBook = new_order_book(stream[0], order_book_class)
+    return measure("apply_diff_messages",
+                   lambda message: order_book.apply_diff_messages([message]),
+                   stream[1:])
+
+
+def benchmark_apply_compact_diff_messages(stream: List[OrderBookMessage],
+                                          order_book_class: Type[OrderBook] = OrderBook) -> BenchmarkResult:
+    order_book: OrderBook = new_order_book(stream[0], order_book_class)
+    messages: List[OrderBookDiffMessage] = [OrderBookDiffMessage.from_order_book_message(message)
+                                            for message in stream[1:]]
+    return measure("apply_diff_messages[compact]",
+                   lambda message: order_book.apply_diff_messages([message]),
+                   messages)
+
+
+def benchmark_restore_from_snapshot_and_diffs(stream: List[OrderBookMessage],
+                                              order_book_class: Type[OrderBook] = OrderBook) -> BenchmarkResult:
+    snapshot: OrderBookMessage = stream[0]
+    order_book: OrderBook = order_book_class()
+    starts: List[int] = list(range(1, max(len(stream) - RESTORE_DIFFS_COUNT, 2), RESTORE_DIFFS_COUNT))
+    return measure("restore_from_snapshot_and_diffs",
+                   lambda start: order_book.restore_from_snapshot_and_diffs(
+                       snapshot, stream[start:start + RESTORE_DIFFS_COUNT]),
+                   starts)
+
+
+def benchmark_restore_from_snapshot_and_diff_window(stream: List[OrderBookMessage],
+                                                    order_book_class: Type[OrderBook] = OrderBook
+                                                    ) -> BenchmarkResult:
+    snapshot: OrderBookMessage = stream[0]
+    order_book: OrderBook = order_book_class()
+    windows: List[OrderBookDiffWindow] = []
+    for start in range(1, max(len(stream) - RESTORE_DIFFS_COUNT, 2), RESTORE_DIFFS_COUNT):
+        window: OrderBookDiffWindow = OrderBookDiffWindow(RESTORE_DIFFS_COUNT)
+        OrderBook().apply_diff_messages(stream[start:start + RESTORE_DIFFS_COUNT], diff_window=window)
+        windows.append(window)
+    return measure("restore_from_snapshot_and_diff_window",
+                   lambda window: order_book.restore_from_snapshot_and_diff_window(snapshot, window),
+                   windows)
+
+
+def benchmark_query(name: str,
+                    stream: List[OrderBookMessage],
+                    query: Callable[[OrderBook, bool, float], Any],
+                    order_book_class: Type[OrderBook] = OrderBook,
+                    seed: int = 42) -> BenchmarkResult:
+    """
+    Runs one query after each diff, so the queries also pay for the book changes made by the diffs
+    """
+    rng: random.Random = random.Random(seed)
+    order_book: OrderBook = new_order_book(stream[0], order_book_class)
+    latencies: List[float] = []
+    perf_counter = time.perf_counter
+    for message in stream[1:]:
+        order_book.apply_diff_messages([message])
+        is_buy: bool = rng.random() < 0.5
+        volume: float = rng.uniform(0.1, 50)
+        start: float = perf_counter()
+        query(order_book, is_buy, volume)
+        latencies.append(perf_counter() - start)
+    return BenchmarkResult(name, len(latencies), sum(latencies), np.array(latencies))
+
+
+def benchmark_order_book_class(order_book_class: Type[OrderBook]) -> Type[OrderBook]:
+    class BenchmarkOrderBook(order_book_class):
+        """
+        Records the latency of each diff message, from the time it was added to the tracker's diff stream (carried
+        in the message timestamp) to the time it was applied to the order book
+        """
+        def __init__(self, latencies: List[float], on_diffs_applied: Callable[[], None]):
+            super().__init__()
+            self._latencies = latencies
+            self._on_diffs_applied = on_diffs_applied
+
+        def apply_diff_messages(self, messages: List[OrderBookMessage], *args, **kwargs) -> int:
+            collapsed_levels: int = super().apply_diff_messages(messages, *args, **kwargs)
+            now: float = time.perf_counter()
+            self._latencies.extend(now - message.timestamp for message in messages)
+            self._on_diffs_applied()
+            return collapsed_levels
+
+    return BenchmarkOrderBook
+
+
+class BenchmarkDataSource(OrderBookTrackerDataSource):
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+
+async def _replay_through_tracker(stream: List[OrderBookMessage],
+                                  pairs: int,
+                                  rate: float,
+                                  order_book_class: Type[OrderBook]) -> BenchmarkResult:
+    trading_pairs: List[str] = [f"COIN{i}-HBOT" for i in range(pairs)]
+    tracker: OrderBookTracker = OrderBookTracker(data_source=BenchmarkDataSource(trading_pairs),
+                                                 trading_pairs=trading_pairs)
+    latencies: List[float] = []
+    expected_messages: int = (len(stream) - 1) * pairs
+    done: asyncio.Event = asyncio.Event()
+
+    def on_diffs_applied():
+        if len(latencies) >= expected_messages:
+            done.set()
+
+    tasks: List[asyncio.Task] = []
+    tracked_order_book_class: Type[OrderBook] = benchmark_order_book_class(order_book_class)
+    for trading_pair in trading_pairs:
+        order_book: OrderBook = tracked_order_book_class(latencies, on_diffs_applied)
+        order_book.apply_snapshot(stream[0].bids, stream[0].asks, stream[0].update_id)
+        tracker._order_books[trading_pair] = order_book
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        tasks.append(safe_ensure_future(tracker._track_single_book(trading_pair)))
+    tasks.append(safe_ensure_future(tracker._order_book_diff_router()))
+
+    # The diffs of all the pairs are interleaved, like the messages of a multiplexed websocket stream
+    contents: List[List[Dict[str, Any]]] = [
+        [dict(message.content, trading_pair=trading_pair) for trading_pair in trading_pairs] for message in stream[1:]
+    ]
+    perf_counter = time.perf_counter
+    start: float = perf_counter()
+    sent_messages: int = 0
+    try:
+        for pair_contents in contents:
+            for content in pair_contents:
+                if rate > 0:
+                    delay: float = start + sent_messages / rate - perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                tracker._order_book_diff_stream.put_nowait(
+                    OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=perf_counter()))
+                sent_messages += 1
+            # Let the tracker keep up with the stream, as it would between websocket reads
+            await asyncio.sleep(0)
+        await done.wait()
+        elapsed: float = perf_counter() - start
+    finally:
+        for task in tasks:
+            task.cancel()
+    return BenchmarkResult(f"order_book_tracker[{pairs} pairs]", len(latencies), elapsed, np.array(latencies))
+
+
+def benchmark_order_book_tracker(stream: List[OrderBookMessage],
+                                 pairs: int,
+                                 rate: float,
+                                 order_book_class: Type[OrderBook] = OrderBook) -> BenchmarkResult:
+    """
+    Measures the time from a diff entering the tracker's diff stream to its application to the order book
+    """
+    return asyncio.get_event_loop().run_until_complete(
+        _replay_through_tracker(stream, pairs, rate, order_book_class))
+
+
+def run_benchmarks(stream: List[OrderBookMessage],
+                   pairs: int = 10,
+                   rate: float = 0,
+                   repeats: int = 1,
+                   order_book_class: Type[OrderBook] = OrderBook) -> List[BenchmarkResult]:
+    """
+    Runs each benchmark repeats times on the order book class, and keeps its fastest run to reduce the noise of the
+    machine. The result names are prefixed with the name of the order book class.
+    """
+    benchmarks: List[Callable[[], BenchmarkResult]] = [
+        lambda: benchmark_apply_snapshot(stream, order_book_class),
+        lambda: benchmark_apply_diffs(stream, order_book_class),
+        lambda: benchmark_apply_numpy_diffs(stream, order_book_class),
+        lambda: benchmark_apply_diff_messages(stream, order_book_class),
+        lambda: benchmark_apply_compact_diff_messages(stream, order_book_class),
+        lambda: benchmark_restore_from_snapshot_and_diffs(stream, order_book_class),
+        lambda: benchmark_restore_from_snapshot_and_diff_window(stream, order_book_class),
+        lambda: benchmark_query("get_vwap_for_volume", stream,
+                                lambda order_book, is_buy, volume: order_book.get_vwap_for_volume(is_buy, volume),
+                                order_book_class),
+        lambda: benchmark_query("simulate_buy", stream,
+                                lambda order_book, is_buy, volume: order_book.simulate_buy(volume),
+                                order_book_class),
+        lambda: benchmark_order_book_tracker(stream, pairs, rate, order_book_class),
+    ]
+    results: List[BenchmarkResult] = [
+        max((benchmark() for _ in range(max(repeats, 1))), key=lambda result: result.throughput)
+        for benchmark in benchmarks
+    ]
+    for result in results:
+        result.name = f"{order_book_class.__name__}.{result.name}"
+    return results
+
+
+def find_regressions(results: List[BenchmarkResult],
+                     baseline: Dict[str, Dict[str, float]],
+                     tolerance: float) -> List[str]:
+    """
+    Compares the results with a saved baseline. A benchmark regresses when its throughput drops, or its median
+    latency grows, by more than the tolerance. The p99 latencies are too noisy to be compared.
+
+    :return: a description of each regression
+    """
+    regressions: List[str] = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+        expected: Dict[str, float] = baseline[result.name]
+        if result.throughput < expected["throughput"] * (1 - tolerance):
+            regressions.append(f"{result.name}: throughput {result.throughput:,.0f} ops/s, "
+                               f"baseline {expected['throughput']:,.0f} ops/s")
+        if result.p50 > expected["p50"] * (1 + tolerance):
+            regressions.append(f"{result.name}: p50 latency {result.p50 * 1e6:,.1f} us, "
+                               f"baseline {expected['p50'] * 1e6:,.1f} us")
+    return regressions
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    lines: List[str] = [f"{'benchmark':<56}{'ops':>10}{'ops/s':>14}{'p50 us':>12}{'p99 us':>12}"]
+    for result in results:
+        lines.append(f"{result.name:<56}{result.operations:>10}{result.throughput:>14,.0f}"
+                     f"{result.p50 * 1e6:>12,.1f}{result.p99 * 1e6:>12,.1f}")
+    return "\n".join(lines)
+
+
+def main(args: argparse.Namespace) -> int:
+    stream: List[OrderBookMessage] = (recorded_stream(args.file) if args.file
+                                      else synthetic_stream(args.messages, args.depth))
+    results: List[BenchmarkResult] = [
+        result
+        for order_book_class_name in args.order_books
+        for result in run_benchmarks(
+            stream, args.pairs, args.rate, args.repeats, ORDER_BOOK_CLASSES[order_book_class_name])
+    ]
+    print(format_results(results))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fd:
+            json.dump({result.name: result.to_dict() for result in results}, fd, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fd:
+            regressions: List[str] = find_regressions(results, json.load(fd), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if len(regressions) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000, help="number of synthetic diff messages")
+    parser.add_argument("--depth", type=int, default=200, help="levels per side of the synthetic order book")
+    parser.add_argument("--file", default=None, help="JSON lines file with a recorded diff stream")
+    parser.add_argument("--order-books", nargs="+", choices=list(ORDER_BOOK_CLASSES.keys()),
+                        default=list(ORDER_BOOK_CLASSES.keys()), help="order book backends to benchmark")
+    parser.add_argument("--pairs", type=int, default=10, help="trading pairs replayed through the tracker")
+    parser.add_argument("--rate", type=float, default=0,
+                        help="tracker message rate in messages per second, 0 to send them as fast as possible")
+    parser.add_argument("--repeats", type=int, default=3, help="runs of each benchmark, the fastest one is kept")
+    parser.add_argument("--save-baseline", default=None, help="JSON file to save the results to")
+    parser.add_argument("--baseline", default=None, help="JSON file with the results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="relative throughput drop or latency increase reported as a regression")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+"""
+Order book message streams shared by the order book benchmarks.
+
+A recorded stream is a file with one JSON message per line in the form
+{"type": "snapshot" | "diff", "update_id": 1, "bids": [[price, amount], ...], "asks": [[price, amount], ...]},
+starting with a snapshot.
+"""
+
+import json
+import random
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def synthetic_stream(messages: int, depth: int, trading_pair: str = TRADING_PAIR, seed: int = 42
+                     ) -> List[OrderBookMessage]:
+    """
+    Generates a snapshot followed by diff messages with the price and amount strings exchanges send. Most of the
+    updates hit the levels near the top of the book, and the mid price drifts.
+    """
+    rng: random.Random = random.Random(seed)
+    mid_price: float = 10000.0
+    tick: float = 0.5
+    stream: List[OrderBookMessage] = [OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": trading_pair,
+        "update_id": 1,
+        "bids": [[f"{mid_price - tick * (i + 1):.1f}", f"{rng.uniform(0.1, 10):.4f}"] for i in range(depth)],
+        "asks": [[f"{mid_price + tick * (i + 1):.1f}", f"{rng.uniform(0.1, 10):.4f}"] for i in range(depth)],
+    }, timestamp=1)]
+    for update_id in range(2, messages + 2):
+        mid_price += rng.choice([-tick, 0, 0, tick])
+        bids: List[List[str]] = []
+        asks: List[List[str]] = []
+        for _ in range(rng.randint(1, 6)):
+            distance: int = min(int(rng.expovariate(0.2)), depth - 1)
+            amount: float = 0.0 if rng.random() < 0.3 else rng.uniform(0.1, 10)
+            if rng.random() < 0.5:
+                bids.append([f"{mid_price - tick * (distance + 1):.1f}", f"{amount:.4f}"])
+            else:
+                asks.append([f"{mid_price + tick * (distance + 1):.1f}", f"{amount:.4f}"])
+        stream.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=update_id))
+    return stream
+
+
+def recorded_stream(file_path: str, trading_pair: str = TRADING_PAIR) -> List[OrderBookMessage]:
+    stream: List[OrderBookMessage] = []
+    with open(file_path) as fd:
+        for line in fd:
+            message: Dict[str, Any] = json.loads(line)
+            message_type: OrderBookMessageType = (OrderBookMessageType.SNAPSHOT if message["type"] == "snapshot"
+                                                  else OrderBookMessageType.DIFF)
+            stream.append(OrderBookMessage(message_type, {
+                "trading_pair": trading_pair,
+                "update_id": message["update_id"],
+                "bids": message["bids"],
+                "asks": message["asks"],
+            }, timestamp=message["update_id"]))
+    return stream
+
+
+def numpy_levels(message: OrderBookMessage) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The bids and asks of the message as arrays of [price, amount, update_id] rows, the input of the numpy order book
+    updates
+    """
+    bids: np.ndarray = np.array([[row.price, row.amount, row.update_id] for row in message.bids],
+                                dtype=np.float64).reshape(-1, 3)
+    asks: np.ndarray = np.array([[row.price, row.amount, row.update_id] for row in message.asks],
+                                dtype=np.float64).reshape(-1, 3)
+    return bids, asks
@@ -0,0 +1,62 @@
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from test.benchmark.order_book_benchmark import BenchmarkResult, find_regressions, run_benchmarks
+from test.benchmark.order_book_streams import numpy_levels, synthetic_stream
+
+
+class OrderBookBenchmarkTests(unittest.TestCase):
+
+    def test_synthetic_stream(self):
+        stream: List[OrderBookMessage] = synthetic_stream(messages=50, depth=20)
+
+        self.assertEqual(51, len(stream))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, stream[0].type)
+        self.assertEqual(20, len(stream[0].bids))
+        self.assertTrue(all(message.type is OrderBookMessageType.DIFF for message in stream[1:]))
+        self.assertEqual(list(range(2, 52)), [message.update_id for message in stream[1:]])
+        self.assertEqual([message.content for message in stream],
+                         [message.content for message in synthetic_stream(messages=50, depth=20)])
+
+        bids, asks = numpy_levels(stream[0])
+        self.assertEqual((20, 3), bids.shape)
+        self.assertEqual([row.price for row in stream[0].asks], asks[:, 0].tolist())
+
+    def test_run_benchmarks(self):
+        results: List[BenchmarkResult] = run_benchmarks(synthetic_stream(messages=300, depth=20), pairs=2)
+
+        self.assertIn("OrderBook.apply_diffs", [result.name for result in results])
+        self.assertIn("OrderBook.order_book_tracker[2 pairs]", [result.name for result in results])
+        for result in results:
+            self.assertGreater(result.operations, 0)
+            self.assertGreater(result.throughput, 0)
+            self.assertLessEqual(result.p50, result.p99)
+        self.assertEqual(600, results[-1].operations)
+
+    def test_run_benchmarks_on_flat_order_book(self):
+        results: List[BenchmarkResult] = run_benchmarks(synthetic_stream(messages=100, depth=20), pairs=1,
+                                                        order_book_class=FlatOrderBook)
+
+        self.assertTrue(all(result.name.startswith("FlatOrderBook.") for result in results))
+        self.assertIn("FlatOrderBook.apply_numpy_diffs", [result.name for result in results])
+        self.assertEqual(100, results[-1].operations)
+
+    def test_find_regressions(self):
+        baseline = {
+            "apply_diffs": {"operations": 100, "throughput": 1000, "p50": 0.001, "p99": 0.002},
+            "simulate_buy": {"operations": 100, "throughput": 1000, "p50": 0.001, "p99": 0.002},
+        }
+        results = [
+            BenchmarkResult("apply_diffs", 100, 0.11, np.full(100, 0.0011)),
+            BenchmarkResult("simulate_buy", 100, 0.2, np.full(100, 0.002)),
+            BenchmarkResult("apply_snapshot", 1, 1, np.ones(1)),
+        ]
+
+        regressions: List[str] = find_regressions(results, baseline, tolerance=0.25)
+
+        self.assertEqual(2, len(regressions))
+        self.assertTrue(all(regression.startswith("simulate_buy") for regression in regressions))
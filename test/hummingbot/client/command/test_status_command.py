@@ -7,6 +7,8 @@ from unittest.mock import patch, MagicMock
 from hummingbot.client.config.config_helpers import read_system_configs_from_yml
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from test.mock.mock_cli import CLIMockingAssistant
 
 
@@ -78,3 +80,23 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_format_rate_limits_status(self):
+        self.assertEqual("", self.app._format_rate_limits_status())
+
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id="orders", limit=4, time_interval=10),
+                                                        RateLimit(limit_id="balances", limit=10, time_interval=60),
+                                                        RateLimit(limit_id="unused", limit=10, time_interval=60)])
+        self.app.markets = {"binance": MagicMock(_throttler=throttler), "other": MagicMock(_throttler=None)}
+        self.async_run_with_timeout(throttler.execute_task("balances").acquire())
+        for _ in range(3):
+            self.async_run_with_timeout(throttler.execute_task("orders").acquire())
+        throttler.record_rejection("balances", 429)
+
+        lines = self.app._format_rate_limits_status().split("\n")
+        rows = [[cell.strip() for cell in line.split("|")[1:-1]] for line in lines if line.strip().startswith("| ")]
+        self.assertEqual("  Rate limits:", lines[1])
+        self.assertEqual(["Exchange", "Limit", "Used", "Utilization", "Waiting", "Avg wait (ms)", "p99 wait (ms)",
+                          "Max wait (ms)", "Rejections"], rows[0])
+        self.assertEqual([["binance", "balances", "1/10 per 60s", "10%", "0", "0", "0", "0", "1"],
+                          ["binance", "orders", "3/4 per 10s", "75%", "0", "0", "0", "0", "0"]], rows[1:])
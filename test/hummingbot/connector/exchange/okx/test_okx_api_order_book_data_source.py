@@ -2,7 +2,7 @@ import asyncio
 import json
 import re
 import unittest
-from typing import Awaitable
+from typing import Any, Awaitable, Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses.core import aioresponses
@@ -15,6 +15,7 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
 class OkxAPIOrderBookDataSourceUnitTests(unittest.TestCase):
@@ -120,11 +121,11 @@ class OkxAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         asks = list(order_book.ask_entries())
         self.assertEqual(1, len(bids))
         self.assertEqual(41006.3, bids[0].price)
-        self.assertEqual(2, bids[0].amount)
+        self.assertEqual(0.30178218, bids[0].amount)
         self.assertEqual(expected_update_id, bids[0].update_id)
         self.assertEqual(1, len(asks))
         self.assertEqual(41006.8, asks[0].price)
-        self.assertEqual(1, asks[0].amount)
+        self.assertEqual(0.60038921, asks[0].amount)
         self.assertEqual(expected_update_id, asks[0].update_id)
 
     @aioresponses()
@@ -422,12 +423,72 @@ class OkxAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         asks = msg.asks
         self.assertEqual(2, len(bids))
         self.assertEqual(8476.97, bids[0].price)
-        self.assertEqual(12, bids[0].amount)
+        self.assertEqual(256, bids[0].amount)
         self.assertEqual(expected_update_id, bids[0].update_id)
         self.assertEqual(3, len(asks))
         self.assertEqual(8476.98, asks[0].price)
-        self.assertEqual(13, asks[0].amount)
+        self.assertEqual(415, asks[0].amount)
         self.assertEqual(expected_update_id, asks[0].update_id)
+        self.assertEqual(-855196043, msg.content["checksum"])
+
+    @aioresponses()
+    def test_order_book_resynced_on_checksum_mismatch(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.OKX_ORDER_BOOK_PATH)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        snapshot_resp = {
+            "code": "0",
+            "msg": "",
+            "data": [
+                {
+                    "asks": [["3366.8", "9", "0", "3"]],
+                    "bids": [["3366.1", "7", "0", "3"]],
+                    "ts": "1597026383000"
+                }
+            ]
+        }
+        mock_api.get(regex_url, body=json.dumps(snapshot_resp), repeat=True)
+
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        order_book: OrderBook = self.async_run_with_timeout(self.data_source.get_new_order_book(self.trading_pair))
+        tracker._order_books[self.trading_pair] = order_book
+        message_queue: asyncio.Queue = asyncio.Queue()
+        tracker._tracking_message_queues[self.trading_pair] = message_queue
+
+        def diff_event(ts: str, bids: List[List[str]], asks: List[List[str]], checksum: int) -> Dict[str, Any]:
+            return {
+                "arg": {"channel": "books", "instId": self.trading_pair},
+                "action": "update",
+                "data": [{"asks": asks, "bids": bids, "ts": ts, "checksum": checksum}],
+            }
+
+        async def track_until_queue_is_consumed():
+            while not message_queue.empty():
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        self.assertTrue(self.data_source.validates_order_books)
+        self.listening_task = self.ev_loop.create_task(tracker._track_single_book(self.trading_pair))
+
+        # Checksum of "3366.1:7:3366.8:9:3366:6:3368:8" as a signed integer, the way OKX publishes it
+        self.async_run_with_timeout(self.data_source._parse_order_book_diff_message(
+            diff_event("1597026384000", [["3366", "6", "0", "4"]], [["3368", "8", "0", "4"]], -1881014294),
+            message_queue))
+        self.async_run_with_timeout(track_until_queue_is_consumed())
+
+        self.assertEqual({}, tracker.checksum_mismatches)
+        self.assertTrue(tracker._order_book_snapshot_stream.empty())
+
+        # The exchange checksum still covers the previous amount of the best bid
+        self.async_run_with_timeout(self.data_source._parse_order_book_diff_message(
+            diff_event("1597026385000", [["3366.1", "8", "0", "4"]], [], -1881014294),
+            message_queue))
+        self.async_run_with_timeout(track_until_queue_is_consumed())
+        self.async_run_with_timeout(tracker._order_book_resync_tasks[self.trading_pair])
+
+        self.assertEqual({self.trading_pair: 1}, tracker.checksum_mismatches)
+        resync_snapshot: OrderBookMessage = tracker._order_book_snapshot_stream.get_nowait()
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, resync_snapshot.type)
+        self.assertEqual(int(int(snapshot_resp["data"][0]["ts"]) * 1e-3), resync_snapshot.update_id)
 
     @aioresponses()
     def test_listen_for_order_book_snapshots_cancelled_when_fetching_snapshot(self, mock_api):
@@ -511,9 +572,9 @@ class OkxAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         asks = msg.asks
         self.assertEqual(1, len(bids))
         self.assertEqual(41006.3, bids[0].price)
-        self.assertEqual(2, bids[0].amount)
+        self.assertEqual(0.30178218, bids[0].amount)
         self.assertEqual(expected_update_id, bids[0].update_id)
         self.assertEqual(1, len(asks))
         self.assertEqual(41006.8, asks[0].price)
-        self.assertEqual(1, asks[0].amount)
+        self.assertEqual(0.60038921, asks[0].amount)
         self.assertEqual(expected_update_id, asks[0].update_id)
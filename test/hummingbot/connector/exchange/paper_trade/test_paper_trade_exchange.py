@@ -1,9 +1,17 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -21,3 +29,42 @@ class PaperTradeExchangeTests(TestCase):
 
         paper_exchange = create_paper_trade_market(exchange_name="kucoin", trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_market_orders_average_price_sums_decimal_fills(self):
+        trading_pair = "COINALPHA-HBOT"
+        exchange = MockPaperExchange()
+        exchange.new_empty_order_book(trading_pair)
+        order_book = exchange.order_books[trading_pair]
+        order_book.apply_snapshot([OrderBookRow(0.7, 0.1, 1), OrderBookRow(0.3, 0.3, 1)],
+                                  [OrderBookRow(1.1, 0.1, 1), OrderBookRow(1.3, 0.3, 1)],
+                                  1)
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("10"))
+        exchange.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        buy_logger = EventLogger()
+        sell_logger = EventLogger()
+        exchange.add_listener(MarketEvent.BuyOrderCompleted, buy_logger)
+        exchange.add_listener(MarketEvent.SellOrderCompleted, sell_logger)
+        start_timestamp = 1
+        clock = Clock(ClockMode.BACKTEST, 1, start_timestamp, start_timestamp + 10)
+        clock.add_iterator(exchange)
+        clock.backtest_til(start_timestamp)
+        amount = Decimal("0.3")
+        buy_rows = order_book.simulate_buy(amount)
+        sell_rows = order_book.simulate_sell(amount)
+        expected_buy_cost = sum(Decimal(row.price) * Decimal(row.amount) for row in buy_rows)
+        expected_sell_return = sum(Decimal(row.price) * Decimal(row.amount) for row in sell_rows)
+
+        exchange.buy(trading_pair, amount, OrderType.MARKET)
+        exchange.sell(trading_pair, amount, OrderType.MARKET)
+        clock.backtest_til(start_timestamp + exchange.TRADE_EXECUTION_DELAY + 1)
+
+        paid_amount = buy_logger.event_log[0].quote_asset_amount
+        received_amount = sell_logger.event_log[0].quote_asset_amount
+        self.assertEqual(amount * (expected_buy_cost / amount), paid_amount)
+        self.assertEqual(amount * (expected_sell_return / amount), received_amount)
+        # The float total cost of the simulation differs from the Decimal sum in the last digits
+        self.assertNotEqual(amount * (Decimal(order_book.simulate_trade(True, amount).total_cost) / amount),
+                            paid_amount)
+        self.assertNotEqual(amount * (Decimal(order_book.simulate_trade(False, amount).total_cost) / amount),
+                            received_amount)
@@ -1,11 +1,21 @@
+import asyncio
 import unittest
 
-from hummingbot.connector.utils import get_new_client_order_id
+import aiohttp
+from aioresponses import aioresponses
+
+from hummingbot.connector.utils import RateLimitHeadersRESTPostProcessor, get_new_client_order_id
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 
 
 class UtilsTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
+        cls.ev_loop = asyncio.get_event_loop()
         cls.base = "HBOT"
         cls.quote = "COINALPHA"
         cls.trading_pair = f"{cls.base}-{cls.quote}"
@@ -22,3 +32,27 @@ class UtilsTest(unittest.TestCase):
         id2 = get_new_client_order_id(is_buy=True, trading_pair=self.trading_pair, max_id_len=len(id0) - 2)
 
         self.assertEqual(len(id0) - 2, len(id2))
+
+    @aioresponses()
+    def test_rate_limit_headers_post_processor_updates_throttler(self, mocked_api):
+        url = "https://www.test.com/url"
+        throttler = SlidingWindowThrottler(rate_limits=[
+            RateLimit(limit_id="weight", limit=100, time_interval=60),
+            RateLimit(limit_id="orders", limit=10, time_interval=10),
+        ])
+        mocked_api.get(url, body="{}", headers={"X-USED-WEIGHT": "40", "X-ORDER-COUNT": "invalid"})
+        post_processor = RateLimitHeadersRESTPostProcessor(
+            throttler=throttler,
+            limit_id_by_header={"x-used-weight": "weight", "X-ORDER-COUNT": "orders", "X-MISSING": "orders"})
+
+        async def execute_request():
+            async with aiohttp.ClientSession() as client_session:
+                rest_assistant = RESTAssistant(connection=RESTConnection(client_session),
+                                               throttler=throttler,
+                                               rest_post_processors=[post_processor])
+                await rest_assistant.execute_request(url=url, throttler_limit_id="weight", method=RESTMethod.GET)
+
+        self.ev_loop.run_until_complete(execute_request())
+
+        self.assertEqual(40, throttler.capacity_used("weight"))
+        self.assertEqual(0, throttler.capacity_used("orders"))
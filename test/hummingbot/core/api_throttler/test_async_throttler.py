@@ -223,3 +223,41 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         throttler = AsyncThrottler(rate_limits=[])
         context = throttler.execute_task(limit_id="test_limit_id")
         self.assertTrue(context.within_capacity())
+
+    def test_limit_usage(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.throttler.record_rejection(TEST_WEIGHTED_TASK_1_ID, 418)
+
+        usage = {limit_usage.limit_id: limit_usage for limit_usage in self.throttler.limit_usage()}
+        self.assertEqual(5, usage[TEST_WEIGHTED_POOL_ID].capacity_used)
+        self.assertEqual(0.5, usage[TEST_WEIGHTED_POOL_ID].utilization)
+        self.assertEqual(1, usage[TEST_WEIGHTED_POOL_ID].executed_tasks)
+        self.assertEqual(1, usage[TEST_WEIGHTED_POOL_ID].wait_time_histogram[0.0])
+        self.assertEqual([0.5], usage[TEST_WEIGHTED_POOL_ID].rejection_utilizations)
+        self.assertEqual(1, usage[TEST_WEIGHTED_TASK_1_ID].rejections)
+        self.assertEqual(0, usage[TEST_POOL_ID].executed_tasks)
+
+    def test_update_capacity_used(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 3)
+        self.assertEqual(5, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 8)
+        self.assertEqual(8, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.throttler.update_capacity_used("unknown_limit_id", 8)
+
+        # Task 2(weight=1) still fits in the pool(9/10), but not Task 1(weight=5)
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+
+    def test_reported_capacity_used_is_logged_when_limit_is_checked(self):
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 6)
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 4)
+        self.assertEqual(0, len(self.throttler._task_logs))
+
+        # The highest usage reported is logged by the next capacity check of the limit
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(6, self.throttler._task_logs[0].weight)
+        self.assertEqual(6, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertEqual(1, len(self.throttler._task_logs))
@@ -0,0 +1,270 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import LimitWindow, SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0, linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits)
+
+    def tearDown(self) -> None:
+        global_config_map["rate_limits_share_pct"].value = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_limit_window_flushes_expired_tasks(self):
+        window = LimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=10.0), safety_margin_pct=0.1)
+        window.log_task(100, 3)
+        window.log_task(105, 4)
+        self.assertEqual(7, window.capacity_used)
+        self.assertTrue(window.within_capacity(3))
+        self.assertFalse(window.within_capacity(4))
+
+        window.flush(111)
+        self.assertEqual(7, window.capacity_used)
+        window.flush(111.01)
+        self.assertEqual(4, window.capacity_used)
+        self.assertEqual(1, len(window.task_logs))
+        window.flush(200)
+        self.assertEqual(0, window.capacity_used)
+
+    def test_limit_window_available_at(self):
+        window = LimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=10.0), safety_margin_pct=0)
+        window.log_task(100, 3)
+        window.log_task(105, 4)
+        window.log_task(106, 2)
+
+        self.assertEqual(0, window.available_at(1))
+        self.assertEqual(110, window.available_at(2))
+        self.assertEqual(110, window.available_at(4))
+        self.assertEqual(115, window.available_at(5))
+        self.assertEqual(116, window.available_at(10))
+        self.assertEqual(float("inf"), window.available_at(11))
+
+    def test_limit_window_reported_usage_expires_at_interval_end(self):
+        window = LimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=10.0), safety_margin_pct=0)
+        window.log_task(100, 3)
+        window.log_reported_usage(5, until=108)
+        window.log_task(105, 1)
+
+        self.assertEqual(9, window.capacity_used)
+        self.assertEqual(0, window.available_at(1))
+        self.assertEqual(108, window.available_at(3))
+        self.assertEqual(110, window.available_at(8))
+        self.assertEqual(115, window.available_at(10))
+
+        window.flush(107.9)
+        self.assertEqual(9, window.capacity_used)
+        window.flush(108)
+        self.assertEqual(4, window.capacity_used)
+        self.assertEqual(0, window.reported_capacity)
+        self.assertEqual(2, len(window.task_logs))
+
+    def test_acquire_logs_task_once_in_each_related_limit(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_PATH_URL).acquire())
+
+        self.assertEqual(1, self.throttler.get_limit_window(TEST_PATH_URL).capacity_used)
+        self.assertEqual(1, self.throttler.get_limit_window(TEST_POOL_ID).capacity_used)
+        self.assertEqual(0, self.throttler.get_limit_window(TEST_WEIGHTED_POOL_ID).capacity_used)
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+        self.assertEqual(6, self.throttler.get_limit_window(TEST_WEIGHTED_POOL_ID).capacity_used)
+
+        # Another Task 1(weight=5) would exceed the capacity(11/10), but Task 2(weight=1) does not(7/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_PATH_URL).acquire())
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_POOL_ID).acquire())
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.throttler.execute_task(TEST_POOL_ID).acquire(), timeout=0.5)
+
+    def test_acquire_when_tasks_expire(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)],
+                                           retry_interval=0.01)
+        start = time.time()
+
+        async def execute_tasks():
+            for _ in range(3):
+                async with throttler.execute_task(TEST_POOL_ID):
+                    pass
+
+        self.async_run_with_timeout(execute_tasks())
+        self.assertGreaterEqual(time.time() - start, 0.2)
+        self.assertEqual(1, len(throttler.get_limit_window(TEST_POOL_ID).task_logs))
+
+    def test_waiting_tasks_are_woken_up_when_capacity_frees(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2)],
+                                           safety_margin_pct=0)
+        execution_times = []
+
+        async def execute_task(index: int):
+            async with throttler.execute_task(TEST_POOL_ID):
+                execution_times.append((index, time.time()))
+
+        async def execute_tasks():
+            await asyncio.gather(*[execute_task(index) for index in range(5)])
+
+        start = time.time()
+        self.async_run_with_timeout(execute_tasks())
+
+        self.assertEqual([0, 1, 2, 3, 4], [index for index, _ in execution_times])
+        delays = [execution_time - start for _, execution_time in execution_times]
+        self.assertLess(delays[1], 0.05)
+        self.assertGreaterEqual(delays[2], 0.2)
+        self.assertLess(delays[3], 0.25)
+        self.assertGreaterEqual(delays[4], 0.4)
+        self.assertLess(delays[4], 0.45)
+        self.assertEqual(0, throttler.waiting_tasks)
+
+    def test_waiting_tasks_do_not_hold_back_unrelated_tasks(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_PATH_URL).acquire())
+        waiting_task = self.ev_loop.create_task(self.throttler.execute_task(TEST_PATH_URL).acquire())
+        self.async_run_with_timeout(asyncio.sleep(0))
+        self.assertEqual(1, self.throttler.waiting_tasks)
+
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+        # The pool has capacity left, but it is reserved for the task waiting for it
+        pool_task = self.ev_loop.create_task(self.throttler.execute_task(TEST_POOL_ID).acquire())
+        self.async_run_with_timeout(asyncio.sleep(0))
+        self.assertEqual(2, self.throttler.waiting_tasks)
+        self.assertFalse(pool_task.done())
+
+        waiting_task.cancel()
+        self.async_run_with_timeout(pool_task)
+        self.assertEqual(0, self.throttler.waiting_tasks)
+        self.assertEqual(2, self.throttler.get_limit_window(TEST_POOL_ID).capacity_used)
+
+    def test_waiting_tasks_are_released_by_priority(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)],
+                                           safety_margin_pct=0)
+        executed_tasks = []
+
+        async def execute_task(name: str, priority: RequestPriority):
+            async with throttler.execute_task(TEST_POOL_ID, priority=priority):
+                executed_tasks.append(name)
+
+        async def execute_tasks():
+            await execute_task("first", RequestPriority.HOUSEKEEPING)
+            tasks = [asyncio.ensure_future(execute_task(name, priority)) for name, priority in [
+                ("balance", RequestPriority.HOUSEKEEPING),
+                ("status", RequestPriority.STATUS),
+                ("create", RequestPriority.CREATE),
+                ("cancel", RequestPriority.CANCEL),
+                ("other cancel", RequestPriority.CANCEL),
+            ]]
+            await asyncio.sleep(0)
+            self.assertEqual({RequestPriority.CANCEL: 2,
+                              RequestPriority.CREATE: 1,
+                              RequestPriority.STATUS: 1,
+                              RequestPriority.HOUSEKEEPING: 1}, throttler.waiting_tasks_by_priority())
+            await asyncio.gather(*tasks)
+
+        self.async_run_with_timeout(execute_tasks())
+        self.assertEqual(["first", "cancel", "other cancel", "create", "status", "balance"], executed_tasks)
+
+    def test_limit_usage(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.1)],
+                                           safety_margin_pct=0)
+
+        async def execute_tasks():
+            tasks = [asyncio.ensure_future(throttler.execute_task(TEST_POOL_ID).acquire()) for _ in range(3)]
+            await asyncio.sleep(0)
+            usage, = throttler.limit_usage()
+            self.assertEqual(2, usage.capacity_used)
+            self.assertEqual(1, usage.utilization)
+            self.assertEqual(1, usage.waiting_tasks)
+            await asyncio.gather(*tasks)
+
+        self.async_run_with_timeout(execute_tasks())
+        throttler.record_rejection(TEST_POOL_ID, 429)
+
+        usage, = throttler.limit_usage()
+        self.assertEqual(0, usage.waiting_tasks)
+        self.assertEqual(3, usage.executed_tasks)
+        self.assertEqual(2, usage.wait_time_histogram[0.0])
+        self.assertEqual(1, usage.wait_time_histogram[0.5])
+        self.assertGreaterEqual(usage.max_wait_time, 0.1)
+        self.assertAlmostEqual(usage.max_wait_time / 3, usage.average_wait_time)
+        self.assertEqual(0.0, usage.wait_time_percentile(0.5))
+        self.assertEqual(0.5, usage.wait_time_percentile(0.99))
+        self.assertEqual(1, usage.rejections)
+        self.assertEqual([0.5], usage.rejection_utilizations)
+        self.assertEqual(0.5, usage.min_utilization_at_rejection)
+
+    def test_update_capacity_used(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 3)
+        self.assertEqual(5, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 8)
+        self.assertEqual(8, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertEqual(1, len(self.throttler.get_limit_window(TEST_WEIGHTED_POOL_ID).task_logs))
+        self.assertEqual(3, self.throttler.get_limit_window(TEST_WEIGHTED_POOL_ID).reported_capacity)
+        self.throttler.update_capacity_used("unknown_limit_id", 8)
+
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+
+    def test_reported_capacity_is_released_when_the_exchange_interval_ends(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id="WEIGHT", limit=1200, time_interval=60)])
+
+        # Reported one second before the exchange resets its minute count
+        with patch("time.time", return_value=1200 * 60 - 1):
+            throttler.update_capacity_used("WEIGHT", 1100)
+            self.assertEqual(1100, throttler.capacity_used("WEIGHT"))
+            context = throttler.execute_task("WEIGHT")
+            self.assertTrue(context.within_capacity())
+            throttler.update_capacity_used("WEIGHT", 1200)
+            self.assertFalse(context.within_capacity())
+            self.assertEqual(1200 * 60, context.available_at())
+
+        with patch("time.time", return_value=1200 * 60):
+            self.assertEqual(0, throttler.capacity_used("WEIGHT"))
+            context.flush()
+            self.assertTrue(context.within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+from typing import Dict, List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+def fill_event(trade_type: TradeType, price: float, amount: float, timestamp: float = 10) -> OrderFilledEvent:
+    return OrderFilledEvent(timestamp=timestamp, order_id="order", trading_pair="COINALPHA-HBOT",
+                            trade_type=trade_type, order_type=None, price=price, amount=amount, trade_fee=None)
+
+
+def levels(rows) -> List[List[float]]:
+    return [[row.price, row.amount] for row in rows]
+
+
+class CompositeOrderBookUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64),
+                                             np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64))
+
+    def assert_composite_book(self, order_book: CompositeOrderBook):
+        """
+        Checks the composite entries against the original entries minus the recorded fills
+        """
+        for original_rows, traded_rows, composite_rows in (
+                (order_book.original_bid_entries(), order_book.traded_order_book.bid_entries(),
+                 order_book.bid_entries()),
+                (order_book.original_ask_entries(), order_book.traded_order_book.ask_entries(),
+                 order_book.ask_entries())):
+            traded: Dict[float, float] = {row.price: row.amount for row in traded_rows}
+            expected = [[row.price, row.amount - traded.get(row.price, 0)]
+                        for row in original_rows
+                        if row.amount > traded.get(row.price, 0)]
+            self.assertEqual(expected, levels(composite_rows))
+
+    def test_record_filled_orders(self):
+        self.order_book.record_filled_order(fill_event(TradeType.BUY, 11, 0.25))
+        self.order_book.record_filled_order(fill_event(TradeType.BUY, 11, 0.5))
+        self.assertEqual([[11, 0.25], [12, 2], [13, 3]], levels(self.order_book.ask_entries()))
+        self.assertEqual([[11, 1], [12, 2], [13, 3]], levels(self.order_book.original_ask_entries()))
+
+        self.order_book.record_filled_order(fill_event(TradeType.SELL, 10, 1))
+        self.order_book.record_filled_order(fill_event(TradeType.SELL, 9, 0.5))
+        self.assertEqual([[9, 1.5], [8, 3]], levels(self.order_book.bid_entries()))
+        self.assertEqual(9, self.order_book.get_price(False))
+        self.assertEqual(11, self.order_book.get_price(True))
+        self.assertEqual(1.5 + 3, self.order_book.get_volume_for_price(False, 8).result_volume)
+        self.assertEqual([[9, 1.5, 1], [8, 3, 1]], self.order_book.to_numpy()[0].tolist())
+
+        self.order_book.clear_traded_order_book()
+        self.assertEqual([[10, 1], [9, 2], [8, 3]], levels(self.order_book.bid_entries()))
+        self.assertEqual(10, self.order_book.get_price(False))
+
+    def test_diffs_update_composite_levels(self):
+        self.order_book.record_filled_order(fill_event(TradeType.SELL, 10, 5))
+        self.order_book.record_filled_order(fill_event(TradeType.SELL, 9, 1))
+        # A consumed level only keeps the filled amount it hides
+        self.assertEqual([[10, 1], [9, 1]], levels(self.order_book.traded_order_book.bid_entries()))
+
+        # The original level grows beyond the fills
+        self.order_book.apply_numpy_diffs(np.array([[10, 3, 2]], dtype=np.float64),
+                                          np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([[10, 2], [9, 1], [8, 3]], levels(self.order_book.bid_entries()))
+
+        # The fills expire with the level they consumed
+        self.order_book.apply_numpy_diffs(np.array([[9, 0, 3]], dtype=np.float64),
+                                          np.empty((0, 3), dtype=np.float64))
+        self.order_book.apply_numpy_diffs(np.array([[9, 4, 4]], dtype=np.float64),
+                                          np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([[10, 2], [9, 4], [8, 3]], levels(self.order_book.bid_entries()))
+        self.assertEqual([[10, 1]], levels(self.order_book.traded_order_book.bid_entries()))
+
+        # A crossing ask removes the bids it crosses, and their fills
+        self.order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64),
+                                          np.array([[9.5, 1, 5]], dtype=np.float64))
+        self.assertEqual([[9, 4], [8, 3]], levels(self.order_book.bid_entries()))
+        self.assertEqual([[9.5, 1], [11, 1], [12, 2], [13, 3]], levels(self.order_book.ask_entries()))
+        self.assertEqual([], levels(self.order_book.traded_order_book.bid_entries()))
+        self.assertEqual(5, self.order_book.last_diff_uid)
+
+    def test_snapshot_expires_fills_of_missing_levels(self):
+        self.order_book.record_filled_order(fill_event(TradeType.BUY, 12, 1))
+        self.order_book.record_filled_order(fill_event(TradeType.BUY, 13, 1))
+        self.order_book.apply_numpy_snapshot(np.array([[10, 1, 6]], dtype=np.float64),
+                                             np.array([[12, 3, 6], [14, 1, 6]], dtype=np.float64))
+
+        self.assertEqual([[12, 2], [14, 1]], levels(self.order_book.ask_entries()))
+        self.assertEqual([[12, 1]], levels(self.order_book.traded_order_book.ask_entries()))
+        self.assertEqual(6, self.order_book.snapshot_uid)
+
+    def test_depth_limited_composite_book(self):
+        self.order_book.record_filled_order(fill_event(TradeType.SELL, 9, 1))
+        self.order_book.max_depth = 2
+        self.assertEqual(2, self.order_book.max_depth)
+        self.assertEqual([[10, 1], [9, 1]], levels(self.order_book.bid_entries()))
+
+        # Removing a level refills the book from the overflow store
+        self.order_book.apply_numpy_diffs(np.array([[10, 0, 2]], dtype=np.float64),
+                                          np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([[9, 1], [8, 3]], levels(self.order_book.bid_entries()))
+        self.assert_composite_book(self.order_book)
+
+    def test_random_diffs_and_fills(self):
+        rng = random.Random(42)
+        for max_depth in (0, 5):
+            order_book = CompositeOrderBook()
+            order_book.max_depth = max_depth
+            order_book.apply_numpy_snapshot(
+                np.array([[price, rng.randint(1, 5), 1] for price in range(80, 100)], dtype=np.float64),
+                np.array([[price, rng.randint(1, 5), 1] for price in range(101, 121)], dtype=np.float64))
+            for update_id in range(2, 500):
+                if rng.random() < 0.3:
+                    is_buy = rng.random() < 0.5
+                    rows = list(order_book.ask_entries() if is_buy else order_book.bid_entries())
+                    if len(rows) > 0:
+                        row = rows[rng.randint(0, min(len(rows), 3) - 1)]
+                        order_book.record_filled_order(fill_event(TradeType.BUY if is_buy else TradeType.SELL,
+                                                                  row.price, rng.choice([0.5, 1, 10])))
+                else:
+                    order_book.apply_numpy_diffs(
+                        np.array([[rng.randint(85, 105), rng.choice([0, 0, 1, 2]), update_id]], dtype=np.float64),
+                        np.array([[rng.randint(95, 115), rng.choice([0, 0, 1, 2]), update_id]], dtype=np.float64))
+                self.assert_composite_book(order_book)
+
+                bids = list(order_book.bid_entries())
+                asks = list(order_book.ask_entries())
+                if len(bids) > 0:
+                    self.assertEqual(bids[0].price, order_book.get_price(False))
+                if len(asks) > 0:
+                    self.assertEqual(asks[0].price, order_book.get_price(True))
+
+
+if __name__ == "__main__":
+    unittest.main()
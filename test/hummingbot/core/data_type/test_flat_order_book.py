@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def random_levels(rng: random.Random, low: int, high: int, update_id: int, count: int) -> np.ndarray:
+    return np.array([[rng.randint(low, high), rng.choice([0, 0.5, 1, 2]), update_id] for _ in range(count)],
+                    dtype=np.float64)
+
+
+def entries(order_book: OrderBook) -> List[List[float]]:
+    bids, asks = order_book.snapshot
+    return [bids.values.tolist(), asks.values.tolist()]
+
+
+class FlatOrderBookUnitTest(unittest.TestCase):
+    def assert_same_books(self, expected: OrderBook, actual: FlatOrderBook):
+        self.assertEqual(entries(expected), entries(actual))
+        self.assertEqual([side.tolist() for side in expected.to_numpy(2)],
+                         [side.tolist() for side in actual.to_numpy(2)])
+        self.assertEqual(expected.snapshot_uid, actual.snapshot_uid)
+        self.assertEqual(expected.last_diff_uid, actual.last_diff_uid)
+        self.assertEqual(expected.stale, actual.stale)
+        for is_buy in (True, False):
+            if len(list(expected.ask_entries() if is_buy else expected.bid_entries())) > 0:
+                self.assertEqual(expected.get_price(is_buy), actual.get_price(is_buy))
+                np.testing.assert_equal(expected.get_vwap_for_volume(is_buy, 3).result_price,
+                                        actual.get_vwap_for_volume(is_buy, 3).result_price)
+                self.assertEqual([result.rows() for result in expected.simulate_trades(is_buy, [1, 3, 10])],
+                                 [result.rows() for result in actual.simulate_trades(is_buy, [1, 3, 10])])
+
+    def test_apply_snapshot_and_diffs(self):
+        order_book = FlatOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [3, 1, 1], [2, 1, 1]], dtype=np.float64),
+                                        np.array([[5, 1, 1], [4, 1, 1], [6, 1, 1]], dtype=np.float64))
+        self.assertEqual([3, 2, 1], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([4, 5, 6], [row.price for row in order_book.ask_entries()])
+
+        # Replace a level, delete a level and insert a level on each side.
+        order_book.apply_numpy_diffs(np.array([[2, 5, 2], [3, 0, 2], [2.5, 1, 2]], dtype=np.float64),
+                                     np.array([[5, 5, 2], [4, 0, 2], [4.5, 1, 2]], dtype=np.float64))
+        self.assertEqual([[2.5, 1, 2], [2, 5, 2], [1, 1, 1]],
+                         [[row.price, row.amount, row.update_id] for row in order_book.bid_entries()])
+        self.assertEqual([[4.5, 1, 2], [5, 5, 2], [6, 1, 1]],
+                         [[row.price, row.amount, row.update_id] for row in order_book.ask_entries()])
+        self.assertEqual(2.5, order_book.get_price(False))
+        self.assertEqual(4.5, order_book.get_price(True))
+
+        # A newer crossing bid removes the overlapping asks.
+        order_book.apply_numpy_diffs(np.array([[5, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([5, 2.5, 2, 1], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([6], [row.price for row in order_book.ask_entries()])
+
+    def test_empty_order_book_price(self):
+        order_book = FlatOrderBook()
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(True)
+
+    def test_matches_order_book_on_random_streams(self):
+        for dex in (False, True):
+            for max_depth in (0, 3):
+                rng = random.Random(42)
+                expected = OrderBook(dex=dex, max_depth=max_depth)
+                actual = FlatOrderBook(dex=dex, max_depth=max_depth)
+                for update_id in range(1, 300):
+                    if update_id % 100 == 1:
+                        bids = random_levels(rng, 80, 100, update_id, 15)
+                        asks = random_levels(rng, 101, 120, update_id, 15)
+                        expected.apply_numpy_snapshot(bids, asks)
+                        actual.apply_numpy_snapshot(bids, asks)
+                    else:
+                        bids = random_levels(rng, 85, 105, update_id, 4)
+                        asks = random_levels(rng, 95, 115, update_id, 4)
+                        expected.apply_numpy_diffs(bids, asks)
+                        actual.apply_numpy_diffs(bids, asks)
+                    self.assert_same_books(expected, actual)
+
+    def test_depth_limited_order_book_is_stale_when_levels_run_dry(self):
+        order_book = FlatOrderBook(max_depth=2)
+        order_book.apply_numpy_snapshot(np.array([[price, 1, 1] for price in range(100, 94, -1)], dtype=np.float64),
+                                        np.empty((0, 3), dtype=np.float64))
+        order_book.apply_numpy_diffs(np.array([[price, 0, 2] for price in range(100, 96, -1)], dtype=np.float64),
+                                     np.empty((0, 3), dtype=np.float64))
+        order_book.apply_numpy_diffs(np.array([[90, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+
+        self.assertEqual([], [row.price for row in order_book.bid_entries()])
+        self.assertTrue(order_book.stale)
+
+    def test_max_depth_change(self):
+        order_book = FlatOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1]], dtype=np.float64))
+        order_book.max_depth = 1
+        self.assertEqual([3], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([4], [row.price for row in order_book.ask_entries()])
+
+        order_book.apply_numpy_diffs(np.array([[3, 0, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([2], [row.price for row in order_book.bid_entries()])
+
+        order_book.max_depth = 0
+        self.assertEqual([2], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([4, 5], [row.price for row in order_book.ask_entries()])
+
+
+if __name__ == "__main__":
+    unittest.main()
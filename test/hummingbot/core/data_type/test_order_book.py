@@ -2,7 +2,17 @@
 
 import logging
 import unittest
+import zlib
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookDiffMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent, TradeType
 import numpy as np
 
 
@@ -50,6 +60,388 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_volume_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 0.5)
+        self.assertEqual(10, result.result_price)
+        result = order_book.get_price_for_volume(True, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((11 + 12) / 2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((10 + 9 * 2 + 8) / 4, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 7)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 30)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(30, result.result_volume)
+        result = order_book.get_price_for_quote_volume(False, 1000)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(10 + 18 + 24, result.result_volume)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(11 + 12, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 100)
+        self.assertEqual(10 + 18 + 24, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 12.5)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 9)
+        self.assertEqual(9, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(True, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(True, 13)
+        self.assertEqual(13, result.result_price)
+        self.assertEqual(11 + 24 + 39, result.result_volume)
+        result = order_book.get_quote_volume_for_price(False, 9.5)
+        self.assertEqual(10, result.result_price)
+        self.assertEqual(10, result.result_volume)
+
+        self.assertEqual([0, 1, 3, 6, 6],
+                         order_book.get_volumes_for_prices(True, np.array([10.5, 11, 12.5, 13, 20])).tolist())
+        self.assertEqual([0, 10, 28, 52],
+                         order_book.get_volumes_for_prices(False, [11, 10, 9, 1], quote_volume=True).tolist())
+
+    def test_prices_and_vwaps_for_volumes(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        volumes = [0.5, 1, 2, 2, 4.5, 6, 7]
+
+        for is_buy in (True, False):
+            prices, vwaps = order_book.get_prices_and_vwaps_for_volumes(is_buy, volumes)
+            np.testing.assert_equal([order_book.get_price_for_volume(is_buy, volume).result_price
+                                     for volume in volumes], prices)
+            np.testing.assert_allclose([order_book.get_vwap_for_volume(is_buy, volume).result_price
+                                        for volume in volumes], vwaps)
+
+        prices, vwaps = order_book.get_prices_and_vwaps_for_volumes(True, [])
+        self.assertEqual(0, len(prices))
+        with self.assertRaises(ValueError):
+            order_book.get_prices_and_vwaps_for_volumes(True, [2, 1])
+
+    def test_volume_queries_follow_diffs(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(12, order_book.get_price_for_volume(True, 2).result_price)
+
+        order_book.apply_numpy_diffs(np.array([[10, 0, 2]], dtype=np.float64),
+                                     np.array([[11, 5, 2]], dtype=np.float64))
+        self.assertEqual(11, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(9, order_book.get_price_for_volume(False, 2).result_price)
+        self.assertEqual(2, order_book.get_vwap_for_volume(False, 5).result_volume)
+        self.assertEqual(5, order_book.get_volume_for_price(True, 11).result_volume)
+        self.assertEqual([2, 2], order_book.get_volumes_for_prices(False, [9, 8]).tolist())
+
+    def test_simulate_trades(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 2]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 2, 2]], dtype=np.float64))
+
+        result = order_book.simulate_trade(True, 2)
+        self.assertTrue(result.is_buy)
+        self.assertEqual([11, 12], result.prices.tolist())
+        self.assertEqual([1, 1], result.amounts.tolist())
+        self.assertEqual([1, 2], result.update_ids.tolist())
+        self.assertEqual(2, result.filled_amount)
+        self.assertEqual(23, result.total_cost)
+        self.assertEqual(11.5, result.average_price)
+        self.assertAlmostEqual(0.5 / 11 * 1e4, result.slippage_bps)
+        self.assertEqual([OrderBookRow(11, 1, 1), OrderBookRow(12, 1, 2)], order_book.simulate_buy(2))
+        self.assertEqual([OrderBookRow(10, 1, 1), OrderBookRow(9, 0.5, 2)], order_book.simulate_sell(1.5))
+
+        results = order_book.simulate_trades(False, [0, 1, 2.5, 5])
+        self.assertEqual([0, 1, 2.5, 3], [result.filled_amount for result in results])
+        self.assertEqual([[], [10], [10, 9], [10, 9]], [result.prices.tolist() for result in results])
+        self.assertTrue(np.isnan(results[0].average_price))
+        self.assertEqual(28 / 3, results[3].average_price)
+        self.assertAlmostEqual((10 - 28 / 3) / 10 * 1e4, results[3].slippage_bps)
+        with self.assertRaises(ValueError):
+            order_book.simulate_trades(False, [2, 1])
+
+    def test_simulate_zero_amount_quotes_best_level(self):
+        order_book = OrderBook()
+        self.assertEqual([], order_book.simulate_buy(0))
+
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 2]], dtype=np.float64),
+                                        np.array([[11, 1, 3], [12, 2, 4]], dtype=np.float64))
+
+        self.assertEqual([OrderBookRow(11, 0, 3)], order_book.simulate_buy(0))
+        self.assertEqual([OrderBookRow(10, 0, 1)], order_book.simulate_sell(0))
+        self.assertEqual([], order_book.simulate_trade(True, 0).rows())
+
+    def test_apply_diff_messages(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64))
+        messages = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 2,
+                "bids": [["10", "0"], ["9.5", "3"]],
+                "asks": [["11", "4"]],
+            }, timestamp=1),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 3,
+                "bids": [["9.5", "1.5", "ignored"]],
+                "asks": [["12", "0"], ["13", "1"]],
+            }, timestamp=2),
+        ]
+        order_book.apply_diff_messages(messages)
+
+        self.assertEqual([(9.5, 1.5, 3), (9, 2, 1)], list(order_book.bid_entries()))
+        self.assertEqual([(11, 4, 2), (13, 1, 3)], list(order_book.ask_entries()))
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(9.5, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
+    def test_apply_compact_diff_messages(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64))
+        messages = [
+            OrderBookDiffMessage("COINALPHA-HBOT", 2, bids=[["10", "0"], ["9.5", "3"]], asks=[["11", "4"]]),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 3,
+                "bids": [["9.5", "1.5"]],
+                "asks": [],
+            }, timestamp=2),
+            OrderBookDiffMessage("COINALPHA-HBOT", 4, bids=[], asks=[[12, 0], [13, 1]]),
+        ]
+        order_book.apply_diff_messages(messages)
+
+        self.assertEqual([(9.5, 1.5, 3), (9, 2, 1)], list(order_book.bid_entries()))
+        self.assertEqual([(11, 4, 2), (13, 1, 4)], list(order_book.ask_entries()))
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_apply_diff_messages_coalesced(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64))
+        messages = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 2,
+                "bids": [["10", "5"], ["9", "0"]],
+                "asks": [["11", "4"]],
+            }, timestamp=1),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 3,
+                "bids": [["10", "0"], ["9", "7"]],
+                "asks": [["11", "0"], ["12", "6"]],
+            }, timestamp=2),
+        ]
+        collapsed_levels = order_book.apply_diff_messages(messages, coalesce=True)
+
+        self.assertEqual(3, collapsed_levels)
+        self.assertEqual([(9, 7, 3)], list(order_book.bid_entries()))
+        self.assertEqual([(12, 6, 3)], list(order_book.ask_entries()))
+        self.assertEqual(3, order_book.last_diff_uid)
+
+    def test_depth_limited_order_book(self):
+        order_book = OrderBook(max_depth=2)
+        bids_array = np.array([[10, 1, 1], [9, 1, 1], [8, 1, 1], [7, 1, 1], [6, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 1, 1], [13, 1, 1], [14, 1, 1], [15, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual([10, 9], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([11, 12], [row.price for row in order_book.ask_entries()])
+
+        # Removed levels are refilled from the overflow store
+        order_book.apply_numpy_diffs(np.array([[10, 0, 2]], dtype=np.float64),
+                                     np.array([[11, 0, 2], [12, 0, 2]], dtype=np.float64))
+        self.assertEqual([9, 8], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([13, 14], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(9, order_book.get_price(False))
+        self.assertEqual(13, order_book.get_price(True))
+
+        # New levels outside the top levels go to the overflow store, better ones push levels out of the book
+        order_book.apply_numpy_diffs(np.array([[7.5, 1, 3], [9.5, 1, 3]], dtype=np.float64),
+                                     np.array([[20, 1, 3]], dtype=np.float64))
+        self.assertEqual([9.5, 9], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([13, 14], [row.price for row in order_book.ask_entries()])
+
+        order_book.apply_numpy_diffs(np.array([[9.5, 0, 4], [9, 0, 4]], dtype=np.float64),
+                                     np.array([[13, 0, 4], [14, 0, 4]], dtype=np.float64))
+        self.assertEqual([8, 7.5], [row.price for row in order_book.bid_entries()])
+        # Levels beyond the overflow store capacity were dropped with the snapshot, so the level at 15 may still be
+        # live: the level at 20 was not placed, and the ask side can't be served until the next snapshot
+        self.assertEqual([], [row.price for row in order_book.ask_entries()])
+        self.assertTrue(order_book.stale)
+
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertFalse(order_book.stale)
+        self.assertEqual([11, 12], [row.price for row in order_book.ask_entries()])
+
+    def test_depth_limited_order_book_is_stale_when_overflow_runs_dry(self):
+        order_book = OrderBook(max_depth=2)
+        bids_array = np.array([[price, 1, 1] for price in range(100, 94, -1)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, np.empty((0, 3), dtype=np.float64))
+        self.assertFalse(order_book.stale)
+
+        order_book.apply_numpy_diffs(np.array([[price, 0, 2] for price in range(100, 96, -1)], dtype=np.float64),
+                                     np.empty((0, 3), dtype=np.float64))
+        self.assertTrue(order_book.stale)
+
+        # The levels at 96 and 95 were dropped but are still live, so a level at 90 must not become the best bid
+        order_book.apply_numpy_diffs(np.array([[90, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([], [row.price for row in order_book.bid_entries()])
+        self.assertRaises(EnvironmentError, order_book.get_price, False)
+        self.assertTrue(order_book.stale)
+
+        # Levels better than the dropped ones can be placed, and refill the book
+        order_book.apply_numpy_diffs(np.array([[98, 1, 4], [97, 1, 4]], dtype=np.float64),
+                                     np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([98, 97], [row.price for row in order_book.bid_entries()])
+        self.assertFalse(order_book.stale)
+
+    def test_depth_limited_order_book_refills_after_overlap_truncation(self):
+        order_book = OrderBook(max_depth=1)
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 1, 1], [8, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 1, 1]], dtype=np.float64))
+        order_book.apply_numpy_diffs(np.array([[11.5, 1, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+
+        self.assertEqual([11.5], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([12], [row.price for row in order_book.ask_entries()])
+
+    def test_max_depth_change(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 1, 1], [8, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 1, 1], [13, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        order_book.max_depth = 1
+        self.assertEqual(1, order_book.max_depth)
+        self.assertEqual([10], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(1, order_book.get_price_for_volume(True, 2).result_volume)
+
+        order_book.max_depth = 0
+        self.assertEqual([10, 9], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([11, 12], [row.price for row in order_book.ask_entries()])
+
+    def test_to_numpy(self):
+        order_book = OrderBook(max_depth=2)
+        bids_array = np.array([[9, 2, 1], [10, 1, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[12, 5, 1], [11, 4, 1], [13, 6, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        self.assertEqual([[10, 1, 1], [9, 2, 1]], bids.tolist())
+        self.assertEqual([[11, 4, 1], [12, 5, 1]], asks.tolist())
+        self.assertEqual(bids.tolist(), order_book.snapshot[0].values.tolist())
+
+        bids, asks = order_book.to_numpy(depth=1)
+        self.assertEqual([[10, 1, 1]], bids.tolist())
+        self.assertEqual([[11, 4, 1]], asks.tolist())
+
+        bids, asks = OrderBook().to_numpy()
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+    def test_checksum(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 4, 1], [12, 5, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual(zlib.crc32(b"10.0:1.0:11.0:4.0:9.0:2.0:12.0:5.0"), order_book.checksum(depth=2))
+        self.assertEqual(zlib.crc32(b"10.0:1.0:11.0:4.0:9.0:2.0:12.0:5.0:8.0:3.0"), order_book.checksum(depth=5))
+        self.assertEqual(zlib.crc32(b"11-4.010-1.0"),
+                         order_book.checksum(depth=1,
+                                             level_format=lambda price, amount: f"{int(price)}-{amount}",
+                                             interleave=False,
+                                             asks_first=True,
+                                             separator=""))
+
+        order_book.apply_diffs([OrderBookRow(10, 0, 2)], [], 2)
+        self.assertEqual(zlib.crc32(b"9.0:2.0:11.0:4.0"), order_book.checksum(depth=1))
+        self.assertEqual(zlib.crc32(b""), OrderBook().checksum(depth=10))
+
+    def test_composite_order_book_to_numpy(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[9, 2, 1], [10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 4, 1]], dtype=np.float64))
+
+        bids, asks = order_book.to_numpy()
+        self.assertEqual([[10, 1, 1], [9, 2, 1]], bids.tolist())
+        self.assertEqual([[11, 4, 1]], asks.tolist())
+        self.assertEqual([[10, 1, 1]], order_book.to_numpy(depth=1)[0].tolist())
+
+    def test_top_of_book_changed_event(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChanged, event_logger)
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual((10, 11, 1), event_logger.event_log[0])
+
+        # Changes below the top of the book don't trigger events
+        order_book.apply_numpy_diffs(np.array([[9, 5, 2]], dtype=np.float64), np.array([[12, 0, 2]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_numpy_diffs(np.array([[10, 0, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(2, len(event_logger.event_log))
+        self.assertEqual((9, 11, 3), event_logger.event_log[1])
+
+    def test_top_of_book_changed_event_tolerance(self):
+        order_book = OrderBook()
+        order_book.top_of_book_tolerance = 0.01
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChanged, event_logger)
+        order_book.apply_numpy_snapshot(np.array([[100, 1, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+
+        # Moves are measured from the prices of the last event
+        order_book.apply_numpy_diffs(np.array([[100.5, 1, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        order_book.apply_numpy_diffs(np.array([[100.9, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+        order_book.apply_numpy_diffs(np.array([[101.5, 1, 4]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(2, len(event_logger.event_log))
+        self.assertEqual((101.5, 101, 4), event_logger.event_log[1])
+
+        with self.assertRaises(ValueError):
+            order_book.top_of_book_tolerance = -1
+
+    def test_trade_flow(self):
+        order_book = OrderBook()
+        order_book.trade_flow.add_window(10)
+        order_book.trade_flow.history_size = 2
+        order_book.apply_trade(OrderBookTradeEvent("COINALPHA-HBOT", 1000, TradeType.BUY, 10, 1))
+        order_book.apply_trade(OrderBookTradeEvent("COINALPHA-HBOT", 1005, TradeType.SELL, 9, 2))
+        order_book.apply_trade(OrderBookTradeEvent("COINALPHA-HBOT", 1012, TradeType.BUY, 11, 3))
+
+        self.assertEqual(11, order_book.last_trade_price)
+        stats = order_book.trade_flow.stats(10)
+        self.assertEqual(2, stats.trade_count)
+        self.assertEqual(3, stats.buy_volume)
+        self.assertEqual(2, stats.sell_volume)
+        self.assertAlmostEqual(51 / 5, stats.vwap)
+        self.assertEqual([[1005, 9, 2, 0], [1012, 11, 3, 1]], order_book.trade_flow.recent_trades().tolist())
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,81 @@
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_diff_window import OrderBookDiffWindow
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class OrderBookDiffWindowTests(unittest.TestCase):
+
+    @staticmethod
+    def diff_message(update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=float(update_id))
+
+    @staticmethod
+    def snapshot_message(update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=float(update_id))
+
+    def test_diffs_are_evicted_beyond_capacity(self):
+        window = OrderBookDiffWindow(capacity=2)
+        order_book = OrderBook()
+        order_book.apply_diff_messages([self.diff_message(1, [["10", "1"]], []),
+                                        self.diff_message(2, [], [["11", "1"]]),
+                                        self.diff_message(3, [["9", "1"]], [["12", "1"]])],
+                                       diff_window=window)
+
+        self.assertEqual(2, len(window))
+        self.assertEqual([2, 3], window.update_ids)
+        self.assertEqual(1, window.last_evicted_update_id)
+
+        window.capacity = 1
+        self.assertEqual([3], window.update_ids)
+        self.assertEqual(2, window.last_evicted_update_id)
+
+        window.clear()
+        self.assertEqual(0, len(window))
+        self.assertEqual(-1, window.last_evicted_update_id)
+
+    def test_restore_replays_diffs_newer_than_snapshot(self):
+        window = OrderBookDiffWindow(capacity=10)
+        order_book = OrderBook()
+        order_book.apply_diff_messages([self.diff_message(1, [["10", "1"]], [["11", "1"]]),
+                                        self.diff_message(2, [["10", "2"]], [["11", "0"]]),
+                                        self.diff_message(3, [["9.5", "1"]], [["12", "3"]]),
+                                        self.diff_message(4, [["9.5", "0"], ["9.8", "4"]], [])],
+                                       coalesce=True,
+                                       diff_window=window)
+
+        replayed = order_book.restore_from_snapshot_and_diff_window(
+            self.snapshot_message(2, [["10", "5"], ["9", "1"]], [["11.5", "1"]]), window)
+
+        self.assertEqual(2, replayed)
+        self.assertEqual([(10, 5, 2), (9.8, 4, 4), (9, 1, 2)], list(order_book.bid_entries()))
+        self.assertEqual([(11.5, 1, 2), (12, 3, 3)], list(order_book.ask_entries()))
+        self.assertEqual(2, order_book.snapshot_uid)
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_restore_without_newer_diffs(self):
+        window = OrderBookDiffWindow(capacity=10)
+        order_book = OrderBook()
+        order_book.apply_diff_messages([self.diff_message(1, [["10", "1"]], [])], diff_window=window)
+
+        replayed = order_book.restore_from_snapshot_and_diff_window(
+            self.snapshot_message(5, [["9", "1"]], [["11", "1"]]), window)
+
+        self.assertEqual(0, replayed)
+        self.assertEqual([(9, 1, 5)], list(order_book.bid_entries()))
+        self.assertEqual([(11, 1, 5)], list(order_book.ask_entries()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+from hummingbot.core.data_type.order_book_message import OrderBookDiffMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +248,74 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+
+class OrderBookDiffMessageTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.message = OrderBookDiffMessage(
+            trading_pair="COINALPHA-HBOT",
+            update_id=5,
+            bids=[["10.5", "1"], ["10", "2", "ignored"]],
+            asks=[[11, 3]],
+            timestamp=1640000000.0,
+            first_update_id=3,
+            checksum=1234,
+        )
+
+    def test_diff_message_properties(self):
+        self.assertEqual(OrderBookMessageType.DIFF, self.message.type)
+        self.assertEqual("COINALPHA-HBOT", self.message.trading_pair)
+        self.assertEqual(5, self.message.update_id)
+        self.assertEqual(3, self.message.first_update_id)
+        self.assertEqual(-1, self.message.trade_id)
+        self.assertTrue(self.message.has_update_id)
+        self.assertFalse(self.message.has_trade_id)
+        self.assertEqual([10.5, 1, 10, 2], list(self.message.bid_levels))
+        self.assertEqual([OrderBookRow(10.5, 1, 5), OrderBookRow(10, 2, 5)], self.message.bids)
+        self.assertEqual([OrderBookRow(11, 3, 5)], self.message.asks)
+        self.assertFalse(hasattr(self.message, "__dict__"))
+
+        message = OrderBookDiffMessage(trading_pair="COINALPHA-HBOT", update_id=5, bids=[], asks=[])
+        self.assertEqual(5, message.first_update_id)
+        self.assertEqual([], message.bids)
+        self.assertNotIn("checksum", message.content)
+
+    def test_order_book_message_view(self):
+        expected_content = {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 5,
+            "first_update_id": 3,
+            "bids": [[10.5, 1], [10, 2]],
+            "asks": [[11, 3]],
+            "checksum": 1234,
+        }
+        self.assertEqual(expected_content, self.message.content)
+
+        message = self.message.to_order_book_message()
+        self.assertIsInstance(message, OrderBookMessage)
+        self.assertEqual(expected_content, message.content)
+        self.assertEqual(1640000000.0, message.timestamp)
+        self.assertEqual(self.message.bids, message.bids)
+        self.assertEqual(self.message, message)
+
+        compact_message = OrderBookDiffMessage.from_order_book_message(message)
+        self.assertEqual(expected_content, compact_message.content)
+        self.assertEqual(1640000000.0, compact_message.timestamp)
+
+    def test_comparisons(self):
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 5}, timestamp=1)
+        later_snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {"update_id": 6}, timestamp=1)
+
+        self.assertEqual(diff, self.message)
+        self.assertEqual(hash(OrderBookDiffMessage("COINALPHA-HBOT", 5, [], [])), hash(self.message))
+        self.assertNotEqual(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {"update_id": 5}), self.message)
+        self.assertTrue(self.message < later_snapshot)
+        self.assertTrue(OrderBookDiffMessage("COINALPHA-HBOT", 4, [], [], timestamp=1) < self.message)
+
+    def test_messages_without_timestamp_can_be_sorted(self):
+        message = OrderBookDiffMessage("COINALPHA-HBOT", 5, [], [])
+
+        self.assertIsNotNone(message.timestamp)
+        self.assertCountEqual([self.message, message], sorted([self.message, message]))
+        self.assertCountEqual([self.message, message], sorted([message, self.message]))
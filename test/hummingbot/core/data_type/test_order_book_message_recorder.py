@@ -0,0 +1,183 @@
+import os
+import tempfile
+import unittest
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookDiffMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_message_recorder import OrderBookMessageRecorder, read_order_book_messages
+
+
+class OrderBookMessageRecorderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "messages.bin")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def messages():
+        return [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 1,
+                "bids": [["10", "1"], ["9", "2"]],
+                "asks": [["11", "1.5"]],
+            }, timestamp=1000.5),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 3,
+                "first_update_id": 2,
+                "bids": [["10", "0"]],
+                "asks": [],
+                "checksum": -123,
+            }, timestamp=1001),
+            OrderBookDiffMessage("BTC-USDT", 7, [[100, 1]], [[101, 2], [102, 0]], timestamp=1002, first_update_id=5),
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": "COINALPHA-HBOT",
+                "trade_type": float(TradeType.SELL.value),
+                "trade_id": "trade-1",
+                "update_id": 4,
+                "price": "9.5",
+                "amount": "0.5",
+            }, timestamp=1003),
+        ]
+
+    def assert_same_messages(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for expected_message, message in zip(expected, actual):
+            self.assertEqual(expected_message.type, message.type)
+            self.assertEqual(expected_message.trading_pair, message.trading_pair)
+            self.assertEqual(expected_message.timestamp, message.timestamp)
+            self.assertEqual(expected_message.update_id, message.update_id)
+            self.assertEqual(expected_message.first_update_id, message.first_update_id)
+            if expected_message.type is not OrderBookMessageType.TRADE:
+                self.assertEqual(expected_message.bids, message.bids)
+                self.assertEqual(expected_message.asks, message.asks)
+
+    def test_record_and_read_messages(self):
+        with OrderBookMessageRecorder(self.path, chunk_size=3) as recorder:
+            for message in self.messages():
+                recorder.record(message)
+            self.assertEqual(4, recorder.recorded_messages)
+
+        messages = list(read_order_book_messages(self.path))
+        self.assert_same_messages(self.messages(), messages)
+        self.assertIsInstance(messages[1], OrderBookDiffMessage)
+        self.assertEqual(-123, messages[1].checksum)
+        self.assertIsNone(messages[2].checksum)
+        self.assertEqual({
+            "trading_pair": "COINALPHA-HBOT",
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": "trade-1",
+            "update_id": 4,
+            "price": 9.5,
+            "amount": 0.5,
+        }, messages[3].content)
+
+    def test_record_float_update_ids(self):
+        messages = [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 1640000000.123,
+                "bids": [["10", "1"]],
+                "asks": [["11", "1.5"]],
+            }, timestamp=1640000000.123),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 1640000001.456,
+                "bids": [["10", "0"]],
+                "asks": [],
+            }, timestamp=1640000001.456),
+        ]
+        with OrderBookMessageRecorder(self.path) as recorder:
+            for message in messages:
+                recorder.record(message)
+
+        recorded_messages = list(read_order_book_messages(self.path))
+        self.assert_same_messages(messages, recorded_messages)
+        self.assertIsInstance(recorded_messages[0].update_id, float)
+        self.assertIsInstance(recorded_messages[1].first_update_id, float)
+
+    def test_record_invalid_message_leaves_no_partial_row(self):
+        invalid_message = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 3,
+            "bids": [["10", "0"]],
+            "asks": [],
+            "checksum": "not a number",
+        }, timestamp=1001)
+        with OrderBookMessageRecorder(self.path) as recorder:
+            recorder.record(self.messages()[0])
+            with self.assertRaises(Exception):
+                recorder.record(invalid_message)
+            for message in self.messages()[1:]:
+                recorder.record(message)
+            self.assertEqual(4, recorder.recorded_messages)
+
+        self.assert_same_messages(self.messages(), list(read_order_book_messages(self.path)))
+
+    def test_append_to_recording(self):
+        with OrderBookMessageRecorder(self.path) as recorder:
+            recorder.record(self.messages()[0])
+        with OrderBookMessageRecorder(self.path) as recorder:
+            for message in self.messages()[1:]:
+                recorder.record(message)
+
+        self.assert_same_messages(self.messages(), list(read_order_book_messages(self.path)))
+
+    def test_flush_writes_chunk_in_background(self):
+        recorder = OrderBookMessageRecorder(self.path)
+        self.assertIsNone(recorder.flush())
+        self.assertFalse(os.path.exists(self.path))
+
+        recorder.record(self.messages()[0])
+        recorder.flush().result()
+        self.assert_same_messages(self.messages()[:1], list(read_order_book_messages(self.path)))
+        recorder.close()
+
+    def test_record_after_close_reopens_file(self):
+        recorder = OrderBookMessageRecorder(self.path)
+        recorder.record(self.messages()[0])
+        recorder.close()
+        recorder.close()
+        for message in self.messages()[1:]:
+            recorder.record(message)
+        recorder.close()
+
+        self.assert_same_messages(self.messages(), list(read_order_book_messages(self.path)))
+
+    def test_get_instance_shares_recorder_per_file(self):
+        recorder = OrderBookMessageRecorder.get_instance(self.path)
+        other_recorder = OrderBookMessageRecorder.get_instance(os.path.join(self.temp_dir.name, ".", "messages.bin"))
+        self.assertIs(recorder, other_recorder)
+        self.assertIsNot(recorder, OrderBookMessageRecorder.get_instance(f"{self.path}.other"))
+
+        recorder.record(self.messages()[0])
+        other_recorder.record(self.messages()[1])
+        recorder.close()
+
+        self.assert_same_messages(self.messages()[:2], list(read_order_book_messages(self.path)))
+
+    def test_read_ignores_incomplete_chunk(self):
+        with OrderBookMessageRecorder(self.path, chunk_size=1) as recorder:
+            for message in self.messages()[:2]:
+                recorder.record(message)
+        with open(self.path, "r+b") as recording:
+            recording.truncate(os.path.getsize(self.path) - 1)
+
+        self.assert_same_messages(self.messages()[:1], list(read_order_book_messages(self.path)))
+
+    def test_read_invalid_file(self):
+        with open(self.path, "wb") as recording:
+            recording.write(b"not a recording")
+
+        with self.assertRaises(ValueError):
+            list(read_order_book_messages(self.path))
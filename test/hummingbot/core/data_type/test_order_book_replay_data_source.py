@@ -0,0 +1,152 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Awaitable, Dict, List, Optional
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookDiffMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_message_recorder import OrderBookMessageRecorder
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from test.hummingbot.core.data_type.test_order_book_tracker import MockOrderBookTrackerDataSource
+
+
+class LiveDataSource(MockOrderBookTrackerDataSource):
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: float("NaN") for trading_pair in trading_pairs}
+
+    async def listen_for_subscriptions(self):
+        await asyncio.Event().wait()
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+
+class OrderBookReplayDataSourceTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "messages.bin")
+        self.trackers: List[OrderBookTracker] = []
+
+    def tearDown(self) -> None:
+        for tracker in self.trackers:
+            tracker.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def start_tracker(self, data_source, **kwargs) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=data_source,
+                                   trading_pairs=[self.trading_pair],
+                                   throttler=AsyncThrottler(rate_limits=[]),
+                                   **kwargs)
+        self.trackers.append(tracker)
+        tracker.start()
+        self.async_run_with_timeout(tracker._order_books_initialized.wait())
+        return tracker
+
+    async def wait_for_update_id(self, tracker: OrderBookTracker, update_id: int):
+        while tracker.order_books[self.trading_pair].last_diff_uid < update_id:
+            await asyncio.sleep(0.01)
+
+    def record_messages(self, *messages: OrderBookMessage):
+        with OrderBookMessageRecorder(self.path) as recorder:
+            for message in messages:
+                recorder.record(message)
+
+    def snapshot_message(self, update_id: int, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": [[10, 1], [9, 1]],
+            "asks": [[11, 1], [12, 1]],
+        }, timestamp=timestamp)
+
+    def test_replay_reproduces_recorded_order_book(self):
+        recorder = OrderBookMessageRecorder(self.path)
+        tracker = self.start_tracker(LiveDataSource(trading_pairs=[self.trading_pair]), recorder=recorder)
+        for update_id in range(2, 50):
+            tracker._order_book_diff_stream.put_nowait(OrderBookDiffMessage(
+                self.trading_pair, update_id,
+                bids=[[10 - update_id % 5, update_id % 3]],
+                asks=[[11 + update_id % 4, update_id % 2]],
+                timestamp=update_id))
+        tracker._order_book_trade_stream.put_nowait(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.BUY.value),
+            "trade_id": 1,
+            "update_id": 50,
+            "price": 11.5,
+            "amount": 1,
+        }, timestamp=50))
+        self.async_run_with_timeout(self.wait_for_update_id(tracker, 49))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        tracker.stop()
+        recorder.close()
+        bids, asks = tracker.order_books[self.trading_pair].to_numpy()
+
+        data_source = OrderBookReplayDataSource(self.path, [self.trading_pair], speed=None)
+        replay_tracker = self.start_tracker(data_source)
+        self.async_run_with_timeout(data_source.wait_for_replay_finished())
+        self.async_run_with_timeout(self.wait_for_update_id(replay_tracker, 49))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        replayed_order_book = replay_tracker.order_books[self.trading_pair]
+        replayed_bids, replayed_asks = replayed_order_book.to_numpy()
+        self.assertEqual(bids.tolist(), replayed_bids.tolist())
+        self.assertEqual(asks.tolist(), replayed_asks.tolist())
+        self.assertEqual(11.5, replayed_order_book.last_trade_price)
+        self.assertEqual(recorder.recorded_messages, data_source.replayed_messages)
+
+    def test_replay_at_recorded_pace(self):
+        self.record_messages(
+            self.snapshot_message(1, 1000),
+            OrderBookDiffMessage(self.trading_pair, 2, [[10, 2]], [], timestamp=1001),
+            OrderBookDiffMessage("BTC-USDT", 1, [[10, 2]], [], timestamp=1002),
+            OrderBookDiffMessage(self.trading_pair, 3, [[10, 3]], [], timestamp=1003))
+        data_source = OrderBookReplayDataSource(self.path, [self.trading_pair], speed=2)
+        delays = []
+
+        async def sleep(delay: float):
+            delays.append(delay)
+
+        self.async_run_with_timeout(data_source.get_new_order_book(self.trading_pair))
+        with patch.object(data_source, "_sleep", side_effect=sleep), patch.object(data_source, "_time", return_value=0):
+            self.async_run_with_timeout(data_source.listen_for_subscriptions())
+
+        self.assertEqual([0.5, 1.5], delays)
+        self.assertTrue(data_source.replay_finished)
+        self.assertEqual(3, data_source.replayed_messages)
+        self.assertEqual(2, data_source._message_queue["order_book_diff"].qsize())
+
+    def test_initial_order_book_from_first_recorded_snapshot(self):
+        self.record_messages(
+            OrderBookDiffMessage(self.trading_pair, 1, [[10, 2]], [], timestamp=999),
+            self.snapshot_message(5, 1000),
+            self.snapshot_message(8, 1001))
+        data_source = OrderBookReplayDataSource(self.path, [self.trading_pair, "BTC-USDT"])
+
+        order_book = self.async_run_with_timeout(data_source.get_new_order_book(self.trading_pair))
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual([[10, 1], [9, 1]], [[row.price, row.amount] for row in order_book.bid_entries()])
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(data_source.get_new_order_book("BTC-USDT"))
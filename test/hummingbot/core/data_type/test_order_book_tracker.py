@@ -0,0 +1,398 @@
+import asyncio
+import unittest
+import zlib
+from typing import Awaitable, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.snapshot_events: Dict[str, asyncio.Event] = {}
+        self.pending_snapshot_requests: int = 0
+        self.max_pending_snapshot_requests: int = 0
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        if trading_pair in self.snapshot_events:
+            self.pending_snapshot_requests += 1
+            self.max_pending_snapshot_requests = max(self.max_pending_snapshot_requests,
+                                                     self.pending_snapshot_requests)
+            await self.snapshot_events[trading_pair].wait()
+            self.pending_snapshot_requests -= 1
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": 1,
+            "bids": [["10", "1"], ["9", "1"], ["8", "1"]],
+            "asks": [["11", "1"], ["12", "1"], ["13", "1"]],
+        }, timestamp=1)
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=[self.trading_pair])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.order_book = OrderBook()
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracking_task: Optional[asyncio.Task] = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    @staticmethod
+    async def fast_sleep(delay: float):
+        pass
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def diff_message(self,
+                     update_id: int,
+                     bids: List[List[str]],
+                     asks: List[List[str]],
+                     checksum: Optional[int] = None) -> OrderBookMessage:
+        content = {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }
+        if checksum is not None:
+            content["checksum"] = checksum
+        return OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=float(update_id))
+
+    def snapshot_message(self, update_id: int, bids: List[List[str]], asks: List[List[str]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=float(update_id))
+
+    def run_tracking_until_queue_is_consumed(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+
+        async def wait_for_queue():
+            while not message_queue.empty():
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        self.async_run_with_timeout(wait_for_queue())
+
+    def test_track_single_book_applies_queued_diffs_in_batch(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "1"]], [["11", "1"]]))
+        message_queue.put_nowait(self.diff_message(2, [["10", "2"], ["9", "1"]], [["11", "0"], ["12", "3"]]))
+        message_queue.put_nowait(self.diff_message(3, [["9", "0"]], []))
+
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertEqual([(10, 2, 2)], list(self.order_book.bid_entries()))
+        self.assertEqual([(12, 3, 2)], list(self.order_book.ask_entries()))
+        self.assertEqual(3, self.order_book.last_diff_uid)
+        self.assertEqual(3, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+    def test_track_single_book_stops_diff_batch_at_snapshot(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "0"]], []))
+        message_queue.put_nowait(self.snapshot_message(5, [["8", "1"]], [["13", "1"]]))
+        message_queue.put_nowait(self.diff_message(6, [["8.5", "2"]], []))
+
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertEqual([(8.5, 2, 6), (8, 1, 5)], list(self.order_book.bid_entries()))
+        self.assertEqual([(13, 1, 5)], list(self.order_book.ask_entries()))
+        self.assertEqual(5, self.order_book.snapshot_uid)
+        self.assertEqual(6, self.order_book.last_diff_uid)
+
+    def test_track_single_book_coalesces_backed_up_diffs(self):
+        self.tracker.DIFF_COALESCING_QUEUE_THRESHOLD = 1
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "1"]], [["11", "1"]]))
+        message_queue.put_nowait(self.diff_message(2, [["10", "2"]], [["11", "0"]]))
+        message_queue.put_nowait(self.diff_message(3, [["10", "3"]], [["12", "1"]]))
+
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertEqual([(10, 3, 3)], list(self.order_book.bid_entries()))
+        self.assertEqual([(12, 1, 3)], list(self.order_book.ask_entries()))
+        self.assertEqual({self.trading_pair: 3}, self.tracker.coalesced_diff_messages)
+        self.assertEqual({self.trading_pair: 3}, self.tracker.collapsed_diff_levels)
+
+    def test_track_single_book_does_not_coalesce_below_threshold(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "1"]], [["11", "1"]]))
+        message_queue.put_nowait(self.diff_message(2, [["10", "2"]], [["11", "0"]]))
+
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertEqual([(10, 2, 2)], list(self.order_book.bid_entries()))
+        self.assertEqual({}, self.tracker.coalesced_diff_messages)
+        self.assertEqual({}, self.tracker.collapsed_diff_levels)
+
+    def test_past_diffs_window_adapts_to_message_rate(self):
+        self.tracker._resize_past_diffs_window(self.trading_pair, diffs_per_second=50)
+        self.assertEqual(50 * self.tracker.PAST_DIFF_WINDOW_DURATION,
+                         self.tracker._past_diffs_windows[self.trading_pair].capacity)
+
+        self.tracker._resize_past_diffs_window(self.trading_pair, diffs_per_second=0.1)
+        self.assertEqual(self.tracker.PAST_DIFF_WINDOW_SIZE,
+                         self.tracker._past_diffs_windows[self.trading_pair].capacity)
+
+        self.tracker._resize_past_diffs_window(self.trading_pair, diffs_per_second=1e9)
+        self.assertEqual(self.tracker.MAX_PAST_DIFF_WINDOW_SIZE,
+                         self.tracker._past_diffs_windows[self.trading_pair].capacity)
+
+    def test_track_single_book_grows_diff_window_when_snapshot_is_older(self):
+        self.tracker._past_diffs_windows[self.trading_pair].capacity = 1
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(2, [["10", "1"]], []))
+        message_queue.put_nowait(self.diff_message(3, [["10", "2"]], []))
+        message_queue.put_nowait(self.snapshot_message(1, [["9", "1"]], [["11", "1"]]))
+
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertEqual(2, self.tracker._past_diffs_windows[self.trading_pair].capacity)
+        self.assertEqual(2 * self.tracker.PAST_DIFF_WINDOW_DURATION,
+                         self.tracker._past_diffs_window_durations[self.trading_pair])
+        self.assertEqual([(10, 2, 3), (9, 1, 1)], list(self.order_book.bid_entries()))
+
+    def test_diff_router_routes_messages_when_recording_fails(self):
+        self.tracker.recorder = MagicMock()
+        self.tracker.recorder.record.side_effect = TypeError("integer argument expected, got float")
+        message = self.diff_message(2, [["10", "2"]], [])
+        self.tracker._order_book_diff_stream.put_nowait(message)
+        router_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+
+        try:
+            routed_message = self.async_run_with_timeout(
+                self.tracker._tracking_message_queues[self.trading_pair].get())
+        finally:
+            router_task.cancel()
+
+        self.assertIs(message, routed_message)
+        self.tracker.recorder.record.assert_called_once_with(message)
+
+    def test_stop_closes_recorder(self):
+        self.tracker.recorder = MagicMock()
+
+        self.tracker.stop()
+
+        self.tracker.recorder.close.assert_called_once()
+
+    def test_validate_order_book_with_checksum(self):
+        message = self.snapshot_message(1, [["10", "1"]], [["11", "2"]])
+        self.order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        checksum = zlib.crc32(b"10.0:1.0:11.0:2.0")
+
+        self.assertTrue(self.data_source.validate_order_book(self.order_book, self.diff_message(2, [], [], 1234)))
+
+        self.data_source.ORDER_BOOK_CHECKSUM_DEPTH = 1
+        self.assertTrue(self.data_source.validate_order_book(self.order_book, self.diff_message(2, [], [], checksum)))
+        self.assertTrue(self.data_source.validate_order_book(
+            self.order_book, self.diff_message(2, [], [], checksum - 2 ** 32)))
+        self.assertTrue(self.data_source.validate_order_book(self.order_book, self.diff_message(2, [], [])))
+        self.assertFalse(self.data_source.validate_order_book(
+            self.order_book, self.diff_message(2, [], [], checksum + 1)))
+
+    def test_track_single_book_resyncs_on_checksum_mismatch(self):
+        self.data_source.ORDER_BOOK_CHECKSUM_DEPTH = 1
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "1"]], [["11", "1"]],
+                                                   zlib.crc32(b"10.0:1.0:11.0:1.0")))
+
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertEqual({}, self.tracker.checksum_mismatches)
+        self.assertTrue(self.tracker._order_book_snapshot_stream.empty())
+
+        message_queue.put_nowait(self.diff_message(2, [["10", "2"]], [], 1234))
+        self.run_tracking_until_queue_is_consumed()
+        self.async_run_with_timeout(self.tracker._order_book_resync_tasks[self.trading_pair])
+
+        # The book is not validated again until the requested snapshot is applied
+        message_queue.put_nowait(self.diff_message(3, [["10", "3"]], [], 1234))
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertEqual({self.trading_pair: 1}, self.tracker.checksum_mismatches)
+        self.assertEqual(1, self.tracker._order_book_snapshot_stream.qsize())
+        resync_snapshot: OrderBookMessage = self.tracker._order_book_snapshot_stream.get_nowait()
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, resync_snapshot.type)
+
+        message_queue.put_nowait(resync_snapshot)
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertNotIn(self.trading_pair, self.tracker._order_book_resync_tasks)
+        self.assertEqual([(10, 3, 3), (9, 1, 1), (8, 1, 1)], list(self.order_book.bid_entries()))
+
+    def test_track_single_book_resyncs_after_failed_snapshot_restore(self):
+        self.data_source.ORDER_BOOK_CHECKSUM_DEPTH = 1
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "1"]], [["11", "1"]], 1234))
+
+        self.run_tracking_until_queue_is_consumed()
+        self.async_run_with_timeout(self.tracker._order_book_resync_tasks[self.trading_pair])
+        self.tracker._order_book_snapshot_stream.get_nowait()
+
+        # The snapshot can not be restored, the tracking loop logs the error and waits before retrying
+        message_queue.put_nowait(self.snapshot_message(2, [["invalid", "1"]], []))
+        self.run_tracking_until_queue_is_consumed()
+        self.tracking_task.cancel()
+
+        self.assertNotIn(self.trading_pair, self.tracker._order_book_resync_tasks)
+
+        message_queue.put_nowait(self.diff_message(3, [["10", "3"]], [], 1234))
+        self.run_tracking_until_queue_is_consumed()
+        self.async_run_with_timeout(self.tracker._order_book_resync_tasks[self.trading_pair])
+
+        self.assertEqual({self.trading_pair: 2}, self.tracker.checksum_mismatches)
+        self.assertEqual(1, self.tracker._order_book_snapshot_stream.qsize())
+
+    def test_track_single_book_resyncs_stale_depth_limited_book(self):
+        self.order_book.max_depth = 1
+        message = self.snapshot_message(1, [["10", "1"], ["9", "1"], ["8", "1"]], [["11", "1"]])
+        self.order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(2, [["10", "0"]], []))
+
+        self.run_tracking_until_queue_is_consumed()
+        self.assertNotIn(self.trading_pair, self.tracker._order_book_resync_tasks)
+
+        # The level at 8 was dropped by the depth limit, so the book can't refill its bids without a snapshot
+        message_queue.put_nowait(self.diff_message(3, [["9", "0"]], []))
+        self.run_tracking_until_queue_is_consumed()
+        self.async_run_with_timeout(self.tracker._order_book_resync_tasks[self.trading_pair])
+
+        self.assertEqual({}, self.tracker.checksum_mismatches)
+        self.assertEqual(1, self.tracker._order_book_snapshot_stream.qsize())
+
+        message_queue.put_nowait(self.snapshot_message(4, [["8.5", "1"], ["8", "1"]], [["11", "1"]]))
+        self.run_tracking_until_queue_is_consumed()
+
+        self.assertNotIn(self.trading_pair, self.tracker._order_book_resync_tasks)
+        self.assertFalse(self.order_book.stale)
+        self.assertEqual([8.5], [row.price for row in self.order_book.bid_entries()])
+
+    def test_checksum_validated_books_are_not_polled(self):
+        self.data_source.ORDER_BOOK_CHECKSUM_DEPTH = 1
+        output = asyncio.Queue()
+
+        self.async_run_with_timeout(self.data_source.listen_for_order_book_snapshots(self.ev_loop, output))
+
+        self.assertTrue(output.empty())
+
+    def test_books_capped_below_checksum_depth_are_not_validated(self):
+        self.data_source.ORDER_BOOK_CHECKSUM_DEPTH = 3
+        self.assertTrue(self.data_source.validates_order_books)
+        self.assertFalse(self.data_source.validate_order_book(self.order_book, self.diff_message(2, [], [], 1234)))
+
+        self.tracker.order_book_max_depth = 2
+        self.assertEqual(2, self.data_source.order_book_max_depth)
+        self.assertFalse(self.data_source.validates_order_books)
+        self.assertTrue(self.data_source.validate_order_book(self.order_book, self.diff_message(2, [], [], 1234)))
+
+        # The capped books are refreshed with the periodic snapshots instead
+        output = asyncio.Queue()
+        with patch.object(self.data_source, "_sleep", side_effect=asyncio.CancelledError):
+            with self.assertRaises(asyncio.CancelledError):
+                self.async_run_with_timeout(self.data_source.listen_for_order_book_snapshots(self.ev_loop, output))
+        self.assertEqual(1, output.qsize())
+
+        OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair], order_book_max_depth=3)
+        self.assertTrue(self.data_source.validates_order_books)
+
+    def test_init_order_books_applies_max_depth(self):
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=[self.trading_pair], order_book_max_depth=2)
+
+        with patch("asyncio.sleep", new=self.fast_sleep):
+            self.async_run_with_timeout(self.tracker._init_order_books())
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(2, order_book.max_depth)
+        self.assertEqual([10, 9], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([11, 12], [row.price for row in order_book.ask_entries()])
+
+        self.tracker.order_book_max_depth = 1
+        self.assertEqual([10], [row.price for row in order_book.bid_entries()])
+
+    def test_init_order_books_concurrently_with_throttler(self):
+        trading_pairs = ["COINALPHA-HBOT", "BTC-USDT", "ETH-USDT"]
+        self.data_source.snapshot_events = {trading_pair: asyncio.Event() for trading_pair in trading_pairs}
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=trading_pairs, throttler=AsyncThrottler(rate_limits=[]))
+        self.tracker.MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS = 2
+
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertEqual(2, self.data_source.pending_snapshot_requests)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+        # Each order book is ready as soon as its snapshot is received
+        self.data_source.snapshot_events["BTC-USDT"].set()
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertTrue(self.tracker.is_order_book_ready("BTC-USDT"))
+        self.assertFalse(self.tracker.is_order_book_ready("COINALPHA-HBOT"))
+        self.assertEqual(["BTC-USDT"], self.tracker.ready_trading_pairs)
+        self.assertFalse(self.tracker.ready)
+
+        for event in self.data_source.snapshot_events.values():
+            event.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(set(trading_pairs), set(self.tracker.ready_trading_pairs))
+        self.assertEqual(2, self.data_source.max_pending_snapshot_requests)
+        for task in self.tracker._tracking_tasks.values():
+            task.cancel()
+
+    def test_messages_of_ready_order_books_are_routed_before_all_books_are_initialized(self):
+        self.assertFalse(self.tracker.ready)
+        self.tracker._order_book_trade_stream.put_nowait(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": 1.0,
+            "trade_id": 1,
+            "update_id": 1,
+            "price": "10.5",
+            "amount": "2",
+        }, timestamp=1))
+        self.tracker._order_book_snapshot_stream.put_nowait(self.snapshot_message(2, [["10", "1"]], [["11", "1"]]))
+        self.tracker._order_book_snapshot_stream.put_nowait(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "BTC-USDT",
+            "update_id": 2,
+            "bids": [],
+            "asks": [],
+        }, timestamp=2))
+
+        trade_task = self.ev_loop.create_task(self.tracker._emit_trade_event_loop())
+        snapshot_task = self.ev_loop.create_task(self.tracker._order_book_snapshot_router())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        trade_task.cancel()
+        snapshot_task.cancel()
+
+        self.assertEqual(10.5, self.order_book.last_trade_price)
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        self.assertEqual(1, message_queue.qsize())
+        self.assertEqual(2, message_queue.get_nowait().update_id)
+        self.assertTrue(self.tracker._order_book_snapshot_stream.empty())
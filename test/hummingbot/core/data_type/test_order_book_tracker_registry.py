@@ -0,0 +1,147 @@
+import unittest
+from typing import List
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_registry import OrderBookTrackerRegistry, SharedOrderBookTracker
+from test.hummingbot.core.data_type.test_order_book_tracker import MockOrderBookTrackerDataSource
+
+
+class OrderBookTrackerRegistryTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = OrderBookTrackerRegistry(connector_factory=self.connector_factory)
+        self.created_trackers: List[OrderBookTracker] = []
+        self.created_connectors: List[str] = []
+
+    def connector_factory(self, exchange: str) -> MagicMock:
+        connector = MagicMock()
+        connector.create_order_book_tracker.side_effect = self.tracker_factory
+        self.created_connectors.append(exchange)
+        return connector
+
+    def tracker_factory(self, trading_pairs: List[str]) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=MockOrderBookTrackerDataSource(trading_pairs=trading_pairs),
+                                   trading_pairs=trading_pairs)
+        tracker.start = MagicMock()
+        tracker.stop = MagicMock()
+        for trading_pair in trading_pairs:
+            tracker._order_books[trading_pair] = OrderBook()
+        self.created_trackers.append(tracker)
+        return tracker
+
+    def shared_tracker(self, trading_pairs: List[str], exchange: str = "binance") -> SharedOrderBookTracker:
+        return SharedOrderBookTracker(exchange=exchange,
+                                      data_source=MockOrderBookTrackerDataSource(trading_pairs=trading_pairs),
+                                      trading_pairs=trading_pairs,
+                                      domain="com",
+                                      registry=self.registry)
+
+    def test_get_instance_returns_process_wide_registry(self):
+        self.assertIs(OrderBookTrackerRegistry.get_instance(), OrderBookTrackerRegistry.get_instance())
+
+    def test_acquire_shares_tracked_order_books(self):
+        trackers = self.registry.acquire("binance", "com", ["BTC-USDT", "ETH-USDT"])
+        self.assertEqual(1, len(self.created_trackers))
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], self.created_trackers[0].data_source.trading_pairs)
+        self.created_trackers[0].start.assert_called_once()
+
+        other_trackers = self.registry.acquire("binance", "com", ["ETH-USDT", "SOL-USDT"])
+        self.assertEqual(2, len(self.created_trackers))
+        self.assertEqual(["SOL-USDT"], self.created_trackers[1].data_source.trading_pairs)
+        self.assertIs(trackers["ETH-USDT"], other_trackers["ETH-USDT"])
+        self.assertEqual(2, self.registry.reference_count("binance", "com", "ETH-USDT"))
+        self.assertEqual(1, self.registry.reference_count("binance", "com", "BTC-USDT"))
+
+        # Other domains and exchanges don't share the order books
+        self.registry.acquire("binance", "us", ["ETH-USDT"])
+        self.registry.acquire("kucoin", "com", ["ETH-USDT"])
+        self.assertEqual(4, len(self.created_trackers))
+
+    def test_release_stops_tracker_without_references(self):
+        self.registry.acquire("binance", "com", ["BTC-USDT", "ETH-USDT"])
+        self.registry.acquire("binance", "com", ["ETH-USDT"])
+        tracker = self.created_trackers[0]
+
+        self.registry.release("binance", "com", ["BTC-USDT", "ETH-USDT"])
+        tracker.stop.assert_not_called()
+        self.assertEqual(0, self.registry.reference_count("binance", "com", "BTC-USDT"))
+        self.assertIs(tracker, self.registry.get_tracker("binance", "com", "BTC-USDT"))
+
+        self.registry.release("binance", "com", ["ETH-USDT"])
+        tracker.stop.assert_called_once()
+        self.assertIsNone(self.registry.get_tracker("binance", "com", "ETH-USDT"))
+
+        # Releasing order books without references does nothing
+        self.registry.release("binance", "com", ["ETH-USDT"])
+        tracker.stop.assert_called_once()
+
+        self.registry.acquire("binance", "com", ["ETH-USDT"])
+        self.assertEqual(2, len(self.created_trackers))
+
+    def test_shared_tracker_lifecycle(self):
+        shared_tracker = self.shared_tracker(["BTC-USDT", "ETH-USDT"])
+        other_shared_tracker = self.shared_tracker(["ETH-USDT"])
+        self.assertEqual({}, shared_tracker.order_books)
+        self.assertFalse(shared_tracker.ready)
+
+        shared_tracker.start()
+        other_shared_tracker.start()
+        self.assertEqual(1, len(self.created_trackers))
+        tracker = self.created_trackers[0]
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], list(shared_tracker.order_books.keys()))
+        self.assertEqual(["ETH-USDT"], list(other_shared_tracker.order_books.keys()))
+        self.assertIs(shared_tracker.order_books["ETH-USDT"], other_shared_tracker.order_books["ETH-USDT"])
+        self.assertFalse(shared_tracker.ready)
+        tracker._order_books_initialized.set()
+        self.assertTrue(shared_tracker.ready)
+        self.assertTrue(other_shared_tracker.is_order_book_ready("ETH-USDT"))
+
+        # Restarting the tracker doesn't leak references
+        shared_tracker.start()
+        self.assertEqual(2, self.registry.reference_count("binance", "com", "ETH-USDT"))
+
+        shared_tracker.stop()
+        shared_tracker.stop()
+        self.assertEqual({}, shared_tracker.order_books)
+        self.assertEqual(1, self.registry.reference_count("binance", "com", "ETH-USDT"))
+        tracker.stop.assert_not_called()
+        other_shared_tracker.stop()
+        tracker.stop.assert_called_once()
+
+    def test_shared_tracker_order_books_are_cached(self):
+        shared_tracker = self.shared_tracker(["BTC-USDT", "ETH-USDT"])
+        shared_tracker.start()
+        tracker = self.created_trackers[0]
+        order_book = tracker._order_books.pop("ETH-USDT")
+
+        order_books = shared_tracker.order_books
+        self.assertEqual(["BTC-USDT"], list(order_books.keys()))
+        self.assertFalse(shared_tracker.is_order_book_ready("ETH-USDT"))
+
+        # Order books initialized later are added to the same mapping
+        tracker._order_books["ETH-USDT"] = order_book
+        self.assertIs(order_books, shared_tracker.order_books)
+        self.assertIs(order_book, order_books["ETH-USDT"])
+        self.assertTrue(shared_tracker.is_order_book_ready("ETH-USDT"))
+
+    def test_feed_connector_is_shared_by_exchange_trackers(self):
+        self.registry.acquire("binance", "com", ["BTC-USDT"])
+        connector = self.registry.feed_connector("binance", "com")
+        self.registry.acquire("binance", "com", ["ETH-USDT"])
+        self.registry.acquire("binance_us", "us", ["ETH-USDT"])
+        self.assertEqual(["binance", "binance_us"], self.created_connectors)
+        self.assertIs(connector, self.registry.feed_connector("binance", "com"))
+        self.assertEqual(2, connector.create_order_book_tracker.call_count)
+
+        # The feed connector is dropped with the last order book of the exchange
+        self.registry.release("binance", "com", ["BTC-USDT"])
+        self.assertIs(connector, self.registry.feed_connector("binance", "com"))
+        self.registry.release("binance", "com", ["ETH-USDT"])
+        self.assertIsNone(self.registry.feed_connector("binance", "com"))
+        self.assertIsNotNone(self.registry.feed_connector("binance_us", "us"))
+
+        self.registry.acquire("binance", "com", ["ETH-USDT"])
+        self.assertEqual(["binance", "binance_us", "binance"], self.created_connectors)
@@ -0,0 +1,87 @@
+import math
+import unittest
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_trade_flow import OrderBookTradeFlow
+
+
+class OrderBookTradeFlowTest(unittest.TestCase):
+
+    def test_rolling_windows(self):
+        trade_flow = OrderBookTradeFlow(durations=[5, 60])
+        trade_flow.add_trade(1000, 10, 1, TradeType.BUY)
+        trade_flow.add_trade(1002, 12, 2, TradeType.SELL)
+        trade_flow.add_trade(1006, 11, 3, TradeType.BUY)
+
+        stats = trade_flow.stats(5)
+        self.assertEqual(2, stats.trade_count)
+        self.assertEqual(3, stats.buy_volume)
+        self.assertEqual(2, stats.sell_volume)
+        self.assertEqual(33, stats.buy_quote_volume)
+        self.assertEqual(24, stats.sell_quote_volume)
+        self.assertAlmostEqual(57 / 5, stats.vwap)
+        self.assertAlmostEqual(1 / 5, stats.imbalance)
+
+        stats = trade_flow.stats(60)
+        self.assertEqual(3, stats.trade_count)
+        self.assertEqual(4, stats.buy_volume)
+        self.assertEqual(43, stats.buy_quote_volume)
+        self.assertEqual(3, len(trade_flow))
+
+        # A trade leaves a window once it is exactly `duration` seconds old
+        stats = trade_flow.stats(5, timestamp=1007)
+        self.assertEqual(1, stats.trade_count)
+        self.assertEqual(0, stats.sell_volume)
+        self.assertEqual(1007, trade_flow.last_timestamp)
+
+    def test_expired_windows_are_empty(self):
+        trade_flow = OrderBookTradeFlow(durations=[1])
+        trade_flow.add_trade(1000, 0.1, 0.3, TradeType.BUY)
+        trade_flow.add_trade(1000, 0.7, 0.9, TradeType.BUY)
+        trade_flow.expire(1001)
+
+        stats = trade_flow.stats(1)
+        self.assertEqual(0, stats.trade_count)
+        self.assertEqual(0, stats.buy_volume)
+        self.assertEqual(0, stats.buy_quote_volume)
+        self.assertTrue(math.isnan(stats.vwap))
+        self.assertEqual(0, stats.imbalance)
+        self.assertEqual(0, len(trade_flow))
+
+    def test_recent_trades_history(self):
+        trade_flow = OrderBookTradeFlow(durations=[1], history_size=3)
+        for index in range(5):
+            trade_flow.add_trade(1000 + index * 10, 10 + index, 1, TradeType.BUY if index % 2 else TradeType.SELL)
+
+        self.assertEqual(3, len(trade_flow))
+        self.assertEqual([[1020, 12, 1, 0], [1030, 13, 1, 1], [1040, 14, 1, 0]],
+                         trade_flow.recent_trades().tolist())
+        self.assertEqual([[1040, 14, 1, 0]], trade_flow.recent_trades(1).tolist())
+        self.assertEqual(1, trade_flow.stats(1).trade_count)
+
+        trade_flow.history_size = 1
+        self.assertEqual(1, len(trade_flow))
+        trade_flow.clear()
+        self.assertEqual(0, len(trade_flow))
+        self.assertEqual(0, trade_flow.stats(1).trade_count)
+
+    def test_configure_windows(self):
+        trade_flow = OrderBookTradeFlow()
+        trade_flow.add_trade(1000, 10, 1, TradeType.BUY)
+        self.assertEqual(0, len(trade_flow))
+
+        trade_flow.add_window(10)
+        trade_flow.add_window(10)
+        trade_flow.add_window(30)
+        self.assertEqual([10, 30], trade_flow.durations)
+        # Windows only aggregate the trades added after them
+        self.assertEqual(0, trade_flow.stats(10).trade_count)
+        trade_flow.add_trade(1001, 10, 1, TradeType.BUY)
+        self.assertEqual(1, trade_flow.stats(30).trade_count)
+
+        trade_flow.remove_window(10)
+        self.assertEqual([30], trade_flow.durations)
+        with self.assertRaises(ValueError):
+            trade_flow.stats(10)
+        with self.assertRaises(ValueError):
+            trade_flow.add_window(0)
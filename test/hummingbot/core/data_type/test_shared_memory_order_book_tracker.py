@@ -0,0 +1,200 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.shared_memory_order_book_tracker import (
+    SharedMemoryOrderBookTracker,
+    SharedOrderBookLevels,
+    publish_order_books,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from test.hummingbot.core.data_type.test_order_book_tracker import MockOrderBookTrackerDataSource
+
+
+class FeedDataSource(MockOrderBookTrackerDataSource):
+
+    async def listen_for_subscriptions(self):
+        await asyncio.Event().wait()
+
+
+def feed_tracker_factory(trading_pairs: List[str]) -> OrderBookTracker:
+    return OrderBookTracker(data_source=FeedDataSource(trading_pairs=trading_pairs), trading_pairs=trading_pairs)
+
+
+def levels(rows) -> List[List[float]]:
+    return [[row.price, row.amount] for row in rows]
+
+
+class SharedMemoryOrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "BTC-USDT"]
+        self.levels = SharedOrderBookLevels(self.trading_pairs, depth=2)
+
+    def tearDown(self) -> None:
+        self.levels.close()
+        self.levels.unlink()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_write_and_read_levels(self):
+        reader_levels = SharedOrderBookLevels(self.trading_pairs, depth=2, name=self.levels.name)
+        order_book = OrderBook()
+        self.assertEqual(0, reader_levels.sequence(1))
+
+        self.levels.write(1,
+                          np.array([[10, 1, 5], [9, 2, 4], [8, 3, 3]], dtype=np.float64),
+                          np.array([[11, 1, 6]], dtype=np.float64),
+                          timestamp=1, last_trade_price=10.5)
+        self.assertEqual(2, reader_levels.read(1, order_book))
+        self.assertEqual(2, reader_levels.sequence(1))
+        self.assertEqual(0, reader_levels.sequence(0))
+        self.assertEqual([[10, 1], [9, 2]], levels(order_book.bid_entries()))
+        self.assertEqual([[11, 1]], levels(order_book.ask_entries()))
+        self.assertEqual(6, order_book.snapshot_uid)
+        self.assertEqual(10.5, order_book.last_trade_price)
+
+        self.levels.write(1, np.empty((0, 3)), np.array([[12, 2, 7]], dtype=np.float64),
+                          timestamp=2, last_trade_price=11)
+        self.assertEqual(4, reader_levels.read(1, order_book))
+        self.assertEqual([], levels(order_book.bid_entries()))
+        self.assertEqual([[12, 2]], levels(order_book.ask_entries()))
+        reader_levels.close()
+
+    def test_read_skips_levels_being_written(self):
+        order_book = OrderBook()
+        self.levels.write(0, np.array([[10, 1, 1]], dtype=np.float64), np.empty((0, 3)), 1, 0)
+        self.levels._headers[0, 0] += 1
+
+        self.assertIsNone(self.levels.read(0, order_book))
+        self.assertEqual([], levels(order_book.bid_entries()))
+
+    def test_write_and_read_trades(self):
+        levels = SharedOrderBookLevels(self.trading_pairs, depth=2, trades_size=3)
+        try:
+            levels.write_trade(1, 100, 10.5, 1, TradeType.BUY)
+            levels.write_trade(1, 101, 10.6, 2, TradeType.SELL)
+            self.assertEqual(2, levels.trades_count(1))
+            self.assertEqual(0, levels.trades_count(0))
+
+            trades, start = levels.read_trades(1, 0)
+            self.assertEqual(0, start)
+            self.assertEqual([[100, 10.5, 1, TradeType.BUY.value], [101, 10.6, 2, TradeType.SELL.value]],
+                             trades.tolist())
+
+            for timestamp in range(102, 105):
+                levels.write_trade(1, timestamp, 11, 1, TradeType.BUY)
+            # The first two trades were overwritten
+            trades, start = levels.read_trades(1, 1)
+            self.assertEqual(2, start)
+            self.assertEqual([102, 103, 104], trades[:, 0].tolist())
+            trades, start = levels.read_trades(1, 5)
+            self.assertEqual((0, 4), trades.shape)
+        finally:
+            levels.close()
+            levels.unlink()
+
+    def test_publish_order_books_when_they_change(self):
+        tracker = feed_tracker_factory(self.trading_pairs)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        tracker._order_books["COINALPHA-HBOT"] = order_book
+
+        publish_task = self.ev_loop.create_task(publish_order_books(self.levels, tracker, publish_interval=0.001))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertEqual(2, self.levels.sequence(0))
+        self.assertEqual(0, self.levels.sequence(1))
+
+        order_book.apply_numpy_diffs(np.array([[10, 2, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        publish_task.cancel()
+        self.assertEqual(4, self.levels.sequence(0))
+
+        published_order_book = OrderBook()
+        self.levels.read(0, published_order_book)
+        self.assertEqual([[10, 2]], levels(published_order_book.bid_entries()))
+
+    def test_publish_trades_when_they_are_applied(self):
+        tracker = feed_tracker_factory(self.trading_pairs)
+        order_book = OrderBook()
+        tracker._order_books["BTC-USDT"] = order_book
+
+        publish_task = self.ev_loop.create_task(publish_order_books(self.levels, tracker, publish_interval=0.001))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        order_book.apply_trade(OrderBookTradeEvent("BTC-USDT", 100, TradeType.SELL, 10.5, 2))
+        publish_task.cancel()
+
+        self.assertEqual(1, self.levels.trades_count(1))
+        trades, _ = self.levels.read_trades(1, 0)
+        self.assertEqual([[100, 10.5, 2, TradeType.SELL.value]], trades.tolist())
+
+    def test_read_order_books_applies_published_trades(self):
+        data_source = MockOrderBookTrackerDataSource(trading_pairs=self.trading_pairs)
+        tracker = SharedMemoryOrderBookTracker(data_source=data_source,
+                                               trading_pairs=self.trading_pairs,
+                                               tracker_factory=feed_tracker_factory,
+                                               depth=2)
+        tracker._levels = self.levels
+        self.levels.write(0, np.array([[10, 1, 1]], dtype=np.float64), np.empty((0, 3)), 1, 0)
+        self.levels.write_trade(0, 100, 10.5, 1, TradeType.BUY)
+        self.levels.write_trade(1, 100, 20, 1, TradeType.BUY)
+
+        tracker.read_order_books()
+        order_book = tracker.order_books["COINALPHA-HBOT"]
+        trade_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        self.assertEqual(10.5, order_book.last_trade_price)
+        # The trades of order books not published yet are applied once they are
+        self.assertNotIn("BTC-USDT", tracker.order_books)
+
+        self.levels.write_trade(0, 101, 10.6, 2, TradeType.SELL)
+        tracker.read_order_books()
+        tracker.read_order_books()
+        self.assertEqual(1, len(trade_logger.event_log))
+        trade = trade_logger.event_log[0]
+        self.assertEqual(("COINALPHA-HBOT", 101, TradeType.SELL, 10.6, 2),
+                         (trade.trading_pair, trade.timestamp, trade.type, trade.price, trade.amount))
+        self.assertEqual(10.6, order_book.last_trade_price)
+
+    def test_track_order_books_in_feed_process(self):
+        data_source = MockOrderBookTrackerDataSource(trading_pairs=self.trading_pairs)
+        tracker = SharedMemoryOrderBookTracker(data_source=data_source,
+                                               trading_pairs=self.trading_pairs,
+                                               tracker_factory=feed_tracker_factory,
+                                               depth=2)
+        tracker.start()
+        feed_process = tracker.feed_process
+        try:
+            async def wait_until_ready():
+                while not tracker.ready:
+                    await asyncio.sleep(0.01)
+            self.async_run_with_timeout(wait_until_ready(), timeout=60)
+        finally:
+            tracker.stop()
+
+        self.assertEqual(self.trading_pairs, list(tracker.order_books.keys()))
+        order_book = tracker.order_books["BTC-USDT"]
+        self.assertEqual([[10, 1], [9, 1]], levels(order_book.bid_entries()))
+        self.assertEqual([[11, 1], [12, 1]], levels(order_book.ask_entries()))
+        self.assertIsNone(tracker.feed_process)
+        start = time.time()
+        while feed_process.is_alive() and time.time() - start < 5:
+            time.sleep(0.01)
+        self.assertFalse(feed_process.is_alive())
@@ -8,6 +8,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -100,3 +101,22 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_rest_assistant_records_rate_limit_rejections(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, status=429, body=json.dumps({"msg": "Too many requests"}).encode())
+        mocked_api.get(url, status=400, body=json.dumps({"msg": "Bad request"}).encode())
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=url, limit=10, time_interval=1)])
+
+        async def execute_requests():
+            async with aiohttp.ClientSession() as client_session:
+                assistant = RESTAssistant(connection=RESTConnection(client_session), throttler=throttler)
+                await assistant.execute_request(url=url, throttler_limit_id=url, return_err=True)
+                await assistant.execute_request(url=url, throttler_limit_id=url, return_err=True)
+
+        self.async_run_with_timeout(execute_requests())
+
+        usage, = throttler.limit_usage()
+        self.assertEqual(2, usage.executed_tasks)
+        self.assertEqual(1, usage.rejections)
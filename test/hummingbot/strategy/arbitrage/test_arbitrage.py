@@ -279,3 +279,17 @@ class ArbitrageUnitTest(unittest.TestCase):
             (Decimal("1.045"), Decimal("0.94999"), Decimal("1.1"), Decimal("0.94999"), Decimal("15.0")),
             (Decimal("1.045"), Decimal("1.0049"), Decimal("1.1"), Decimal("1.0049"), Decimal("10.0"))
         ])
+
+    def test_find_profitable_arbitrage_orders_through_deep_order_book(self):
+        # The bid crosses every ask level of market_1, beyond the first chunk of levels read from the order book
+        self.market_2.order_books[self.market_2_trading_pairs[0]].apply_diffs(
+            [OrderBookRow(2.0, 100000, 2)], [], 2)
+        ask_entries = list(self.market_trading_pair_tuple_1.order_book_ask_entries())
+        profitable_orders = ArbitrageStrategy.find_profitable_arbitrage_orders(Decimal("0"),
+                                                                               self.market_trading_pair_tuple_1,
+                                                                               self.market_trading_pair_tuple_2,
+                                                                               Decimal("1"),
+                                                                               Decimal("0.95"))
+        self.assertGreater(len(ask_entries), 16)
+        self.assertEqual([(entry.price, entry.amount) for entry in ask_entries],
+                         [(ask_price, amount) for _, _, _, ask_price, amount in profitable_orders])
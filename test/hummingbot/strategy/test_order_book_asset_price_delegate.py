@@ -0,0 +1,44 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
+
+
+class OrderBookAssetPriceDelegateTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.market = MockPaperExchange()
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=100, min_price=50,
+                                            max_price=150, price_step_size=1, volume_step_size=10)
+        self.delegate = OrderBookAssetPriceDelegate(self.market, self.trading_pair)
+
+    def test_mid_price_follows_top_of_book_changes(self):
+        self.assertEqual(Decimal("100"), self.delegate.get_mid_price())
+
+        order_book = self.market.get_order_book(self.trading_pair)
+        order_book.apply_diffs([OrderBookRow(100, 10, 2)], [], 2)
+        self.assertEqual(Decimal("100.25"), self.delegate.get_mid_price())
+
+        order_book.apply_diffs([OrderBookRow(98, 10, 3)], [], 3)
+        self.assertEqual(Decimal("100.25"), self.delegate.get_mid_price())
+
+    def test_mid_price_follows_recorded_fills(self):
+        self.assertEqual(Decimal("100"), self.delegate.get_mid_price())
+
+        self.market.get_order_book(self.trading_pair).record_filled_order(OrderFilledEvent(
+            timestamp=2, order_id="order", trading_pair=self.trading_pair, trade_type=TradeType.SELL,
+            order_type=None, price=99.5, amount=Decimal("10"), trade_fee=None))
+        self.assertEqual(Decimal("99.5"), self.delegate.get_mid_price())
+
+    def test_mid_price_follows_order_book_replacement(self):
+        self.assertEqual(Decimal("100"), self.delegate.get_mid_price())
+
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=200, min_price=150,
+                                            max_price=250, price_step_size=1, volume_step_size=10)
+        self.assertEqual(Decimal("200"), self.delegate.get_mid_price())